@@ -0,0 +1,42 @@
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks.cases import run_all
+from benchmarks.harness import find_regressions, load_baseline, save_baseline
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the hot path microbenchmarks and compare them to a baseline")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed ops/sec drop, 0.2 means 20%%")
+    parser.add_argument("--duration", type=float, default=1.0, help="seconds spent on each benchmark")
+    args = parser.parse_args()
+
+    results = run_all(args.duration)
+    for result in results:
+        sys.stdout.write(
+            f"{result.name:<40} {result.ops_per_sec:>14,.0f} ops/s"
+            f"  p50 {result.p50 * 1e6:8.2f}us  p90 {result.p90 * 1e6:8.2f}us  p99 {result.p99 * 1e6:8.2f}us\n"
+        )
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        return 0
+    if not args.baseline.exists():
+        sys.stdout.write(f"No baseline at {args.baseline}, run with --save to create one\n")
+        return 0
+    regressions = find_regressions(load_baseline(args.baseline), results, args.threshold)
+    for regression in regressions:
+        sys.stdout.write(
+            f"REGRESSION {regression.name}: {regression.ops_per_sec:,.0f} ops/s vs "
+            f"{regression.baseline_ops_per_sec:,.0f} ops/s baseline ({regression.slowdown:.0%} slower)\n"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from benchmarks.harness import BenchmarkResult, abench, bench
+from src.level_0 import calculator
+from src.level_1.session import Session as Level1Session
+from src.level_2.interface import ServerInterface as Level2Interface
+from src.level_2.session import Session as Level2Session
+from src.level_3.interface import ServerInterface as Level3Interface
+from src.level_3.session import Session as Level3Session
+from src.level_4.database import Database as Level4Database
+from src.level_4.session import Session as Level4Session
+from src.level_5.database import Database as Level5Database
+from src.level_5.interface import ConnectionCounter
+from src.level_5.session import Session as Level5Session
+from src.level_7.interface import ServerInterface as Level7Interface
+from src.level_7.session import Session as Level7Session
+from src.level_8.session import Session as Level8Session
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+MESSAGES = [f"message {i}" for i in range(100)]
+
+
+def database_get_cycle(database: type[Level4Database | Level5Database]) -> Callable[[], None]:
+    def cycle() -> None:
+        with database.get() as conn:
+            conn.begin()
+            conn.commit()
+
+    return cycle
+
+
+def run_all(duration: float) -> list[BenchmarkResult]:
+    level_7_session = Level7Session(Level7Interface())
+    return [
+        bench("calculator.add", lambda: calculator.add(2, 3), duration),
+        bench("calculator.subtract", lambda: calculator.subtract(5, 2), duration),
+        bench("calculator.multiply", lambda: calculator.multiply(2, 3), duration),
+        bench("calculator.divide", lambda: calculator.divide(6, 2), duration),
+        bench("level_1.Session.connect", Level1Session().connect, duration),
+        bench("level_2.Session.connect", Level2Session(Level2Interface()).connect, duration),
+        bench("level_3.Session.connect", Level3Session(Level3Interface()).connect, duration),
+        abench("level_3.Session.aconnect", Level3Session(Level3Interface()).aconnect, duration),
+        bench("level_4.Session.connect", Level4Session().connect, duration),
+        bench("level_4.Database.get", database_get_cycle(Level4Database), duration),
+        bench("level_5.Session.connect", Level5Session(ConnectionCounter()).connect, duration),
+        bench("level_5.Database.get", database_get_cycle(Level5Database), duration),
+        bench("level_7.Session.send_messages[100]", lambda: level_7_session.send_messages(MESSAGES), duration),
+        bench("level_8.Session.connect", Level8Session().connect, duration),
+    ]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    ops_per_sec: float
+    p50: float
+    p90: float
+    p99: float
+    samples: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_ops_per_sec: float
+    ops_per_sec: float
+
+    @property
+    def slowdown(self) -> float:
+        return 1 - self.ops_per_sec / self.baseline_ops_per_sec
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def summarize(name: str, latencies: list[float], total_ops: int, total_time: float) -> BenchmarkResult:
+    latencies = sorted(latencies)
+    return BenchmarkResult(
+        name=name,
+        ops_per_sec=total_ops / total_time,
+        p50=percentile(latencies, 0.5),
+        p90=percentile(latencies, 0.9),
+        p99=percentile(latencies, 0.99),
+        samples=len(latencies),
+    )
+
+
+def bench(name: str, func: Callable[[], object], duration: float = 1.0) -> BenchmarkResult:
+    # Every call is timed on its own so the percentiles show the tail, at the cost of the clock overhead per sample
+    latencies: list[float] = []
+    begin = time.perf_counter()
+    # Always run at least one call so that very short durations still produce a sample
+    while not latencies or time.perf_counter() - begin < duration:
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return summarize(name, latencies, len(latencies), time.perf_counter() - begin)
+
+
+def abench(name: str, func: Callable[[], Awaitable[object]], duration: float = 1.0) -> BenchmarkResult:
+    async def run() -> BenchmarkResult:
+        latencies: list[float] = []
+        begin = time.perf_counter()
+        while not latencies or time.perf_counter() - begin < duration:
+            start = time.perf_counter()
+            await func()
+            latencies.append(time.perf_counter() - start)
+        return summarize(name, latencies, len(latencies), time.perf_counter() - begin)
+
+    return asyncio.run(run())
+
+
+def save_baseline(path: Path, results: list[BenchmarkResult]) -> None:
+    path.write_text(json.dumps({result.name: asdict(result) for result in results}, indent=2) + "\n")
+
+
+def load_baseline(path: Path) -> dict[str, BenchmarkResult]:
+    return {name: BenchmarkResult(**result) for name, result in json.loads(path.read_text()).items()}
+
+
+def find_regressions(
+    baseline: dict[str, BenchmarkResult], results: list[BenchmarkResult], threshold: float
+) -> list[Regression]:
+    regressions: list[Regression] = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is not None and result.ops_per_sec < reference.ops_per_sec * (1 - threshold):
+            regressions.append(Regression(result.name, reference.ops_per_sec, result.ops_per_sec))
+    return regressions
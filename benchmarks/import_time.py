@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+# Budgets in milliseconds, about 1.5x the best of 7 runs measured when the lazy imports landed
+BUDGETS_MS = {
+    "src.level_0.calculator": 3.0,
+    "src.level_1.session": 15.0,
+    "src.level_2.session": 15.0,
+    "src.level_3.session": 18.0,
+    "src.level_4.session": 40.0,
+    "src.level_5.session": 40.0,
+    "src.level_6.session": 30.0,
+    "src.level_7.session": 30.0,
+    "src.level_8.session": 15.0,
+}
+
+
+def parse_import_time(stderr: str, module: str) -> float:
+    # -X importtime prints "import time: self [us] | cumulative | imported package" for every module
+    for line in stderr.splitlines():
+        head, _, name = line.rpartition("|")
+        if name.strip() == module:
+            return int(head.rpartition("|")[2]) / 1e6
+    msg = f"No import time reported for {module}"
+    raise ValueError(msg)
+
+
+def measure(module: str, runs: int = 5) -> float:
+    # Each run is a fresh interpreter so every import is a cold start, the best run filters out the machine's noise
+    timings: list[float] = []
+    for _ in range(runs):
+        completed = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        timings.append(parse_import_time(completed.stderr, module))
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the cold-start import time of every level against a budget")
+    parser.add_argument("--budget-ms", type=float, help="maximum import time of every module, overrides BUDGETS_MS")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters started for each module")
+    args = parser.parse_args()
+
+    over_budget = False
+    for module, default_budget_ms in BUDGETS_MS.items():
+        budget_ms = default_budget_ms if args.budget_ms is None else args.budget_ms
+        import_time = measure(module, args.runs)
+        status = "OK" if import_time * 1e3 <= budget_ms else "OVER BUDGET"
+        over_budget |= status != "OK"
+        sys.stdout.write(f"{module:<28} {import_time * 1e3:8.2f}ms  {status}\n")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def lazy_attributes(
+    package: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    # Builds the module level __getattr__ and __dir__ of a package, so that `from package import Name` only imports
+    # the submodule that defines Name, the first time it is accessed. Mapping a name to itself exposes a submodule, and
+    # a dotted module name is taken as absolute, for names shared with other packages.
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> object:  # noqa: N807
+        module = attributes.get(name)
+        if module is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        submodule = importlib.import_module(module if "." in module else f"{package}.{module}")
+        value = submodule if module == name else getattr(submodule, name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*namespace, *attributes})
+
+    return __getattr__, __dir__
+
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {f"level_{level}": f"level_{level}" for level in range(9)}
+    | {"pool": "pool", "simulator": "simulator", "tracing": "tracing"},
+)
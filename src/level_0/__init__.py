@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src import lazy_attributes
+
+if TYPE_CHECKING:
+    from src.level_0.calculator import add, divide, multiply, subtract
+    from src.level_0.expression import CompiledExpression, ExpressionError, compile_expression
+    from src.level_0.parallel import ParallelReducer
+    from src.level_0.vectorized import (
+        add_array,
+        as_doubles,
+        divide_array,
+        is_numpy,
+        multiply_array,
+        subtract_array,
+    )
+
+__all__ = [
+    "CompiledExpression",
+    "ExpressionError",
+    "ParallelReducer",
+    "add",
+    "add_array",
+    "as_doubles",
+    "compile_expression",
+    "divide",
+    "divide_array",
+    "is_numpy",
+    "multiply",
+    "multiply_array",
+    "subtract",
+    "subtract_array",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "add": "calculator",
+        "divide": "calculator",
+        "multiply": "calculator",
+        "subtract": "calculator",
+        "CompiledExpression": "expression",
+        "ExpressionError": "expression",
+        "compile_expression": "expression",
+        "ParallelReducer": "parallel",
+        "add_array": "vectorized",
+        "as_doubles": "vectorized",
+        "is_numpy": "vectorized",
+        "divide_array": "vectorized",
+        "multiply_array": "vectorized",
+        "subtract_array": "vectorized",
+    },
+)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import ast
+import functools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.level_0.calculator import add, divide, multiply, subtract
+from src.level_0.vectorized import add_array, divide_array, multiply_array, subtract_array
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from src.level_0.vectorized import ArrayLike, ZeroDivisionPolicy
+
+# Expression tree nodes are tuples: a constant, a variable or an operation with its two operand nodes
+Node = tuple
+
+_OPERATORS = {ast.Add: "add", ast.Sub: "subtract", ast.Mult: "multiply", ast.Div: "divide"}
+_SCALAR_OPERATIONS = {"add": add, "subtract": subtract, "multiply": multiply, "divide": divide}
+_COLUMN_OPERATIONS = {"add": add_array, "subtract": subtract_array, "multiply": multiply_array}
+_COMMUTATIVE = frozenset({"add", "multiply"})
+
+
+class ExpressionError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    expression: str
+    variables: tuple[str, ...]
+    # Initial register values: constants are stored in their registers, the others are overwritten when evaluating
+    registers: tuple[float, ...]
+    inputs: tuple[tuple[int, str], ...]
+    instructions: tuple[tuple[str, int, int, int], ...]
+    result: int
+
+    def __call__(self, **values: float) -> float:
+        registers = list(self.registers)
+        try:
+            for slot, name in self.inputs:
+                registers[slot] = values[name]
+        except KeyError as error:
+            msg = f"Missing value for {error.args[0]}"
+            raise ExpressionError(msg) from None
+        for operation, destination, left, right in self.instructions:
+            registers[destination] = _SCALAR_OPERATIONS[operation](registers[left], registers[right])
+        return registers[self.result]
+
+    def evaluate_columns(
+        self, columns: Mapping[str, ArrayLike], on_zero: ZeroDivisionPolicy = "raise"
+    ) -> ArrayLike | float:
+        # Each instruction runs once over whole columns, so the interpreter cost is per instruction rather than per row
+        registers: list[ArrayLike] = list(self.registers)
+        try:
+            for slot, name in self.inputs:
+                registers[slot] = columns[name]
+        except KeyError as error:
+            msg = f"Missing column for {error.args[0]}"
+            raise ExpressionError(msg) from None
+        for operation, destination, left, right in self.instructions:
+            # Folding leaves constants as the only scalars, and never two of them in one operation, so the column
+            # operations broadcast them
+            a, b = registers[left], registers[right]
+            if operation == "divide":
+                registers[destination] = divide_array(a, b, on_zero)
+            else:
+                registers[destination] = _COLUMN_OPERATIONS[operation](a, b)
+        return registers[self.result]
+
+
+@functools.lru_cache(maxsize=256)
+def compile_expression(expression: str) -> CompiledExpression:
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as error:
+        msg = f"Invalid expression {expression!r}: {error.msg}"
+        raise ExpressionError(msg) from None
+    root = _lower(tree.body)
+    slots: dict[str, int] = {}
+    leaves: list[tuple[int, Node]] = []
+    instructions: list[tuple[str, int, int, int]] = []
+    result = _emit(root, slots, leaves, instructions)
+    registers = [0.0] * len(slots)
+    for slot, leaf in leaves:
+        if leaf[0] == "const":
+            registers[slot] = leaf[1]
+    inputs = tuple((slot, leaf[1]) for slot, leaf in leaves if leaf[0] == "var")
+    return CompiledExpression(
+        expression=expression,
+        variables=tuple(sorted({name for _, name in inputs})),
+        registers=tuple(registers),
+        inputs=inputs,
+        instructions=tuple(instructions),
+        result=result,
+    )
+
+
+def _lower(node: ast.expr) -> Node:
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return ("const", float(node.value))
+    if isinstance(node, ast.Name):
+        return ("var", node.id)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd):
+        return _lower(node.operand)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return _fold("multiply", _lower(node.operand), ("const", -1.0))
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        return _fold(_OPERATORS[type(node.op)], _lower(node.left), _lower(node.right))
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _SCALAR_OPERATIONS
+        and len(node.args) == 2  # noqa: PLR2004
+        and not node.keywords
+    ):
+        return _fold(node.func.id, _lower(node.args[0]), _lower(node.args[1]))
+    msg = f"Unsupported expression: {ast.unparse(node)}"
+    raise ExpressionError(msg)
+
+
+def _fold(operation: str, left: Node, right: Node) -> Node:
+    if left[0] == "const" and right[0] == "const":
+        try:
+            return ("const", _SCALAR_OPERATIONS[operation](left[1], right[1]))
+        except ValueError as error:
+            msg = f"Cannot evaluate constant {operation}({left[1]}, {right[1]}): {error}"
+            raise ExpressionError(msg) from None
+    # Operands of commutative operations are put in a canonical order so that a * b and b * a are shared
+    if operation in _COMMUTATIVE and (left[0] == "const" or (right[0] != "const" and repr(right) < repr(left))):
+        left, right = right, left
+    return (operation, left, right)
+
+
+def _emit(
+    node: Node, slots: dict[str, int], leaves: list[tuple[int, Node]], instructions: list[tuple[str, int, int, int]]
+) -> int:
+    # Nodes are keyed by repr rather than by value because 0.0 == -0.0 but the two don't give the same results
+    key = repr(node)
+    slot = slots.get(key)
+    if slot is not None:
+        return slot
+    if node[0] in ("const", "var"):
+        slot = len(slots)
+        leaves.append((slot, node))
+    else:
+        left = _emit(node[1], slots, leaves, instructions)
+        right = _emit(node[2], slots, leaves, instructions)
+        slot = len(slots)
+        instructions.append((node[0], slot, left, right))
+    slots[key] = slot
+    return slot
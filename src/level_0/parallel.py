@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import array
+import itertools
+import math
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Literal, Self, TypeVar
+
+from src.level_0.vectorized import as_doubles, divide_array, is_numpy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from types import TracebackType
+
+    from src.level_0.vectorized import ArrayLike
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+Reduction = Literal["sum", "product"]
+T = TypeVar("T")
+
+
+def _reduce(reduction: Reduction, values: memoryview) -> float:
+    # The combination is fixed by the chunk boundaries, never by which worker finishes first, so results only depend
+    # on chunk_size
+    if np is not None:
+        chunk = np.frombuffer(values)
+        return float(chunk.sum() if reduction == "sum" else chunk.prod())
+    return sum(values) if reduction == "sum" else math.prod(values)
+
+
+def _divide(a: memoryview, b: memoryview, out: memoryview, on_zero: Literal["raise", "nan"]) -> bool:
+    if np is not None:
+        a, b = np.frombuffer(a), np.frombuffer(b)
+    try:
+        out[:] = divide_array(a, b, on_zero)
+    except ValueError:
+        return False
+    return True
+
+
+def _on_chunk(function: Callable[..., T], names: tuple[str, ...], start: int, stop: int, *args: object) -> T:
+    # Workers attach to the blocks by name and work on their slice in place: only names and bounds are pickled. The
+    # views are dropped when function returns, which they must be before the blocks can be closed.
+    blocks = [SharedMemory(name=name) for name in names]
+    try:
+        return function(*(block.buf.cast("d")[start:stop] for block in blocks), *args)
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def reduce_chunk(reduction: Reduction, name: str, start: int, stop: int) -> float:
+    return _on_chunk(lambda values: _reduce(reduction, values), (name,), start, stop)
+
+
+def divide_chunk(names: tuple[str, str, str], start: int, stop: int, on_zero: Literal["raise", "nan"]) -> bool:
+    return _on_chunk(_divide, names, start, stop, on_zero)
+
+
+def _doubles(values: ArrayLike) -> memoryview:
+    if np is not None and isinstance(values, np.ndarray):
+        return memoryview(np.ascontiguousarray(values, dtype=float))
+    return memoryview(as_doubles(values))
+
+
+def _share(values: memoryview) -> SharedMemory:
+    block = SharedMemory(create=True, size=values.nbytes)
+    block.buf[: values.nbytes] = values.cast("B")
+    return block
+
+
+class ParallelReducer:
+    def __init__(self, workers: int | None = None, chunk_size: int = 1 << 20) -> None:
+        if chunk_size < 1:
+            msg = "chunk_size must be at least 1"
+            raise ValueError(msg)
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+
+    def sum_all(self, values: ArrayLike) -> float:
+        return math.fsum(self._partials("sum", values))
+
+    def product_all(self, values: ArrayLike) -> float:
+        return math.prod(self._partials("product", values))
+
+    def divide(self, a: ArrayLike, b: ArrayLike, on_zero: Literal["raise", "nan"] = "raise") -> ArrayLike:
+        if on_zero not in ("raise", "nan"):
+            msg = f"Unknown zero division policy: {on_zero}"
+            raise ValueError(msg)
+        left, right = _doubles(a), _doubles(b)
+        if len(left) != len(right):
+            msg = f"Operands have different lengths: {len(left)} and {len(right)}"
+            raise ValueError(msg)
+        if len(left) <= self.chunk_size:
+            return divide_array(a, b, on_zero)
+        blocks = [_share(left), _share(right), SharedMemory(create=True, size=left.nbytes)]
+        try:
+            names = tuple(block.name for block in blocks)
+            starts, stops = self._bounds(len(left))
+            divided = self._executor.map(
+                divide_chunk, itertools.repeat(names), starts, stops, itertools.repeat(on_zero)
+            )
+            if not all(list(divided)):
+                msg = "Cannot divide by zero"
+                raise ValueError(msg)
+            result = array.array("d")
+            result.frombytes(blocks[2].buf[: left.nbytes])
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        # Same result type as divide_array gives for small inputs: NumPy if either operand is
+        if is_numpy(a, b):
+            return np.frombuffer(result)
+        return result
+
+    def _partials(self, reduction: Reduction, values: ArrayLike) -> Iterable[float]:
+        doubles = _doubles(values)
+        if len(doubles) <= self.chunk_size:
+            return [_reduce(reduction, doubles)]
+        block = _share(doubles)
+        try:
+            starts, stops = self._bounds(len(doubles))
+            return list(
+                self._executor.map(
+                    reduce_chunk, itertools.repeat(reduction), itertools.repeat(block.name), starts, stops
+                )
+            )
+        finally:
+            block.close()
+            block.unlink()
+
+    def _bounds(self, length: int) -> tuple[range, list[int]]:
+        starts = range(0, length, self.chunk_size)
+        return starts, [min(start + self.chunk_size, length) for start in starts]
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import array
+import itertools
+import math
+import operator
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ZeroDivisionPolicy = Literal["raise", "nan", "mask"]
+ArrayLike = Any
+
+
+def is_numpy(*values: ArrayLike) -> bool:
+    return np is not None and any(isinstance(value, np.ndarray) for value in values)
+
+
+def as_doubles(values: ArrayLike) -> array.array[float]:
+    if isinstance(values, array.array) and values.typecode == "d":
+        return values
+    if isinstance(values, bytes | bytearray | memoryview):
+        view = memoryview(values)
+        # Raw byte buffers are reinterpreted as doubles, typed buffers are converted element-wise in C
+        return array.array("d", view.cast("B").cast("d") if view.format in ("B", "b", "c") else view)
+    return array.array("d", values)
+
+
+def _operands(a: ArrayLike, b: ArrayLike) -> tuple[Iterable[float], Iterable[float]]:
+    # A scalar on either side is repeated to the length of the other operand
+    if isinstance(a, int | float):
+        if isinstance(b, int | float):
+            msg = "At least one operand must be an array"
+            raise TypeError(msg)
+        right = as_doubles(b)
+        return itertools.repeat(float(a), len(right)), right
+    left = as_doubles(a)
+    if isinstance(b, int | float):
+        return left, itertools.repeat(float(b), len(left))
+    right = as_doubles(b)
+    if len(left) != len(right):
+        msg = f"Operands have different lengths: {len(left)} and {len(right)}"
+        raise ValueError(msg)
+    return left, right
+
+
+def _apply(op: Callable[[float, float], float], a: ArrayLike, b: ArrayLike) -> array.array[float]:
+    left, right = _operands(a, b)
+    # map over a C-implemented operator never calls back into Python bytecode per element
+    return array.array("d", map(op, left, right))
+
+
+def add_array(a: ArrayLike, b: ArrayLike) -> ArrayLike:
+    if is_numpy(a, b):
+        return np.add(a, b)
+    return _apply(operator.add, a, b)
+
+
+def subtract_array(a: ArrayLike, b: ArrayLike) -> ArrayLike:
+    if is_numpy(a, b):
+        return np.subtract(a, b)
+    return _apply(operator.sub, a, b)
+
+
+def multiply_array(a: ArrayLike, b: ArrayLike) -> ArrayLike:
+    if is_numpy(a, b):
+        return np.multiply(a, b)
+    return _apply(operator.mul, a, b)
+
+
+def divide_array(a: ArrayLike, b: ArrayLike, on_zero: ZeroDivisionPolicy = "raise") -> ArrayLike:
+    if on_zero not in ("raise", "nan", "mask"):
+        msg = f"Unknown zero division policy: {on_zero}"
+        raise ValueError(msg)
+    if is_numpy(a, b):
+        return _divide_numpy(a, b, on_zero)
+    if on_zero == "mask":
+        msg = "The mask policy requires NumPy arrays"
+        raise TypeError(msg)
+    left, right = _operands(a, b)
+    right = array.array("d", right)
+    zeros = _zero_indices(right)
+    if zeros and on_zero == "raise":
+        msg = "Cannot divide by zero"
+        raise ValueError(msg)
+    for index in zeros:
+        right[index] = math.nan
+    # x / nan is nan, so the zero divisors come out as nan without a per-element check
+    return array.array("d", map(operator.truediv, left, right))
+
+
+def _zero_indices(values: array.array[float]) -> list[int]:
+    # array.index scans in C, so this only costs Python work per zero found
+    indices: list[int] = []
+    start = 0
+    while True:
+        try:
+            index = values.index(0.0, start)
+        except ValueError:
+            return indices
+        indices.append(index)
+        start = index + 1
+
+
+def _divide_numpy(a: ArrayLike, b: ArrayLike, on_zero: ZeroDivisionPolicy) -> ArrayLike:
+    divisor = np.asarray(b, dtype=float)
+    zeros = divisor == 0
+    if on_zero == "raise":
+        if zeros.any():
+            msg = "Cannot divide by zero"
+            raise ValueError(msg)
+        return np.divide(a, divisor)
+    result = np.divide(a, np.where(zeros, np.nan, divisor))
+    if on_zero == "mask":
+        return np.ma.masked_array(result, mask=np.broadcast_to(zeros, np.shape(result)))
+    return result
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src import lazy_attributes
+
+if TYPE_CHECKING:
+    from src.level_1.interface import connect_to_server
+    from src.level_1.session import Session
+
+__all__ = [
+    "Session",
+    "connect_to_server",
+]
+
+__getattr__, __dir__ = lazy_attributes(__name__, {"connect_to_server": "interface", "Session": "session"})
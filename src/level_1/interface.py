@@ -1,6 +1,9 @@
 import logging
 
+from src.tracing import span
+
 
 def connect_to_server() -> bool:
-    logging.info("Called actual connect_to_server")
-    return True
+    with span("connect_to_server"):
+        logging.info("Called actual connect_to_server")
+        return True
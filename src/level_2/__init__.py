@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src import lazy_attributes
+
+if TYPE_CHECKING:
+    from src.level_2.cache import ConnectionCache
+    from src.level_2.farm import FarmResults, SessionFarm
+    from src.level_2.interface import ServerInterface
+    from src.level_2.session import Session
+
+__all__ = [
+    "ConnectionCache",
+    "FarmResults",
+    "ServerInterface",
+    "Session",
+    "SessionFarm",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ConnectionCache": "cache",
+        "FarmResults": "farm",
+        "SessionFarm": "farm",
+        "ServerInterface": "interface",
+        "Session": "session",
+    },
+)
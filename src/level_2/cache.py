@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+
+
+class ConnectionCache:
+    def __init__(self, ttl: float = 30.0) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # Keyed by the interface object itself, entries go away with their interface
+        self._expiries: weakref.WeakKeyDictionary[object, float] = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def is_connected(self, interface: object) -> bool:
+        with self._lock:
+            expiry = self._expiries.get(interface)
+            if expiry is not None and expiry > time.monotonic():
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def mark_connected(self, interface: object) -> None:
+        with self._lock:
+            self._expiries[interface] = time.monotonic() + self.ttl
+
+    def invalidate(self, interface: object) -> None:
+        with self._lock:
+            self._expiries.pop(interface, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expiries.clear()
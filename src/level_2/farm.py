@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Protocol, Self
+
+from src.level_2.interface import ServerInterface
+from src.level_2.session import Session
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+MAX_REPORTED_ERRORS = 10
+
+
+class Connectable(Protocol):
+    def connect(self) -> bool: ...
+
+
+def new_session() -> Session:
+    return Session(ServerInterface())
+
+
+@dataclass
+class ChunkResult:
+    succeeded: int = 0
+    failed: int = 0
+    errors: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+@dataclass
+class FarmResults:
+    succeeded: int = 0
+    failed: int = 0
+    errors: list[str] = field(default_factory=list)
+    chunks: int = 0
+    elapsed: float = 0.0
+    # Sum of the time spent connecting in every worker, compare it with elapsed to see the actual parallelism
+    worker_time: float = 0.0
+
+    def add(self, chunk: ChunkResult) -> None:
+        self.succeeded += chunk.succeeded
+        self.failed += chunk.failed
+        self.errors.extend(chunk.errors[: MAX_REPORTED_ERRORS - len(self.errors)])
+        self.chunks += 1
+        self.worker_time += chunk.elapsed
+
+
+# Each worker process builds its session once, in the pool initializer, and reuses it for every chunk it runs
+_worker_session: Connectable | None = None
+
+
+def init_worker(session_factory: Callable[[], Connectable]) -> None:
+    global _worker_session  # noqa: PLW0603
+    _worker_session = session_factory()
+
+
+def connect_chunk(count: int) -> ChunkResult:
+    if _worker_session is None:
+        msg = "The worker session was not initialized"
+        raise RuntimeError(msg)
+    result = ChunkResult()
+    start = time.perf_counter()
+    for _ in range(count):
+        try:
+            connected = _worker_session.connect()
+        except Exception as e:  # noqa: BLE001
+            connected = False
+            if len(result.errors) < MAX_REPORTED_ERRORS:
+                result.errors.append(repr(e))
+        if connected:
+            result.succeeded += 1
+        else:
+            result.failed += 1
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+class SessionFarm:
+    def __init__(
+        self,
+        session_factory: Callable[[], Connectable] = new_session,
+        workers: int | None = None,
+        chunk_size: int = 64,
+    ) -> None:
+        if chunk_size < 1:
+            msg = "chunk_size must be at least 1"
+            raise ValueError(msg)
+        self.chunk_size = chunk_size
+        # The factory is pickled once per worker, so it must be a module level callable such as a class or function
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(session_factory,))
+
+    def connect_many(self, n: int) -> FarmResults:
+        results = FarmResults()
+        chunks = [min(self.chunk_size, n - start) for start in range(0, n, self.chunk_size)]
+        start = time.perf_counter()
+        for chunk in self._executor.map(connect_chunk, chunks):
+            results.add(chunk)
+        results.elapsed = time.perf_counter() - start
+        return results
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
@@ -1,11 +1,30 @@
+from src.level_2.cache import ConnectionCache
 from src.level_2.interface import ServerInterface
 
 
 class Session:
     interface: ServerInterface
 
-    def __init__(self, interface: ServerInterface) -> None:
+    def __init__(self, interface: ServerInterface, connection_cache: ConnectionCache | None = None) -> None:
         self.interface = interface
+        self.connection_cache = connection_cache
 
     def connect(self) -> bool:
-        return self.interface.connect_to_server()
+        if self.connection_cache is None:
+            return self.interface.connect_to_server()
+        if self.connection_cache.is_connected(self.interface):
+            return True
+        try:
+            connected = self.interface.connect_to_server()
+        except Exception:
+            self.connection_cache.invalidate(self.interface)
+            raise
+        if connected:
+            self.connection_cache.mark_connected(self.interface)
+        else:
+            self.connection_cache.invalidate(self.interface)
+        return connected
+
+    def invalidate(self) -> None:
+        if self.connection_cache is not None:
+            self.connection_cache.invalidate(self.interface)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src import lazy_attributes
+
+if TYPE_CHECKING:
+    from src.level_3.admission import (
+        AdmissionController,
+        AdmissionQueueFullError,
+        AdmissionStats,
+        AdmissionTimeoutError,
+    )
+    from src.level_3.fanout import FanOutResults, fan_out
+    from src.level_3.interface import ServerInterface
+    from src.level_3.session import Session
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionQueueFullError",
+    "AdmissionStats",
+    "AdmissionTimeoutError",
+    "FanOutResults",
+    "ServerInterface",
+    "Session",
+    "fan_out",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AdmissionController": "admission",
+        "AdmissionQueueFullError": "admission",
+        "AdmissionStats": "admission",
+        "AdmissionTimeoutError": "admission",
+        "FanOutResults": "fanout",
+        "fan_out": "fanout",
+        "ServerInterface": "interface",
+        "Session": "session",
+    },
+)
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import AsyncIterator, Hashable, Iterator
+
+
+class AdmissionTimeoutError(TimeoutError):
+    pass
+
+
+class AdmissionQueueFullError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    in_flight: int
+    queued: int
+    admitted: int
+    rejected: int
+    timeouts: int
+    total_wait_time: float
+    max_wait_time: float
+
+
+class _Waiter:
+    __slots__ = ("admitted", "event", "future", "key", "loop", "start")
+
+    def __init__(self, key: Hashable, start: float) -> None:
+        self.key = key
+        self.start = start
+        self.admitted = False
+        self.event: threading.Event | None = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.future: asyncio.Future[None] | None = None
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        elif self.loop is not None and self.future is not None:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdmissionController:
+    # Shared by any number of sessions, threads and event loops: the state is guarded by a threading lock and async
+    # waiters are woken on their own loop. Released slots are handed straight to the first waiter that can use them,
+    # so callers are admitted in arrival order unless their own session is at its limit.
+    def __init__(
+        self,
+        max_in_flight: int = 100,
+        max_per_session: int | None = None,
+        max_queue: int = 1000,
+        timeout: float | None = 30.0,
+    ) -> None:
+        if max_in_flight < 1:
+            msg = "max_in_flight must be at least 1"
+            raise ValueError(msg)
+        if max_per_session is not None and max_per_session < 1:
+            msg = "max_per_session must be at least 1"
+            raise ValueError(msg)
+        if max_queue < 0:
+            msg = "max_queue must not be negative"
+            raise ValueError(msg)
+        self.max_in_flight = max_in_flight
+        self.max_per_session = max_per_session
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._waiters: deque[_Waiter] = deque()
+        self._in_flight = 0
+        self._per_session: dict[Hashable, int] = {}
+        self._admitted = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def acquire(self, session: Hashable = None, timeout: float | None = None) -> None:
+        start = time.monotonic()
+        with self._lock:
+            if self._try_admit(session, start):
+                return
+            waiter = self._enqueue(session, start)
+            waiter.event = threading.Event()
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            woken = waiter.event.wait(timeout)
+        except BaseException:
+            # Interrupted while queued, by KeyboardInterrupt for instance: the waiter must not keep its place or a slot
+            self._withdraw(waiter, session)
+            raise
+        if woken:
+            return
+        with self._lock:
+            if waiter.admitted:
+                return
+            self._abandon(waiter)
+        msg = f"Timed out waiting for admission after {time.monotonic() - start:.3f}s"
+        raise AdmissionTimeoutError(msg)
+
+    async def aacquire(self, session: Hashable = None, timeout: float | None = None) -> None:  # noqa: ASYNC109
+        # Imported here so that the sync only users of this module don't pay for importing asyncio
+        import asyncio
+
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_admit(session, start):
+                return
+            waiter = self._enqueue(session, start)
+            waiter.loop = loop
+            waiter.future = future = loop.create_future()
+        try:
+            async with asyncio.timeout(self.timeout if timeout is None else timeout):
+                await future
+        except TimeoutError:
+            with self._lock:
+                if waiter.admitted:
+                    return
+                self._abandon(waiter)
+            msg = f"Timed out waiting for admission after {time.monotonic() - start:.3f}s"
+            raise AdmissionTimeoutError(msg) from None
+        except asyncio.CancelledError:
+            self._withdraw(waiter, session)
+            raise
+
+    def release(self, session: Hashable = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            remaining = self._per_session[session] - 1
+            if remaining:
+                self._per_session[session] = remaining
+            else:
+                del self._per_session[session]
+            self._dispatch()
+
+    @contextlib.contextmanager
+    def admit(self, session: Hashable = None, timeout: float | None = None) -> Iterator[None]:
+        self.acquire(session, timeout)
+        try:
+            yield
+        finally:
+            self.release(session)
+
+    @contextlib.asynccontextmanager
+    async def aadmit(self, session: Hashable = None, timeout: float | None = None) -> AsyncIterator[None]:  # noqa: ASYNC109
+        await self.aacquire(session, timeout)
+        try:
+            yield
+        finally:
+            self.release(session)
+
+    def in_flight(self, session: Hashable) -> int:
+        with self._lock:
+            return self._per_session.get(session, 0)
+
+    def stats(self) -> AdmissionStats:
+        with self._lock:
+            return AdmissionStats(
+                in_flight=self._in_flight,
+                queued=len(self._waiters),
+                admitted=self._admitted,
+                rejected=self._rejected,
+                timeouts=self._timeouts,
+                total_wait_time=self._total_wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    def _session_full(self, session: Hashable) -> bool:
+        return self.max_per_session is not None and self._per_session.get(session, 0) >= self.max_per_session
+
+    def _try_admit(self, session: Hashable, start: float) -> bool:
+        # Every queued waiter is blocked by a full limit, otherwise it would have been admitted on the last release,
+        # so a newcomer only goes ahead of the queue when its own limits allow it
+        if self._in_flight >= self.max_in_flight or self._session_full(session):
+            return False
+        self._admit(session, start)
+        return True
+
+    def _admit(self, session: Hashable, start: float) -> None:
+        self._in_flight += 1
+        self._per_session[session] = self._per_session.get(session, 0) + 1
+        wait_time = time.monotonic() - start
+        self._admitted += 1
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+
+    def _enqueue(self, session: Hashable, start: float) -> _Waiter:
+        if len(self._waiters) >= self.max_queue:
+            self._rejected += 1
+            msg = f"Admission queue is full with {len(self._waiters)} waiters"
+            raise AdmissionQueueFullError(msg)
+        waiter = _Waiter(session, start)
+        self._waiters.append(waiter)
+        return waiter
+
+    def _withdraw(self, waiter: _Waiter, session: Hashable) -> None:
+        with self._lock:
+            admitted = waiter.admitted
+            if not admitted:
+                self._waiters.remove(waiter)
+        # The slot may have been handed over just before the interruption, give it to the next waiter
+        if admitted:
+            self.release(session)
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        self._waiters.remove(waiter)
+        self._timeouts += 1
+
+    def _dispatch(self) -> None:
+        index = 0
+        while index < len(self._waiters) and self._in_flight < self.max_in_flight:
+            waiter = self._waiters[index]
+            if self._session_full(waiter.key):
+                index += 1
+                continue
+            del self._waiters[index]
+            self._admit(waiter.key, waiter.start)
+            waiter.admitted = True
+            waiter.wake()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+@dataclass
+class FanOutResults:
+    results: list[bool | BaseException]
+    latencies: list[float]
+    elapsed: float = 0.0
+    timed_out: int = 0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(result is True for result in self.results)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @property
+    def errors(self) -> list[BaseException]:
+        return [result for result in self.results if isinstance(result, BaseException)]
+
+
+async def fan_out(
+    connect: Callable[[], Awaitable[bool]], n: int, concurrency: int, attempt_timeout: float | None = None
+) -> FanOutResults:
+    if concurrency < 1:
+        msg = "concurrency must be at least 1"
+        raise ValueError(msg)
+    results: list[bool | BaseException] = [False] * n
+    latencies = [0.0] * n
+    fan_out_results = FanOutResults(results, latencies)
+    # Attempts are handed out by a shared iterator so only `concurrency` coroutines ever exist at once, instead of
+    # creating n tasks up front that all queue on a semaphore
+    attempts = iter(range(n))
+
+    async def worker() -> None:
+        for attempt in attempts:
+            start = time.perf_counter()
+            try:
+                async with asyncio.timeout(attempt_timeout):
+                    results[attempt] = await connect()
+            except TimeoutError as e:
+                results[attempt] = e
+                fan_out_results.timed_out += 1
+            except Exception as e:  # noqa: BLE001
+                results[attempt] = e
+            latencies[attempt] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as task_group:
+        for _ in range(min(concurrency, n)):
+            task_group.create_task(worker())
+    fan_out_results.elapsed = time.perf_counter() - start
+    return fan_out_results
@@ -1,5 +1,7 @@
 import logging
 
+from src.tracing import span
+
 
 class ServerInterface:
     class_attribute = "This is a class attribute"
@@ -8,9 +10,11 @@ class ServerInterface:
         self.instance_attribute = "This is an instance attribute"
 
     def connect_to_server(self) -> bool:
-        logging.info("Called actual connect_to_server")
-        return True
+        with span("connect_to_server"):
+            logging.info("Called actual connect_to_server")
+            return True
 
     async def aconnect_to_server(self) -> bool:
-        logging.info("Called actual aconnect_to_server")
-        return True
+        with span("aconnect_to_server"):
+            logging.info("Called actual aconnect_to_server")
+            return True
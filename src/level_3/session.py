@@ -1,17 +1,44 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
 from src.level_3.interface import ServerInterface
 
+if TYPE_CHECKING:
+    from src.level_3.admission import AdmissionController
+    from src.level_3.fanout import FanOutResults
+
 
 class Session:
     interface: ServerInterface
     active_connections: int = 0
 
-    def __init__(self, interface: ServerInterface) -> None:
+    def __init__(self, interface: ServerInterface, admission: AdmissionController | None = None) -> None:
         self.interface = interface
+        self.admission = admission
+        self._lock = threading.Lock()
 
     def connect(self) -> bool:
-        self.active_connections += 1
-        return self.interface.connect_to_server()
+        with self._lock:
+            self.active_connections += 1
+        if self.admission is None:
+            return self.interface.connect_to_server()
+        with self.admission.admit(self):
+            return self.interface.connect_to_server()
 
     async def aconnect(self) -> bool:
-        self.active_connections += 1
-        return await self.interface.aconnect_to_server()
+        with self._lock:
+            self.active_connections += 1
+        if self.admission is None:
+            return await self.interface.aconnect_to_server()
+        async with self.admission.aadmit(self):
+            return await self.interface.aconnect_to_server()
+
+    async def aconnect_many(
+        self, n: int, concurrency: int = 100, attempt_timeout: float | None = None
+    ) -> FanOutResults:
+        # Imported here so that only the callers of aconnect_many pay for importing asyncio
+        from src.level_3.fanout import fan_out
+
+        return await fan_out(self.aconnect, n, concurrency, attempt_timeout)
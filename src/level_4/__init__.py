@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src import lazy_attributes
+
+if TYPE_CHECKING:
+    from src.level_4.database import (
+        AsyncConnection,
+        AsyncConnectionPool,
+        Connection,
+        ConnectionPool,
+        Database,
+        PoolStats,
+        PoolTimeoutError,
+    )
+    from src.level_4.interface import ServerInterface
+    from src.level_4.session import Session
+
+__all__ = [
+    "AsyncConnection",
+    "AsyncConnectionPool",
+    "Connection",
+    "ConnectionPool",
+    "Database",
+    "PoolStats",
+    "PoolTimeoutError",
+    "ServerInterface",
+    "Session",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AsyncConnection": "database",
+        "AsyncConnectionPool": "database",
+        "Connection": "database",
+        "ConnectionPool": "database",
+        "Database": "database",
+        "PoolStats": "database",
+        "PoolTimeoutError": "database",
+        "ServerInterface": "interface",
+        "Session": "session",
+    },
+)
@@ -1,18 +1,38 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Self
+import time
+import weakref
+from typing import TYPE_CHECKING, ClassVar, Self
+
+from src.pool import ConnectionPool, PoolStats, PoolTimeoutError
+from src.tracing import span
 
 if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable
     from types import TracebackType
 
 
 class Connection:
+    def __init__(self) -> None:
+        self.pool: ConnectionPool[Connection] | None = None
+        self.last_used = time.monotonic()
+
     def begin(self) -> None:
-        logging.info("Called actual begin")
+        with span("begin"):
+            logging.info("Called actual begin")
 
     def commit(self) -> None:
-        logging.info("Called actual commit")
+        with span("commit"):
+            logging.info("Called actual commit")
+
+    def is_healthy(self) -> bool:
+        logging.info("Called actual is_healthy")
+        return True
+
+    def close(self) -> None:
+        logging.info("Called actual close")
 
     def __enter__(self) -> Self:
         return self
@@ -20,11 +40,165 @@ class Connection:
     def __exit__(
         self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
     ) -> None:
-        pass
+        if self.pool is None:
+            return
+        # The block may have failed halfway through a transaction, so the connection is not handed to anyone else
+        if exc_type is not None:
+            self.pool.discard(self)
+        else:
+            self.pool.release(self)
+
+
+class AsyncConnection:
+    def __init__(self) -> None:
+        self.pool: AsyncConnectionPool | None = None
+
+    async def begin(self) -> None:
+        with span("begin"):
+            logging.info("Called actual async begin")
+
+    async def commit(self) -> None:
+        with span("commit"):
+            logging.info("Called actual async commit")
+
+    async def close(self) -> None:
+        logging.info("Called actual async close")
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if self.pool is None:
+            return
+        if exc_type is not None:
+            await self.pool.discard(self)
+        else:
+            await self.pool.release(self)
+
+
+class AsyncConnectionPool:
+    # asyncio primitives belong to the loop they are first used on, so each pool must only be used from one loop.
+    # asyncio is imported in the methods so that the sync only users of this module don't pay for importing it.
+    def __init__(
+        self,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        connection_factory: Callable[[], AsyncConnection] = AsyncConnection,
+    ) -> None:
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+        self.max_size = max_size
+        self.timeout = timeout
+        self.connection_factory = connection_factory
+        import asyncio
+
+        self._condition = asyncio.Condition()
+        self._idle: list[AsyncConnection] = []
+        self._closed = False
+        self._size = 0
+        self._in_use = 0
+        self._waiters = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    async def acquire(self) -> AsyncConnection:
+        import asyncio
+
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(self.timeout), self._condition:
+                self._waiters += 1
+                try:
+                    await self._condition.wait_for(lambda: bool(self._idle) or self._size < self.max_size)
+                finally:
+                    self._waiters -= 1
+                wait_time = time.monotonic() - start
+                self._checkouts += 1
+                self._total_wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+                self._in_use += 1
+                if self._idle:
+                    return self._idle.pop()
+                self._size += 1
+        except TimeoutError:
+            self._timeouts += 1
+            msg = f"Timed out waiting for a connection after {time.monotonic() - start:.3f}s"
+            raise PoolTimeoutError(msg) from None
+        try:
+            conn = self.connection_factory()
+        except BaseException:
+            async with self._condition:
+                self._in_use -= 1
+                self._size -= 1
+                self._condition.notify()
+            raise
+        conn.pool = self
+        return conn
+
+    async def release(self, conn: AsyncConnection) -> None:
+        async with self._condition:
+            if not self._closed:
+                self._in_use -= 1
+                self._idle.append(conn)
+                self._condition.notify()
+                return
+        await self.discard(conn)
+
+    async def discard(self, conn: AsyncConnection) -> None:
+        async with self._condition:
+            self._in_use -= 1
+            self._size -= 1
+            self._condition.notify()
+        conn.pool = None
+        await conn.close()
+
+    async def close(self) -> None:
+        async with self._condition:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for conn in idle:
+            conn.pool = None
+            await conn.close()
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            size=self._size,
+            idle=len(self._idle),
+            in_use=self._in_use,
+            waiters=self._waiters,
+            checkouts=self._checkouts,
+            timeouts=self._timeouts,
+            total_wait_time=self._total_wait_time,
+            max_wait_time=self._max_wait_time,
+        )
 
 
 class Database:
-    @staticmethod
-    def get() -> Connection:
+    pool: ClassVar[ConnectionPool[Connection]] = ConnectionPool(Connection)
+    async_pools: ClassVar[weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncConnectionPool]] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    @classmethod
+    def get(cls) -> Connection:
         logging.info("Called actual get")
-        return Connection()
+        return cls.pool.acquire()
+
+    @classmethod
+    async def aget(cls) -> AsyncConnection:
+        import asyncio
+
+        logging.info("Called actual aget")
+        loop = asyncio.get_running_loop()
+        pool = cls.async_pools.get(loop)
+        if pool is None:
+            pool = cls.async_pools[loop] = AsyncConnectionPool()
+        return await pool.acquire()
@@ -1,7 +1,15 @@
 import logging
 
+from src.tracing import span
+
 
 class ServerInterface:
     def connect_to_server(self) -> bool:
-        logging.info("Called actual connect_to_server")
-        return True
+        with span("connect_to_server"):
+            logging.info("Called actual connect_to_server")
+            return True
+
+    async def aconnect_to_server(self) -> bool:
+        with span("aconnect_to_server"):
+            logging.info("Called actual aconnect_to_server")
+            return True
@@ -15,3 +15,10 @@ class Session:
             conn.commit()
 
         return self.interface.connect_to_server()
+
+    async def aconnect(self) -> bool:
+        async with await Db.aget() as conn:
+            await conn.begin()
+            await conn.commit()
+
+        return await self.interface.aconnect_to_server()
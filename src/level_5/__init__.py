@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src import lazy_attributes
+
+if TYPE_CHECKING:
+    from src.level_5.database import Connection, ConnectionPool, Database
+    from src.level_5.group_commit import GroupCommitError, GroupCommitter
+    from src.level_5.interface import ConnectionCounter, CounterSnapshot, ServerInterface
+    from src.level_5.session import Session
+    from src.level_5.sqlite import SQLiteConfig, SQLiteConnection, install_sqlite_pool, sqlite_pool
+    from src.pool import PoolStats, PoolTimeoutError
+
+__all__ = [
+    "Connection",
+    "ConnectionCounter",
+    "ConnectionPool",
+    "CounterSnapshot",
+    "Database",
+    "GroupCommitError",
+    "GroupCommitter",
+    "PoolStats",
+    "PoolTimeoutError",
+    "SQLiteConfig",
+    "SQLiteConnection",
+    "ServerInterface",
+    "Session",
+    "install_sqlite_pool",
+    "sqlite_pool",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Connection": "database",
+        "ConnectionPool": "database",
+        "Database": "database",
+        "PoolStats": "src.pool",
+        "PoolTimeoutError": "src.pool",
+        "GroupCommitError": "group_commit",
+        "GroupCommitter": "group_commit",
+        "ConnectionCounter": "interface",
+        "CounterSnapshot": "interface",
+        "ServerInterface": "interface",
+        "Session": "session",
+        "SQLiteConfig": "sqlite",
+        "SQLiteConnection": "sqlite",
+        "install_sqlite_pool": "sqlite",
+        "sqlite_pool": "sqlite",
+    },
+)
@@ -1,32 +1,72 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Self
+import time
+from typing import TYPE_CHECKING, ClassVar, Self
+
+from src.pool import ConnectionPool
+from src.tracing import span
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from types import TracebackType
 
 
 # --8<-- [start:db_logs]
 class Connection:
     def begin(self) -> None:
-        logging.info("Called actual begin")
+        with span("begin"):
+            logging.info("Called actual begin")
 
     def commit(self) -> None:
-        logging.info("Called actual commit")
+        with span("commit"):
+            logging.info("Called actual commit")
 
     # --8<-- [end:db_logs]
+    def __init__(self) -> None:
+        self.pool: ConnectionPool[Connection] | None = None
+        self.last_used = time.monotonic()
+
+    def savepoint(self, name: str) -> None:
+        logging.info("Called actual savepoint %s", name)
+
+    def release_savepoint(self, name: str) -> None:
+        logging.info("Called actual release_savepoint %s", name)
+
+    def rollback_to_savepoint(self, name: str) -> None:
+        logging.info("Called actual rollback_to_savepoint %s", name)
+
+    def write_many(self, rows: Iterable[tuple[object, ...]]) -> int:
+        with span("write_many"):
+            logging.info("Called actual write_many")
+            return sum(1 for _ in rows)
+
+    def is_healthy(self) -> bool:
+        logging.info("Called actual is_healthy")
+        return True
+
+    def close(self) -> None:
+        logging.info("Called actual close")
+
     def __enter__(self) -> Self:
         return self
 
     def __exit__(
         self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
     ) -> None:
-        pass
+        if self.pool is None:
+            return
+        # The block may have failed halfway through a transaction, so the connection is not handed to anyone else
+        if exc_type is not None:
+            self.pool.discard(self)
+        else:
+            self.pool.release(self)
 
 
 class Database:
-    @staticmethod
-    def get() -> Connection:
+    pool: ClassVar[ConnectionPool[Connection]] = ConnectionPool(Connection)
+
+    @classmethod
+    def get(cls) -> Connection:
         logging.info("Called actual get")
-        return Connection()
+        return cls.pool.acquire()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from src.level_5.database import Database
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.level_5.database import Connection
+
+
+class GroupCommitError(Exception):
+    pass
+
+
+class _Request:
+    __slots__ = ("error", "lead", "wake", "write")
+
+    def __init__(self, write: Callable[[Connection], None]) -> None:
+        self.write = write
+        self.error: BaseException | None = None
+        self.lead = False
+        self.wake = threading.Event()
+
+
+class GroupCommitter:
+    def __init__(
+        self,
+        max_batch_size: int = 64,
+        max_wait: float = 0.005,
+        get_connection: Callable[[], Connection] = Database.get,
+    ) -> None:
+        if max_batch_size < 1:
+            msg = "max_batch_size must be at least 1"
+            raise ValueError(msg)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.get_connection = get_connection
+        self._lock = threading.Lock()
+        self._batch_full = threading.Condition(self._lock)
+        self._pending: list[_Request] = []
+        self._leader: _Request | None = None
+        self.batches = 0
+        self.writes = 0
+
+    def submit(self, write: Callable[[Connection], None]) -> None:
+        request = _Request(write)
+        with self._lock:
+            self._pending.append(request)
+            if self._leader is None:
+                self._promote(request)
+            elif len(self._pending) >= self.max_batch_size:
+                self._batch_full.notify()
+        # Followers sleep until their batch is committed, or until they are promoted to lead the next batch
+        request.wake.wait()
+        if request.lead:
+            self._lead()
+        if request.error is not None:
+            msg = "Group commit failed"
+            raise GroupCommitError(msg) from request.error
+
+    def _promote(self, request: _Request) -> None:
+        self._leader = request
+        request.lead = True
+        request.wake.set()
+
+    def _lead(self) -> None:
+        with self._lock:
+            try:
+                self._wait_for_batch()
+            except BaseException as e:
+                # An interrupted leader still hands its batch the error, so no follower is left waiting
+                self._fail(self._take_batch(), e)
+                raise
+            batch = self._take_batch()
+        self._commit(batch)
+
+    def _wait_for_batch(self) -> None:
+        deadline = time.monotonic() + self.max_wait
+        while len(self._pending) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._batch_full.wait(remaining)
+
+    def _take_batch(self) -> list[_Request]:
+        batch = self._pending[: self.max_batch_size]
+        del self._pending[: self.max_batch_size]
+        # Hand leadership over right away so the next batch collects while this one commits
+        if self._pending:
+            self._promote(self._pending[0])
+        else:
+            self._leader = None
+        self.batches += 1
+        self.writes += len(batch)
+        return batch
+
+    def _commit(self, batch: list[_Request]) -> None:
+        try:
+            with self.get_connection() as conn:
+                conn.begin()
+                for request in batch:
+                    # Each write runs in its own savepoint, so a failed one leaves nothing behind in the batch commit
+                    conn.savepoint("request")
+                    try:
+                        request.write(conn)
+                    except Exception as e:  # noqa: BLE001
+                        request.error = e
+                        conn.rollback_to_savepoint("request")
+                    conn.release_savepoint("request")
+                conn.commit()
+        except BaseException as e:
+            self._fail(batch, e)
+            # KeyboardInterrupt and friends still unwind the leader after its followers are woken
+            if not isinstance(e, Exception):
+                raise
+        else:
+            self._wake(batch)
+
+    def _fail(self, batch: list[_Request], error: BaseException) -> None:
+        for request in batch:
+            if request.error is None:
+                request.error = error
+        self._wake(batch)
+
+    def _wake(self, batch: list[_Request]) -> None:
+        for request in batch:
+            request.lead = False
+            request.wake.set()
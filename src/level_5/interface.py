@@ -1,15 +1,74 @@
 import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from src.tracing import span
 
 
 class ServerInterface:
     def connect_to_server(self) -> bool:
-        logging.info("Called actual connect_to_server")
-        return True
+        with span("connect_to_server"):
+            logging.info("Called actual connect_to_server")
+            return True
+
+
+@dataclass(frozen=True)
+class CounterSnapshot:
+    count: int
+    timestamp: float
 
 
 class ConnectionCounter:
     def __init__(self) -> None:
-        self.count = 0
+        self._local = threading.local()
+        self._shards: list[tuple[threading.Thread, list[int]]] = []
+        self._shards_lock = threading.Lock()
+        self._base = 0
 
     def increment(self) -> None:
-        self.count += 1
+        # Each thread only ever writes to its own shard, so increments don't need a lock and can't be lost
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = [0]
+            with self._shards_lock:
+                self._prune()
+                self._shards.append((threading.current_thread(), shard))
+        shard[0] += 1
+
+    def _prune(self) -> None:
+        # A finished thread can't write to its shard again, so its count is folded into the base total
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                self._base += shard[0]
+        self._shards = live
+
+    @property
+    def count(self) -> int:
+        with self._shards_lock:
+            self._prune()
+            return self._base + sum(shard[0] for _, shard in self._shards)
+
+    @count.setter
+    def count(self, value: int) -> None:
+        # Shards belong to their threads, so the new value is reached by offsetting the base total
+        with self._shards_lock:
+            self._prune()
+            self._base = value - sum(shard[0] for _, shard in self._shards)
+
+    def reset(self) -> None:
+        self.count = 0
+
+    def snapshot(self) -> CounterSnapshot:
+        return CounterSnapshot(self.count, time.monotonic())
+
+    def rate(self, since: CounterSnapshot) -> float:
+        now = self.snapshot()
+        elapsed = now.timestamp - since.timestamp
+        if elapsed <= 0:
+            return 0.0
+        return (now.count - since.count) / elapsed
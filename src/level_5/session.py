@@ -1,20 +1,37 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
 from src.level_5.database import Database as Db
-from src.level_5.interface import ConnectionCounter, ServerInterface
+from src.level_5.interface import ServerInterface
+
+if TYPE_CHECKING:
+    from src.level_5.database import Connection
+    from src.level_5.group_commit import GroupCommitter
+    from src.level_5.interface import ConnectionCounter
 
 
 class Session:
     interface: ServerInterface
 
-    def __init__(self, connection_counter: ConnectionCounter) -> None:
+    def __init__(self, connection_counter: ConnectionCounter, group_committer: GroupCommitter | None = None) -> None:
         self.interface = ServerInterface()
         self.connection_counter = connection_counter
+        self.group_committer = group_committer
 
     def connect(self) -> bool:
-        with Db.get() as conn:
-            conn.begin()
-            # TODO: write some data to the database
-            conn.commit()
+        if self.group_committer is not None:
+            self.group_committer.submit(self.write)
+        else:
+            with Db.get() as conn:
+                conn.begin()
+                self.write(conn)
+                conn.commit()
         connected = self.interface.connect_to_server()
         if connected:
             self.connection_counter.increment()
         return connected
+
+    def write(self, conn: Connection) -> None:
+        conn.write_many([("connect", time.time())])
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import functools
+import sqlite3
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.level_5.database import Connection, Database
+from src.pool import ConnectionPool
+from src.tracing import span
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+
+
+@dataclass(frozen=True)
+class SQLiteConfig:
+    # Required because every pooled connection opens the same file: with ":memory:" each one would get its own database
+    path: str
+    table: str = "events"
+    columns: tuple[str, ...] = ("event", "timestamp")
+    journal_mode: str = "WAL"
+    # NORMAL is safe in WAL mode and only fsyncs on checkpoints, FULL fsyncs on every commit
+    synchronous: str = "NORMAL"
+    cached_statements: int = 128
+    busy_timeout: float = 5.0
+
+    def __post_init__(self) -> None:
+        if self.synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            msg = f"Unknown synchronous level: {self.synchronous}"
+            raise ValueError(msg)
+        if self.journal_mode.upper() not in JOURNAL_MODES:
+            msg = f"Unknown journal mode: {self.journal_mode}"
+            raise ValueError(msg)
+        if not self.columns:
+            msg = "At least one column is required"
+            raise ValueError(msg)
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class SQLiteConnection(Connection):
+    def __init__(self, config: SQLiteConfig) -> None:
+        super().__init__()
+        self.closed = False
+        # Transactions are managed explicitly by begin and commit. The pool hands connections over between threads, but
+        # only ever to one thread at a time.
+        self.db = sqlite3.connect(
+            config.path,
+            timeout=config.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=config.cached_statements,
+        )
+        self.db.execute(f"PRAGMA journal_mode = {config.journal_mode}")
+        self.db.execute(f"PRAGMA synchronous = {config.synchronous}")
+        table = _quote(config.table)
+        columns = ", ".join(_quote(column) for column in config.columns)
+        self.db.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+        # The same statement text is used for every write, so it is prepared once and then reused from the cache
+        placeholders = ", ".join("?" * len(config.columns))
+        self.insert = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"  # noqa: S608
+
+    def begin(self) -> None:
+        with span("begin"):
+            self.db.execute("BEGIN")
+
+    def commit(self) -> None:
+        with span("commit"):
+            self.db.execute("COMMIT")
+
+    def rollback(self) -> None:
+        with span("rollback"):
+            self.db.execute("ROLLBACK")
+
+    def savepoint(self, name: str) -> None:
+        self.db.execute(f"SAVEPOINT {_quote(name)}")
+
+    def release_savepoint(self, name: str) -> None:
+        self.db.execute(f"RELEASE SAVEPOINT {_quote(name)}")
+
+    def rollback_to_savepoint(self, name: str) -> None:
+        self.db.execute(f"ROLLBACK TO SAVEPOINT {_quote(name)}")
+
+    def write_many(self, rows: Iterable[tuple[object, ...]]) -> int:
+        with span("write_many"):
+            return self.db.executemany(self.insert, rows).rowcount
+
+    def is_healthy(self) -> bool:
+        try:
+            self.db.execute("SELECT 1")
+        except sqlite3.Error:
+            return False
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+        self.db.close()
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        # A connection must not go back to the pool with a transaction still open, or once it is closed
+        if not self.closed and self.db.in_transaction:
+            try:
+                self.rollback()
+            except sqlite3.Error:
+                self.close()
+        if self.closed:
+            if self.pool is not None:
+                self.pool.discard(self)
+            return
+        super().__exit__(exc_type, exc_value, traceback)
+
+
+def sqlite_pool(config: SQLiteConfig, max_size: int = 10, timeout: float = 30.0) -> ConnectionPool[Connection]:
+    return ConnectionPool(functools.partial(SQLiteConnection, config), max_size=max_size, timeout=timeout)
+
+
+def install_sqlite_pool(config: SQLiteConfig, max_size: int = 10, timeout: float = 30.0) -> ConnectionPool[Connection]:
+    # Database.get, and so every level_5 Session, hands out SQLite connections from now on. Connections still checked
+    # out of the previous pool are closed when they are returned to it.
+    previous = Database.pool
+    Database.pool = sqlite_pool(config, max_size, timeout)
+    previous.close()
+    return Database.pool
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src import lazy_attributes
+
+if TYPE_CHECKING:
+    from src.level_6.heartbeat import Heartbeat, HeartbeatConfig
+    from src.level_6.interface import ServerInterface
+    from src.level_6.session import Session
+    from src.level_6.supervisor import SessionSupervisor
+
+__all__ = [
+    "Heartbeat",
+    "HeartbeatConfig",
+    "ServerInterface",
+    "Session",
+    "SessionSupervisor",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Heartbeat": "heartbeat",
+        "HeartbeatConfig": "heartbeat",
+        "ServerInterface": "interface",
+        "Session": "session",
+        "SessionSupervisor": "supervisor",
+    },
+)
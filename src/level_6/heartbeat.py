@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class HeartbeatConfig:
+    # An idle connection is probed every min_interval, which bounds how long a silent disconnect goes unnoticed. The
+    # default matches the one second poll loop, which a heartbeat never wakes up faster than.
+    min_interval: float = 1.0
+    max_interval: float = 5.0
+    backoff: float = 2.0
+
+
+class Heartbeat:
+    def __init__(self, config: HeartbeatConfig) -> None:
+        if not 0 < config.min_interval <= config.max_interval:
+            msg = "Heartbeat intervals must satisfy 0 < min_interval <= max_interval"
+            raise ValueError(msg)
+        if config.backoff < 1:
+            msg = "Heartbeat backoff must be at least 1"
+            raise ValueError(msg)
+        self.config = config
+        self.reset()
+
+    def reset(self) -> None:
+        self.interval = self.config.min_interval
+        self.last_activity = 0.0
+        self.last_check = time.monotonic()
+
+    def record_activity(self) -> None:
+        self.last_activity = time.monotonic()
+
+    def should_probe(self) -> bool:
+        # Traffic since the last check already proves the connection is alive, so a busy connection is not probed and
+        # its checks back off towards max_interval. An idle connection is probed, and checked again after min_interval.
+        now = time.monotonic()
+        active = self.last_activity >= self.last_check
+        self.last_check = now
+        if active:
+            self.interval = min(self.interval * self.config.backoff, self.config.max_interval)
+            return False
+        self.interval = self.config.min_interval
+        return True
@@ -1,11 +1,26 @@
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
+
+from src.tracing import span
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 class ServerInterface:
     def connect_to_server(self) -> bool:
-        logging.info("Called actual connect_to_server")
-        return True
+        with span("connect_to_server"):
+            logging.info("Called actual connect_to_server")
+            return True
 
     def is_server_connected(self) -> bool:
         logging.info("Called actual is_server_connected")
         return True
+
+    def add_disconnect_callback(self, callback: Callable[[], None]) -> None:
+        logging.info("Called actual add_disconnect_callback with %s", callback)
+
+    def remove_disconnect_callback(self, callback: Callable[[], None]) -> None:
+        logging.info("Called actual remove_disconnect_callback with %s", callback)
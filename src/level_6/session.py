@@ -1,22 +1,74 @@
+import threading
 import time
 
+from src.level_6.heartbeat import Heartbeat, HeartbeatConfig
 from src.level_6.interface import ServerInterface
 
 
 class Session:
     interface: ServerInterface
     connected: bool
+    heartbeat: Heartbeat | None
 
-    def __init__(self) -> None:
+    def __init__(self, heartbeat_config: HeartbeatConfig | None = None) -> None:
         self.interface = ServerInterface()
         self.connected = False
+        self.heartbeat = None if heartbeat_config is None else Heartbeat(heartbeat_config)
+        self.disconnected = threading.Event()
 
     def connect(self) -> None:
         self.connected = self.interface.connect_to_server()
 
+    def record_activity(self) -> None:
+        if self.heartbeat is not None:
+            self.heartbeat.record_activity()
+
     def start(self) -> None:
         self.connect()
         if not self.connected:
             return
-        while self.interface.is_server_connected():
-            time.sleep(1)
+        if self.heartbeat is None:
+            while self.interface.is_server_connected():
+                time.sleep(1)
+            self.connected = False
+            return
+        self.heartbeat.reset()
+        self.disconnected.clear()
+        self.interface.add_disconnect_callback(self.disconnected.set)
+        try:
+            while not self.disconnected.wait(self.heartbeat.interval):
+                if self.heartbeat.should_probe() and not self.interface.is_server_connected():
+                    break
+        finally:
+            self.interface.remove_disconnect_callback(self.disconnected.set)
+        self.connected = False
+
+    async def astart(self) -> None:
+        # Imported here so that only the callers of astart pay for importing asyncio
+        import asyncio
+
+        await asyncio.to_thread(self.connect)
+        if not self.connected:
+            return
+        heartbeat = self.heartbeat or Heartbeat(HeartbeatConfig(min_interval=1, max_interval=1))
+        heartbeat.reset()
+        loop = asyncio.get_running_loop()
+        disconnected = asyncio.Event()
+
+        def on_disconnect() -> None:
+            loop.call_soon_threadsafe(disconnected.set)
+
+        self.interface.add_disconnect_callback(on_disconnect)
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout(heartbeat.interval):
+                        await disconnected.wait()
+                    break
+                except TimeoutError:
+                    pass
+                if heartbeat.should_probe() and not await asyncio.to_thread(self.interface.is_server_connected):
+                    break
+        finally:
+            self.interface.remove_disconnect_callback(on_disconnect)
+        self.connected = False
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import functools
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.level_6.session import Session
+
+
+class SessionSupervisor:
+    # Sessions are probed one after the other on the supervisor thread, so a slow is_server_connected() delays the
+    # checks of every session due after it. Interfaces should bound their own probe with a timeout.
+    def __init__(self, interval: float = 1.0, on_disconnect: Callable[[Session], None] | None = None) -> None:
+        self.interval = interval
+        self.on_disconnect = on_disconnect
+        self._condition = threading.Condition()
+        # Min-heap of (next check time, sequence number, session). The sequence number keeps sessions out of the
+        # comparisons and tells live entries from those left behind by remove(), which are dropped when popped.
+        self._heap: list[tuple[float, int, Session]] = []
+        self._entries: dict[Session, int] = {}
+        self._callbacks: dict[Session, Callable[[], None]] = {}
+        self._sequence = itertools.count()
+        self._woken = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._entries)
+
+    def add(self, session: Session) -> None:
+        callback = functools.partial(self._disconnect, session)
+        with self._condition:
+            if session in self._entries:
+                return
+            self._schedule(session, time.monotonic() + self._interval_of(session))
+            self._callbacks[session] = callback
+            self._woken = True
+            self._condition.notify()
+        session.interface.add_disconnect_callback(callback)
+
+    def remove(self, session: Session) -> bool:
+        with self._condition:
+            if self._entries.pop(session, None) is None:
+                return False
+            callback = self._callbacks.pop(session)
+            if len(self._heap) > 2 * len(self._entries) + 64:
+                self._compact()
+        session.interface.remove_disconnect_callback(callback)
+        return True
+
+    def run_pending(self) -> float | None:
+        # Checks every session that is due and returns when the next check is due, None if there is nothing to check
+        while True:
+            with self._condition:
+                if not self._heap:
+                    return None
+                next_check, sequence, session = self._heap[0]
+                if self._entries.get(session) != sequence:
+                    heapq.heappop(self._heap)
+                    continue
+                if next_check > time.monotonic():
+                    return next_check
+                heapq.heappop(self._heap)
+            connected = self._check(session)
+            with self._condition:
+                if self._entries.get(session) != sequence:
+                    continue
+                if connected:
+                    self._schedule(session, time.monotonic() + self._interval_of(session))
+                    continue
+            self._disconnect(session)
+
+    def start(self) -> None:
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="SessionSupervisor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            thread = self._thread
+            self._thread = None
+            self._stopping = True
+            self._condition.notify()
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            next_check = self.run_pending()
+            with self._condition:
+                timeout = None if next_check is None else max(0.0, next_check - time.monotonic())
+                self._condition.wait_for(lambda: self._stopping or self._woken, timeout)
+                if self._stopping:
+                    return
+                self._woken = False
+
+    def _schedule(self, session: Session, next_check: float) -> None:
+        sequence = next(self._sequence)
+        self._entries[session] = sequence
+        heapq.heappush(self._heap, (next_check, sequence, session))
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if self._entries.get(entry[2]) == entry[1]]
+        heapq.heapify(self._heap)
+
+    def _interval_of(self, session: Session) -> float:
+        return self.interval if session.heartbeat is None else session.heartbeat.interval
+
+    def _check(self, session: Session) -> bool:
+        if session.heartbeat is not None and not session.heartbeat.should_probe():
+            return True
+        try:
+            return session.interface.is_server_connected()
+        except ConnectionError:
+            return False
+        except Exception:
+            # A probe that fails for any other reason counts as a disconnect rather than killing the supervisor thread
+            logging.exception("Connection check failed")
+            return False
+
+    def _disconnect(self, session: Session) -> None:
+        if not self.remove(session):
+            return
+        session.connected = False
+        if self.on_disconnect is not None:
+            try:
+                self.on_disconnect(session)
+            except Exception:
+                logging.exception("on_disconnect callback failed")
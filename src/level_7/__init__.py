@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src import lazy_attributes
+
+if TYPE_CHECKING:
+    from src.level_7.batching import BatchConfig, MessageBatcher
+    from src.level_7.dedup import DedupCache
+    from src.level_7.framing import FrameWriter, read_frames
+    from src.level_7.interface import ServerInterface
+    from src.level_7.lanes import LaneDispatcher, LaneStats
+    from src.level_7.session import Session
+    from src.level_7.streaming import SendResult
+
+__all__ = [
+    "BatchConfig",
+    "DedupCache",
+    "FrameWriter",
+    "LaneDispatcher",
+    "LaneStats",
+    "MessageBatcher",
+    "SendResult",
+    "ServerInterface",
+    "Session",
+    "read_frames",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "BatchConfig": "batching",
+        "MessageBatcher": "batching",
+        "DedupCache": "dedup",
+        "FrameWriter": "framing",
+        "read_frames": "framing",
+        "ServerInterface": "interface",
+        "LaneDispatcher": "lanes",
+        "LaneStats": "lanes",
+        "Session": "session",
+        "SendResult": "streaming",
+    },
+)
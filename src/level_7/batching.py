@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+@dataclass(frozen=True)
+class BatchConfig:
+    max_count: int = 100
+    max_bytes: int = 64 * 1024
+    # With no linger time, every send_messages call flushes what it buffered before returning
+    max_linger: float = 0.0
+
+
+def message_size(message: str) -> int:
+    # isascii is O(1) on str, so we only pay for an encode on non-ASCII messages
+    return len(message) if message.isascii() else len(message.encode())
+
+
+class MessageBatcher:
+    def __init__(self, send_batch: Callable[[list[str]], None], config: BatchConfig) -> None:
+        if config.max_count < 1 or config.max_bytes < 1:
+            msg = "max_count and max_bytes must be at least 1"
+            raise ValueError(msg)
+        self.send_batch = send_batch
+        self.config = config
+        self._lock = threading.RLock()
+        self._buffer: list[str] = []
+        self._buffer_bytes = 0
+        self._timer: threading.Timer | None = None
+        self._linger_error: Exception | None = None
+        self.batches_sent = 0
+        self.messages_sent = 0
+
+    def add(self, message: str) -> None:
+        size = message_size(message)
+        with self._lock:
+            self._raise_linger_error_locked()
+            if self._buffer and (
+                len(self._buffer) >= self.config.max_count or self._buffer_bytes + size > self.config.max_bytes
+            ):
+                self._flush_locked()
+            self._buffer.append(message)
+            self._buffer_bytes += size
+            if len(self._buffer) >= self.config.max_count or self._buffer_bytes >= self.config.max_bytes:
+                self._flush_locked()
+            elif self.config.max_linger > 0 and self._timer is None:
+                self._timer = threading.Timer(self.config.max_linger, self._flush_after_linger)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def extend(self, messages: Iterable[str]) -> None:
+        for message in messages:
+            self.add(message)
+        if self.config.max_linger == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._raise_linger_error_locked()
+            self._flush_locked()
+
+    def close(self) -> None:
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def _flush_after_linger(self) -> None:
+        with self._lock:
+            batch = self._buffer
+            try:
+                self._flush_locked()
+            except Exception as error:  # noqa: BLE001
+                # Nobody waits on the timer thread, so the batch is kept for the next flush and the error is
+                # raised to the next caller instead of being lost with the thread
+                self._buffer = batch + self._buffer
+                self._buffer_bytes = sum(message_size(message) for message in self._buffer)
+                self._linger_error = error
+
+    def _raise_linger_error_locked(self) -> None:
+        if self._linger_error is None:
+            return
+        error = self._linger_error
+        self._linger_error = None
+        raise error
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        batch = self._buffer
+        self._buffer = []
+        self._buffer_bytes = 0
+        # The lock is held while sending so that batches reach the interface in order
+        self.send_batch(batch)
+        self.batches_sent += 1
+        self.messages_sent += len(batch)
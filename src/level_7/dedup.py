@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+def fingerprint(message: str) -> bytes:
+    # 16 bytes per entry whatever the message size, and too wide for two distinct messages to collide in practice
+    return hashlib.blake2b(message.encode(), digest_size=16).digest()
+
+
+class DedupCache:
+    def __init__(self, max_size: int = 100_000, window: float = 10.0) -> None:
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+        if window <= 0:
+            msg = "window must be positive"
+            raise ValueError(msg)
+        self.max_size = max_size
+        self.window = window
+        self._lock = threading.Lock()
+        # Fingerprints in the order they were first seen, with the time they were first seen. The window runs from the
+        # first sighting, so repeats can't keep a message suppressed forever, and the oldest entries are always at the
+        # front for both kinds of eviction.
+        self._seen: OrderedDict[bytes, float] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def seen(self, message: str) -> bool:
+        key = fingerprint(message)
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            if key in self._seen:
+                self.hits += 1
+                return True
+            self.misses += 1
+            self._seen[key] = now
+            if len(self._seen) > self.max_size:
+                self._seen.popitem(last=False)
+                self.evictions += 1
+            return False
+
+    def filter(self, messages: Iterable[str]) -> Iterator[str]:
+        for message in messages:
+            if not self.seen(message):
+                yield message
+
+    def forget(self, messages: Iterable[str]) -> None:
+        # For messages that were let through but failed to send, so that their retry isn't dropped as a duplicate
+        keys = [fingerprint(message) for message in messages]
+        with self._lock:
+            for key in keys:
+                self._seen.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._seen.clear()
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        seen = self._seen
+        while seen:
+            key, first_seen = next(iter(seen.items()))
+            if first_seen > cutoff:
+                return
+            del seen[key]
+            self.expirations += 1
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    Buffer = bytes | bytearray | memoryview
+
+# Every frame is a 4 bytes big-endian payload length, 1 byte of flags and the payload
+HEADER = struct.Struct("!IB")
+FLAG_COMPRESSED = 0x01
+
+
+class FrameWriter:
+    def __init__(
+        self,
+        capacity: int = 64 * 1024,
+        compress: Callable[[Buffer], bytes] | None = None,
+        compress_threshold: int = 16 * 1024,
+    ) -> None:
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._size = 0
+        self.compress = compress
+        self.compress_threshold = compress_threshold
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    def fits(self, payload: Buffer) -> bool:
+        return self._size + HEADER.size + memoryview(payload).nbytes <= len(self._buffer)
+
+    def write(self, payload: Buffer, flags: int = 0) -> None:
+        view = memoryview(payload)
+        if view.format != "B":
+            view = view.cast("B")
+        length = view.nbytes
+        end = self._size + HEADER.size + length
+        if end > len(self._buffer):
+            self._grow(end)
+        HEADER.pack_into(self._buffer, self._size, length, flags)
+        # Slice assignment copies straight from the payload's buffer, no intermediate bytes object is created
+        self._view[self._size + HEADER.size : end] = view
+        self._size = end
+
+    def getbuffer(self) -> Buffer:
+        # The returned view aliases the internal buffer: it is only valid until the next write or clear
+        frames = self._view[: self._size]
+        if self.compress is None or self._size < self.compress_threshold:
+            return frames
+        compressed = self.compress(frames)
+        return HEADER.pack(len(compressed), FLAG_COMPRESSED) + compressed
+
+    def clear(self) -> None:
+        self._size = 0
+
+    def _grow(self, minimum: int) -> None:
+        # A bytearray can't be resized while a memoryview of it exists, so we move to a new one instead
+        buffer = bytearray(max(minimum, 2 * len(self._buffer)))
+        buffer[: self._size] = self._view[: self._size]
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+
+
+def read_frames(data: Buffer, decompress: Callable[[Buffer], bytes] | None = None) -> Iterator[memoryview]:
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        length, flags = HEADER.unpack_from(view, offset)
+        offset += HEADER.size
+        payload = view[offset : offset + length]
+        offset += length
+        if flags & FLAG_COMPRESSED:
+            if decompress is None:
+                msg = "Received a compressed frame without a decompressor"
+                raise ValueError(msg)
+            yield from read_frames(decompress(payload))
+        else:
+            yield payload
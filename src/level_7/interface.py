@@ -1,6 +1,17 @@
 import logging
 
+from src.tracing import span
+
 
 class ServerInterface:
     def send_message(self, message: str) -> None:
-        logging.info(f"Calling actual send_message with {message}")
+        with span("send_message"):
+            logging.info("Calling actual send_message with %s", message)
+
+    def send_messages_batch(self, messages: list[str]) -> None:
+        with span("send_messages_batch"):
+            logging.info("Calling actual send_messages_batch with %d messages", len(messages))
+
+    def send_bytes(self, data: bytes | bytearray | memoryview) -> None:
+        with span("send_bytes"):
+            logging.info("Calling actual send_bytes with %d bytes", len(data))
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+    from types import TracebackType
+
+MAX_REPORTED_ERRORS = 10
+
+
+@dataclass(frozen=True)
+class LaneStats:
+    # Messages waiting or being sent
+    depth: int
+    max_depth: int
+    sent: int
+    failed: int
+
+
+class _Lane:
+    __slots__ = ("failed", "in_flight", "max_depth", "queue", "running", "sent")
+
+    def __init__(self) -> None:
+        self.queue: deque[str] = deque()
+        self.in_flight = 0
+        self.running = False
+        self.max_depth = 0
+        self.sent = 0
+        self.failed = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self.queue) + self.in_flight
+
+
+class LaneDispatcher:
+    # Messages with the same key always go to the same lane, and a lane is drained by at most one pool thread at a
+    # time, so messages are sent in submission order within a key while the lanes send in parallel
+    def __init__(
+        self,
+        send: Callable[[str], None],
+        key: Callable[[str], Hashable],
+        lanes: int = 8,
+        max_depth: int | None = None,
+    ) -> None:
+        if lanes < 1:
+            msg = "lanes must be at least 1"
+            raise ValueError(msg)
+        if max_depth is not None and max_depth < 1:
+            msg = "max_depth must be at least 1"
+            raise ValueError(msg)
+        self.send = send
+        self.key = key
+        self.max_depth = max_depth
+        self.errors: list[tuple[str, BaseException]] = []
+        self._lanes = [_Lane() for _ in range(lanes)]
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=lanes, thread_name_prefix="LaneDispatcher")
+        self._closed = False
+
+    def submit(self, message: str) -> None:
+        lane = self._lanes[hash(self.key(message)) % len(self._lanes)]
+        with self._condition:
+            # Blocks while the lane is full, so a slow lane pushes back on the producer instead of growing unbounded.
+            # The dispatcher may be closed while waiting, so that is checked again on every wake up.
+            while True:
+                if self._closed:
+                    msg = "Cannot submit to a closed dispatcher"
+                    raise RuntimeError(msg)
+                if self.max_depth is None or lane.depth < self.max_depth:
+                    break
+                self._condition.wait()
+            lane.queue.append(message)
+            lane.max_depth = max(lane.max_depth, lane.depth)
+            if lane.running:
+                return
+            lane.running = True
+        self._executor.submit(self._drain, lane)
+
+    def submit_many(self, messages: Iterable[str]) -> None:
+        for message in messages:
+            self.submit(message)
+
+    def flush(self) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: not any(lane.running for lane in self._lanes))
+
+    def stats(self) -> list[LaneStats]:
+        with self._condition:
+            return [LaneStats(lane.depth, lane.max_depth, lane.sent, lane.failed) for lane in self._lanes]
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self.flush()
+        self._executor.shutdown()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def _drain(self, lane: _Lane) -> None:
+        while True:
+            # Everything queued so far is taken at once, so the lock is taken once per batch rather than per message
+            with self._condition:
+                if not lane.queue:
+                    lane.running = False
+                    self._condition.notify_all()
+                    return
+                batch = list(lane.queue)
+                lane.queue.clear()
+                lane.in_flight = len(batch)
+            failures: list[tuple[str, BaseException]] = []
+            for message in batch:
+                try:
+                    self.send(message)
+                except Exception as e:  # noqa: BLE001
+                    failures.append((message, e))
+            with self._condition:
+                lane.in_flight = 0
+                lane.sent += len(batch) - len(failures)
+                lane.failed += len(failures)
+                self.errors.extend(failures[: MAX_REPORTED_ERRORS - len(self.errors)])
+                self._condition.notify_all()
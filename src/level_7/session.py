@@ -1,12 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.level_7.batching import MessageBatcher
+from src.level_7.framing import FrameWriter
 from src.level_7.interface import ServerInterface
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Callable, Hashable, Iterable, Iterator
+
+    from src.level_7.batching import BatchConfig
+    from src.level_7.dedup import DedupCache
+    from src.level_7.lanes import LaneDispatcher
+    from src.level_7.streaming import SendResult
+
 
 class Session:
     interface: ServerInterface
+    batcher: MessageBatcher | None
 
-    def __init__(self, interface: ServerInterface) -> None:
+    def __init__(
+        self,
+        interface: ServerInterface,
+        batch_config: BatchConfig | None = None,
+        dedup_cache: DedupCache | None = None,
+        frame_writer: FrameWriter | None = None,
+    ) -> None:
         self.interface = interface
+        self.batcher = None if batch_config is None else MessageBatcher(self.send_batch, batch_config)
+        # A writer of our own lets send_payloads compress, or use a buffer sized for the payloads
+        self.frame_writer = FrameWriter() if frame_writer is None else frame_writer
+        # Only send_messages, batched or not, drops duplicates. The payload, streaming and lane paths send everything
+        # they are given.
+        self.dedup_cache = dedup_cache
 
-    def send_messages(self, messages: list[str]) -> None:
+    def send_messages(self, messages: Iterable[str]) -> None:
+        if self.dedup_cache is not None:
+            messages = self.dedup_cache.filter(messages)
+        if self.batcher is not None:
+            self.batcher.extend(messages)
+            return
         for message in messages:
-            self.interface.send_message(message)
+            try:
+                self.interface.send_message(message)
+            except BaseException:
+                self._forget([message])
+                raise
+
+    def send_payloads(self, payloads: Iterable[bytes | bytearray | memoryview]) -> None:
+        # Payloads are framed into the session's reusable buffer, which is sent whenever the next payload wouldn't fit.
+        # The interface must be done with the buffer when send_bytes returns.
+        writer = self.frame_writer
+        for payload in payloads:
+            if writer.size and not writer.fits(payload):
+                self.interface.send_bytes(writer.getbuffer())
+                writer.clear()
+            writer.write(payload)
+        if writer.size:
+            self.interface.send_bytes(writer.getbuffer())
+            writer.clear()
+
+    def stream_messages(self, messages: Iterable[str], window: int = 1) -> Iterator[SendResult]:
+        # The streaming module pulls in asyncio and concurrent.futures, so it is only imported when streaming is used
+        from src.level_7.streaming import stream_send
+
+        return stream_send(self.interface.send_message, messages, window)
+
+    def astream_messages(
+        self, messages: AsyncIterable[str] | Iterable[str], window: int = 1
+    ) -> AsyncIterator[SendResult]:
+        from src.level_7.streaming import astream_send
+
+        return astream_send(self.interface.send_message, messages, window)
+
+    def lane_dispatcher(
+        self, key: Callable[[str], Hashable], lanes: int = 8, max_depth: int | None = None
+    ) -> LaneDispatcher:
+        # Only ordered within a key: messages with different keys may be sent in any order
+        from src.level_7.lanes import LaneDispatcher
+
+        return LaneDispatcher(self.interface.send_message, key, lanes, max_depth)
+
+    def send_batch(self, messages: list[str]) -> None:
+        send_messages_batch = getattr(self.interface, "send_messages_batch", None)
+        if send_messages_batch is not None:
+            try:
+                send_messages_batch(messages)
+            except BaseException:
+                self._forget(messages)
+                raise
+            return
+        for index, message in enumerate(messages):
+            try:
+                self.interface.send_message(message)
+            except BaseException:
+                self._forget(messages[index:])
+                raise
+
+    def flush(self) -> None:
+        if self.batcher is not None:
+            self.batcher.flush()
+
+    def _forget(self, messages: list[str]) -> None:
+        if self.dedup_cache is not None:
+            self.dedup_cache.forget(messages)
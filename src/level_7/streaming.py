@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+
+
+@dataclass(frozen=True)
+class SendResult:
+    index: int
+    message: str
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def send_one(send: Callable[[str], None], index: int, message: str) -> SendResult:
+    try:
+        send(message)
+    except Exception as e:  # noqa: BLE001
+        return SendResult(index, message, e)
+    return SendResult(index, message)
+
+
+def stream_send(send: Callable[[str], None], messages: Iterable[str], window: int = 1) -> Iterator[SendResult]:
+    # Messages are pulled from the iterable only when there is room in the window, so memory stays bounded by the
+    # window whatever the size of the input. Results are yielded in input order. Sends only happen one at a time, in
+    # order, with a window of 1.
+    if window < 1:
+        msg = "window must be at least 1"
+        raise ValueError(msg)
+    if window == 1:
+        for index, message in enumerate(messages):
+            yield send_one(send, index, message)
+        return
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        in_flight: deque[Future[SendResult]] = deque()
+        for index, message in enumerate(messages):
+            if len(in_flight) >= window:
+                yield in_flight.popleft().result()
+            in_flight.append(executor.submit(send_one, send, index, message))
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+async def _aiterate(messages: AsyncIterable[str] | Iterable[str]) -> AsyncIterator[str]:
+    if isinstance(messages, AsyncIterable):
+        async for message in messages:
+            yield message
+    else:
+        for message in messages:
+            yield message
+
+
+async def astream_send(
+    send: Callable[[str], None], messages: AsyncIterable[str] | Iterable[str], window: int = 1
+) -> AsyncIterator[SendResult]:
+    if window < 1:
+        msg = "window must be at least 1"
+        raise ValueError(msg)
+    # A dedicated executor, as in stream_send: the loop's default executor would cap the window at its own size
+    executor = ThreadPoolExecutor(max_workers=window)
+    loop = asyncio.get_running_loop()
+    in_flight: deque[asyncio.Future[SendResult]] = deque()
+    index = 0
+    try:
+        async for message in _aiterate(messages):
+            if len(in_flight) >= window:
+                yield await in_flight.popleft()
+            in_flight.append(loop.run_in_executor(executor, send_one, send, index, message))
+            index += 1
+        while in_flight:
+            yield await in_flight.popleft()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        # Sends already running are left to finish in the background rather than blocking the event loop
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src import lazy_attributes
+
+if TYPE_CHECKING:
+    from src.level_8.endpoints import connect_first
+    from src.level_8.interface import ServerInterface
+    from src.level_8.resilience import CircuitBreaker, CircuitState, RetryPolicy
+    from src.level_8.session import Session, SessionError
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitState",
+    "RetryPolicy",
+    "ServerInterface",
+    "Session",
+    "SessionError",
+    "connect_first",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "connect_first": "endpoints",
+        "ServerInterface": "interface",
+        "CircuitBreaker": "resilience",
+        "CircuitState": "resilience",
+        "RetryPolicy": "resilience",
+        "Session": "session",
+        "SessionError": "session",
+    },
+)
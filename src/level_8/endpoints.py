@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from src.level_8.interface import ServerInterface
+
+MAX_ATTEMPT_THREADS = 32
+
+# connect_to_server can't be interrupted, so an attempt that hangs keeps its thread. Sharing one bounded pool across
+# races caps how many such threads can pile up, instead of every race leaving its own behind.
+_executor = ThreadPoolExecutor(max_workers=MAX_ATTEMPT_THREADS, thread_name_prefix="connect_first")
+
+
+class _Race:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.winner: ServerInterface | None = None
+        self.finished = False
+        self.outcomes: queue.SimpleQueue[tuple[ServerInterface, BaseException | None]] = queue.SimpleQueue()
+
+    def attempt(self, interface: ServerInterface) -> None:
+        try:
+            connected = interface.connect_to_server()
+        except ConnectionError:
+            connected = False
+        except Exception as error:  # noqa: BLE001 - re-raised by connect_first
+            self.outcomes.put((interface, error))
+            return
+        with self.lock:
+            won = connected and not self.finished
+            if won:
+                self.winner = interface
+                self.finished = True
+        # A connection that lost the race, or finished after the caller gave up, would otherwise leak
+        if connected and not won:
+            interface.disconnect()
+        self.outcomes.put((interface, None))
+
+    def finish(self) -> ServerInterface | None:
+        with self.lock:
+            self.finished = True
+            return self.winner
+
+
+def connect_first(
+    interfaces: Sequence[ServerInterface], stagger: float = 0.25, timeout: float | None = 30.0
+) -> ServerInterface | None:
+    # Attempts start one after the other, each stagger seconds after the previous one or as soon as the previous one
+    # fails, so a slow endpoint only delays the connection by stagger. The first endpoint to connect is returned and
+    # the others are never started or are disconnected when they connect. The race gives up after timeout seconds,
+    # as an attempt queued behind hung ones in the shared pool might otherwise never start.
+    _check_durations(stagger, timeout)
+    if not interfaces:
+        return None
+    deadline = None if timeout is None else time.monotonic() + timeout
+    race = _Race()
+    attempts: list[Future[None]] = []
+    try:
+        pending = 0
+        for index, interface in enumerate(interfaces):
+            attempts.append(_executor.submit(race.attempt, interface))
+            pending += 1
+            last = index == len(interfaces) - 1
+            while pending:
+                try:
+                    _, error = race.outcomes.get(timeout=_wait_time(deadline, None if last else stagger))
+                except queue.Empty:
+                    break
+                pending -= 1
+                if error is not None:
+                    winner = race.finish()
+                    if winner is not None:
+                        winner.disconnect()
+                    raise error
+                if race.winner is not None or not last:
+                    break
+            if race.winner is not None or _wait_time(deadline, None) == 0:
+                break
+    finally:
+        _cancel(attempts)
+    return race.finish()
+
+
+def _check_durations(stagger: float, timeout: float | None) -> None:
+    if stagger < 0:
+        msg = "stagger must not be negative"
+        raise ValueError(msg)
+    if timeout is not None and timeout < 0:
+        msg = "timeout must not be negative"
+        raise ValueError(msg)
+
+
+def _wait_time(deadline: float | None, stagger: float | None) -> float | None:
+    if deadline is None:
+        return stagger
+    remaining = max(0.0, deadline - time.monotonic())
+    return remaining if stagger is None else min(stagger, remaining)
+
+
+def _cancel(attempts: list[Future[None]]) -> None:
+    # Attempts still queued behind busy threads are dropped, the running ones are closed by the race if they connect
+    for attempt in attempts:
+        attempt.cancel()
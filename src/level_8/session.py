@@ -1,5 +1,13 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
 from src.level_8.interface import ServerInterface
 
+if TYPE_CHECKING:
+    from src.level_8.resilience import CircuitBreaker, RetryPolicy
+
 
 class SessionError(Exception):
     pass
@@ -13,12 +21,62 @@ class Session:
         self.interface = ServerInterface()
         self.connected = False
         self.ignore_connection_errors = False
+        # Without a retry policy a single attempt is made, so plain sessions don't import the resilience module
+        self.retry_policy: RetryPolicy | None = None
+        self.circuit_breaker: CircuitBreaker | None = None
+        self.endpoints: list[ServerInterface] = []
+        self.connect_stagger = 0.25
+        self.connect_timeout: float | None = 30.0
 
     def connect(self) -> None:
-        try:
-            self.connected = self.interface.connect_to_server()
-        except ConnectionError:
-            self.connected = False
+        self.connected = self.connect_with_retries()
         if not self.connected and not self.ignore_connection_errors:
             msg = "Failed to connect to server"
             raise SessionError(msg)
+
+    def connect_with_retries(self) -> bool:
+        policy = self.retry_policy
+        max_attempts = 1 if policy is None else policy.max_attempts
+        deadline = None if policy is None or policy.deadline is None else time.monotonic() + policy.deadline
+        for attempt in range(max_attempts):
+            if self.circuit_breaker is not None and not self.circuit_breaker.allow_request():
+                return False
+            if self.connect_once():
+                return True
+            if policy is None or attempt == max_attempts - 1:
+                break
+            delay = policy.backoff(attempt)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                break
+            time.sleep(delay)
+        return False
+
+    def connect_once(self) -> bool:
+        try:
+            connected = self.connect_endpoints() if self.endpoints else self.interface.connect_to_server()
+        except ConnectionError:
+            connected = False
+        except BaseException:
+            # Any other error still counts as a failure, or a half-open breaker would wait forever for its probe
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
+            raise
+        if self.circuit_breaker is not None:
+            if connected:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+        return connected
+
+    def connect_endpoints(self) -> bool:
+        # Imported here so that sessions with a single endpoint don't pay for importing concurrent.futures
+        from src.level_8.endpoints import connect_first
+
+        # The current interface leads the race and the endpoints are the alternatives. The winner becomes the interface,
+        # so the last endpoint that worked is tried first next time.
+        candidates = [self.interface, *(endpoint for endpoint in self.endpoints if endpoint is not self.interface)]
+        winner = connect_first(candidates, self.connect_stagger, self.connect_timeout)
+        if winner is None:
+            return False
+        self.interface = winner
+        return True
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class PooledConnection(Protocol):
+    # Set by the pool that created the connection, None once the connection has left it
+    pool: Any
+    last_used: float
+
+    def is_healthy(self) -> bool: ...
+
+    def close(self) -> None: ...
+
+
+ConnectionT = TypeVar("ConnectionT", bound=PooledConnection)
+
+
+class PoolTimeoutError(TimeoutError):
+    pass
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    idle: int
+    in_use: int
+    waiters: int
+    checkouts: int
+    timeouts: int
+    total_wait_time: float
+    max_wait_time: float
+
+
+class ConnectionPool(Generic[ConnectionT]):
+    def __init__(
+        self,
+        connection_factory: Callable[[], ConnectionT],
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_idle_time: float = 300.0,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle_time = max_idle_time
+        self.health_check_interval = health_check_interval
+        self.connection_factory = connection_factory
+        self._condition = threading.Condition()
+        self._idle: deque[ConnectionT] = deque()
+        self._closed = False
+        self._size = 0
+        self._in_use = 0
+        self._waiters = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def acquire(self, timeout: float | None = None) -> ConnectionT:
+        start = time.monotonic()
+        deadline = start + (self.timeout if timeout is None else timeout)
+        while True:
+            conn, create = self._checkout(start, deadline)
+            if create:
+                return self._create()
+            if conn is not None and self._is_usable(conn):
+                return conn
+
+    def release(self, conn: ConnectionT) -> None:
+        conn.last_used = time.monotonic()
+        with self._condition:
+            if not self._closed:
+                self._in_use -= 1
+                self._idle.append(conn)
+                self._condition.notify()
+                return
+        # Cs returned after close are closed rather than kept idle in a pool nobody will drain again
+        self.discard(conn)
+
+    def discard(self, conn: ConnectionT) -> None:
+        with self._condition:
+            self._in_use -= 1
+            self._size -= 1
+            self._condition.notify()
+        conn.pool = None
+        conn.close()
+
+    def evict_idle(self) -> int:
+        cutoff = time.monotonic() - self.max_idle_time
+        with self._condition:
+            # Cs are released to the right, so the stalest ones are always on the left
+            evicted: list[ConnectionT] = []
+            while self._idle and self._idle[0].last_used < cutoff:
+                evicted.append(self._idle.popleft())
+            if not evicted:
+                return 0
+            self._size -= len(evicted)
+            self._condition.notify(len(evicted))
+        for conn in evicted:
+            conn.pool = None
+            conn.close()
+        return len(evicted)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for conn in idle:
+            conn.pool = None
+            conn.close()
+
+    def stats(self) -> PoolStats:
+        with self._condition:
+            return PoolStats(
+                size=self._size,
+                idle=len(self._idle),
+                in_use=self._in_use,
+                waiters=self._waiters,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                total_wait_time=self._total_wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    def _checkout(self, start: float, deadline: float) -> tuple[ConnectionT | None, bool]:
+        self.evict_idle()
+        with self._condition:
+            self._waiters += 1
+            try:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._condition.wait(remaining):
+                        self._timeouts += 1
+                        msg = f"Timed out waiting for a connection after {time.monotonic() - start:.3f}s"
+                        raise PoolTimeoutError(msg)
+            finally:
+                self._waiters -= 1
+            wait_time = time.monotonic() - start
+            self._checkouts += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+            self._in_use += 1
+            if self._idle:
+                return self._idle.pop(), False
+            self._size += 1
+            return None, True
+
+    def _create(self) -> ConnectionT:
+        try:
+            conn = self.connection_factory()
+        except BaseException:
+            with self._condition:
+                self._in_use -= 1
+                self._size -= 1
+                self._condition.notify()
+            raise
+        conn.pool = self
+        return conn
+
+    def _is_usable(self, conn: ConnectionT) -> bool:
+        if time.monotonic() - conn.last_used < self.health_check_interval:
+            return True
+        try:
+            healthy = conn.is_healthy()
+        except Exception:  # noqa: BLE001
+            # A health check that fails counts as unhealthy, the connection is discarded and the next one is tried
+            healthy = False
+        except BaseException:
+            self.discard(conn)
+            raise
+        if healthy:
+            return True
+        self.discard(conn)
+        return False
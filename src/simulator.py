@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import importlib
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol, Self
+
+from src.tracing import span
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from types import TracebackType
+
+    Latency = Callable[[random.Random], float]
+
+    class ConnectionPoolLike(Protocol):
+        def release(self, conn: SimulatedConnection) -> None: ...
+
+        def discard(self, conn: SimulatedConnection) -> None: ...
+
+
+def no_latency(_: random.Random) -> float:
+    return 0.0
+
+
+def fixed(seconds: float) -> Latency:
+    return lambda _: seconds
+
+
+def uniform(low: float, high: float) -> Latency:
+    return lambda rng: rng.uniform(low, high)
+
+
+def exponential(mean: float) -> Latency:
+    return lambda rng: rng.expovariate(1 / mean)
+
+
+def lognormal(median: float, sigma: float) -> Latency:
+    # Heavy tailed like real network latency: half the calls are faster than median, a few are much slower
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+@dataclass(frozen=True)
+class SimulatorConfig:
+    latency: Latency = no_latency
+    # Probability that a call fails by returning False, or by raising a ConnectionError
+    failure_rate: float = 0.0
+    error_rate: float = 0.0
+    # Probability that a connection probe finds the connection lost
+    disconnect_rate: float = 0.0
+    # Maximum number of calls in flight at once, calls beyond it are refused with a ConnectionError
+    capacity: int | None = None
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("failure_rate", "error_rate", "disconnect_rate"):
+            if not 0 <= getattr(self, name) <= 1:
+                msg = f"{name} must be between 0 and 1"
+                raise ValueError(msg)
+        if self.failure_rate + self.error_rate > 1:
+            msg = "failure_rate + error_rate must not exceed 1"
+            raise ValueError(msg)
+        if self.capacity is not None and self.capacity < 1:
+            msg = "capacity must be at least 1"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True)
+class SimulatorStats:
+    calls: int
+    failures: int
+    errors: int
+    rejected: int
+    in_flight: int
+    max_in_flight: int
+
+
+class ServerSimulator:
+    def __init__(self, config: SimulatorConfig | None = None) -> None:
+        self.config = config or SimulatorConfig()
+        self._random = random.Random(self.config.seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._failures = 0
+        self._errors = 0
+        self._rejected = 0
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+    def call(self, failure_rate: float | None = None) -> bool:
+        self._enter()
+        ok: bool | None = None
+        try:
+            delay = self.config.latency(self._random)
+            if delay > 0:
+                time.sleep(delay)
+            ok = self._outcome(self.config.failure_rate if failure_rate is None else failure_rate)
+        finally:
+            self._exit(ok)
+        return ok
+
+    async def acall(self, failure_rate: float | None = None) -> bool:
+        # Imported here so that only the async callers pay for importing asyncio
+        import asyncio
+
+        self._enter()
+        ok: bool | None = None
+        try:
+            delay = self.config.latency(self._random)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            ok = self._outcome(self.config.failure_rate if failure_rate is None else failure_rate)
+        finally:
+            self._exit(ok)
+        return ok
+
+    def probe(self) -> bool:
+        return self.call(self.config.disconnect_rate)
+
+    def stats(self) -> SimulatorStats:
+        with self._lock:
+            return SimulatorStats(
+                calls=self._calls,
+                failures=self._failures,
+                errors=self._errors,
+                rejected=self._rejected,
+                in_flight=self._in_flight,
+                max_in_flight=self._max_in_flight,
+            )
+
+    def _enter(self) -> None:
+        capacity = self.config.capacity
+        with self._lock:
+            self._calls += 1
+            if capacity is not None and self._in_flight >= capacity:
+                self._rejected += 1
+                msg = "Server at capacity"
+                raise ConnectionError(msg)
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+
+    def _exit(self, ok: bool | None) -> None:
+        # ok is None when the call raised instead of returning
+        with self._lock:
+            self._in_flight -= 1
+            if ok is None:
+                self._errors += 1
+            elif not ok:
+                self._failures += 1
+
+    def _outcome(self, failure_rate: float) -> bool:
+        # A single draw decides the outcome, and none at all with the default rates
+        error_rate = self.config.error_rate
+        if not error_rate and not failure_rate:
+            return True
+        roll = self._random.random()
+        if roll < error_rate:
+            msg = "Simulated connection error"
+            raise ConnectionError(msg)
+        return roll >= error_rate + failure_rate
+
+
+class SimulatedInterface:
+    # Stands in for the ServerInterface of every level, and for the level 1 connect_to_server function
+    def __init__(self, simulator: ServerSimulator) -> None:
+        self.simulator = simulator
+        self.connected = False
+        self._callbacks: list[Callable[[], None]] = []
+
+    def connect_to_server(self) -> bool:
+        with span("connect_to_server"):
+            self.connected = self.simulator.call()
+            return self.connected
+
+    async def aconnect_to_server(self) -> bool:
+        with span("aconnect_to_server"):
+            self.connected = await self.simulator.acall()
+            return self.connected
+
+    def is_server_connected(self) -> bool:
+        if self.connected and not self.simulator.probe():
+            self.connected = False
+        return self.connected
+
+    def disconnect(self) -> bool:
+        self.connected = False
+        return True
+
+    def drop(self) -> None:
+        # Simulates the server closing the connection
+        self.connected = False
+        for callback in list(self._callbacks):
+            callback()
+
+    def add_disconnect_callback(self, callback: Callable[[], None]) -> None:
+        self._callbacks.append(callback)
+
+    def remove_disconnect_callback(self, callback: Callable[[], None]) -> None:
+        with contextlib.suppress(ValueError):
+            self._callbacks.remove(callback)
+
+    def send_message(self, message: str) -> None:
+        with span("send_message"):
+            self._send(len(message))
+
+    def send_messages_batch(self, messages: list[str]) -> None:
+        with span("send_messages_batch"):
+            self._send(len(messages))
+
+    def send_bytes(self, data: bytes | bytearray | memoryview) -> None:
+        with span("send_bytes"):
+            self._send(len(data))
+
+    def _send(self, size: int) -> None:
+        if not self.simulator.call():
+            msg = f"Simulated failure sending {size}"
+            raise ConnectionError(msg)
+
+
+class SimulatedConnection:
+    # Stands in for the level 4 and level 5 database Connection, and is pooled the same way
+    def __init__(self, simulator: ServerSimulator) -> None:
+        self.simulator = simulator
+        self.pool: ConnectionPoolLike | None = None
+        self.last_used = time.monotonic()
+
+    def begin(self) -> None:
+        with span("begin"):
+            self._execute("begin")
+
+    def commit(self) -> None:
+        with span("commit"):
+            self._execute("commit")
+
+    def write_many(self, rows: Iterable[tuple[object, ...]]) -> int:
+        with span("write_many"):
+            self._execute("write_many")
+            return sum(1 for _ in rows)
+
+    def is_healthy(self) -> bool:
+        return self.simulator.probe()
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if self.pool is None:
+            return
+        # Same as the real connections: one that failed mid-transaction is not handed to anyone else
+        if exc_type is not None:
+            self.pool.discard(self)
+        else:
+            self.pool.release(self)
+
+    def _execute(self, operation: str) -> None:
+        if not self.simulator.call():
+            msg = f"Simulated database failure in {operation}"
+            raise ConnectionError(msg)
+
+
+@contextlib.contextmanager
+def simulate(server: ServerSimulator | None = None, database: ServerSimulator | None = None) -> Iterator[None]:
+    # Sessions of the levels that build their own interface get simulated ones, and the level 4 and 5 Database pools
+    # hand out simulated connections. Levels 2, 3 and 7 take their interface as an argument: pass a SimulatedInterface.
+    replaced: list[tuple[object, str, object]] = []
+
+    def replace(target: object, name: str, value: object) -> None:
+        replaced.append((target, name, getattr(target, name)))
+        setattr(target, name, value)
+
+    pools = []
+    try:
+        if server is not None:
+            replace(
+                importlib.import_module("src.level_1.session"),
+                "connect_to_server",
+                SimulatedInterface(server).connect_to_server,
+            )
+            for level in (4, 5, 6, 8):
+                session = importlib.import_module(f"src.level_{level}.session")
+                replace(session, "ServerInterface", functools.partial(SimulatedInterface, server))
+        if database is not None:
+            for level in (4, 5):
+                module = importlib.import_module(f"src.level_{level}.database")
+                pool = module.ConnectionPool(connection_factory=functools.partial(SimulatedConnection, database))
+                pools.append(pool)
+                replace(module.Database, "pool", pool)
+        yield
+    finally:
+        for target, name, value in reversed(replaced):
+            setattr(target, name, value)
+        for pool in pools:
+            pool.close()
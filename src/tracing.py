@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from typing import TYPE_CHECKING, Protocol, Self
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+class Tracer(Protocol):
+    def record(self, name: str, duration: float, error: BaseException | None) -> None: ...
+
+
+_tracer: Tracer | None = None
+_NOOP_SPAN = contextlib.nullcontext()
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    global _tracer  # noqa: PLW0603
+    _tracer = tracer
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+class Span:
+    __slots__ = ("name", "start", "tracer")
+
+    def __init__(self, name: str, tracer: Tracer) -> None:
+        self.name = name
+        self.tracer = tracer
+        self.start = 0.0
+
+    def __enter__(self) -> Self:
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.tracer.record(self.name, time.perf_counter() - self.start, exc_value)
+
+
+def span(name: str) -> contextlib.AbstractContextManager[object]:
+    # With no tracer installed this is a global lookup and a shared no-op context manager: nothing is timed,
+    # allocated or formatted
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return Span(name, tracer)
+
+
+# Not a dataclass: this module is imported by every interface and dataclasses would add inspect to their import time
+class SpanMetrics:
+    __slots__ = ("buckets", "count", "errors", "total_time")
+
+    def __init__(
+        self, count: int = 0, errors: int = 0, total_time: float = 0.0, buckets: list[int] | None = None
+    ) -> None:
+        self.count = count
+        self.errors = errors
+        self.total_time = total_time
+        # Latency histogram with power of two buckets in microseconds: bucket i counts durations below 2**i us
+        self.buckets = [0] * 32 if buckets is None else buckets
+
+    def percentile(self, fraction: float) -> float:
+        target = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if bucket and seen >= target:
+                return 2**index / 1e6
+        return 0.0
+
+
+class MetricsTracer:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[str, SpanMetrics] = {}
+
+    def record(self, name: str, duration: float, error: BaseException | None) -> None:
+        bucket = min(int(duration * 1e6).bit_length(), 31)
+        with self._lock:
+            metrics = self._metrics.get(name)
+            if metrics is None:
+                metrics = self._metrics[name] = SpanMetrics()
+            metrics.count += 1
+            metrics.total_time += duration
+            metrics.buckets[bucket] += 1
+            if error is not None:
+                metrics.errors += 1
+
+    def snapshot(self) -> dict[str, SpanMetrics]:
+        with self._lock:
+            return {
+                name: SpanMetrics(metrics.count, metrics.errors, metrics.total_time, list(metrics.buckets))
+                for name, metrics in self._metrics.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
@@ -0,0 +1,9 @@
+from benchmarks.__main__ import DEFAULT_BASELINE
+from benchmarks.cases import run_all
+from benchmarks.harness import load_baseline
+
+
+def test_run_all_matches_committed_baseline() -> None:
+    results = run_all(duration=0)
+
+    assert [result.name for result in results] == list(load_baseline(DEFAULT_BASELINE))
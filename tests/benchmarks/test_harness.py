@@ -0,0 +1,56 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from benchmarks.harness import (
+    BenchmarkResult,
+    bench,
+    find_regressions,
+    load_baseline,
+    percentile,
+    save_baseline,
+)
+
+
+def make_result(name: str, ops_per_sec: float) -> BenchmarkResult:
+    return BenchmarkResult(name=name, ops_per_sec=ops_per_sec, p50=1.0, p90=2.0, p99=3.0, samples=10)
+
+
+def test_percentile() -> None:
+    values = [float(i) for i in range(101)]
+
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([1.0], 0.99) == 1
+
+
+def test_bench() -> None:
+    mock_func = MagicMock()
+
+    result = bench("mock", mock_func, duration=0)
+
+    mock_func.assert_called_once()
+
+    assert result.name == "mock"
+    assert result.samples == 1
+
+
+def test_find_regressions() -> None:
+    baseline = {"fast": make_result("fast", 100), "slow": make_result("slow", 100)}
+
+    regressions = find_regressions(baseline, [make_result("fast", 90), make_result("slow", 50)], threshold=0.2)
+
+    assert [regression.name for regression in regressions] == ["slow"]
+    assert regressions[0].slowdown == 0.5
+
+
+def test_find_regressions_new_benchmark() -> None:
+    assert find_regressions({}, [make_result("new", 1)], threshold=0.2) == []
+
+
+def test_save_baseline_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    results = [make_result("fast", 100)]
+
+    save_baseline(path, results)
+
+    assert load_baseline(path) == {"fast": results[0]}
@@ -0,0 +1,21 @@
+import pytest
+
+from benchmarks.import_time import measure, parse_import_time
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       303 |       1799 | src.level_0.calculator
+import time:       236 |      21947 |   src.level_1.session
+"""
+
+
+def test_parse_import_time() -> None:
+    assert parse_import_time(IMPORT_TIME_OUTPUT, "src.level_1.session") == 0.021947
+
+
+def test_parse_import_time_missing_module() -> None:
+    with pytest.raises(ValueError, match="No import time reported"):
+        parse_import_time(IMPORT_TIME_OUTPUT, "src.level_2.session")
+
+
+def test_measure() -> None:
+    assert measure("src.level_0.calculator", runs=1) > 0
@@ -0,0 +1,104 @@
+import array
+import math
+
+import pytest
+
+from src.level_0.expression import ExpressionError, compile_expression
+
+
+def test_compile_expression_evaluates_scalars() -> None:
+    compiled = compile_expression("(a + b) * c - a / 4")
+
+    assert compiled(a=2, b=3, c=4) == 19.5
+    assert compiled.variables == ("a", "b", "c")
+
+
+def test_compile_expression_calculator_calls() -> None:
+    assert compile_expression("subtract(multiply(a, 2), divide(b, 4))")(a=3, b=2) == 5.5
+
+
+def test_compile_expression_folds_constants() -> None:
+    compiled = compile_expression("x * (2 + 3) - 10 / 4")
+
+    assert len(compiled.instructions) == 2
+    assert compiled(x=1) == 2.5
+
+
+def test_compile_expression_constant_only() -> None:
+    compiled = compile_expression("-(1 + 2) * 3")
+
+    assert compiled.instructions == ()
+    assert compiled() == -9
+
+
+def test_compile_expression_reuses_common_subexpressions() -> None:
+    compiled = compile_expression("(a + b) * (b + a)")
+
+    assert len(compiled.instructions) == 2
+    assert compiled(a=1, b=2) == 9
+
+
+def test_compile_expression_keeps_signed_zero() -> None:
+    compiled = compile_expression("x * 0.0 + x * -0.0")
+
+    assert len(compiled.instructions) == 3
+    assert math.copysign(1, compile_expression("x * -0.0")(x=1)) == -1
+
+
+def test_compile_expression_is_cached() -> None:
+    assert compile_expression("a * b + 1") is compile_expression("a * b + 1")
+
+
+def test_compile_expression_divide_by_zero() -> None:
+    compiled = compile_expression("a / b")
+
+    with pytest.raises(ValueError, match="Cannot divide by zero"):
+        compiled(a=1, b=0)
+
+
+def test_compile_expression_constant_divide_by_zero() -> None:
+    with pytest.raises(ExpressionError, match=r"Cannot evaluate constant divide\(1.0, 0.0\): Cannot divide by zero"):
+        compile_expression("a + 1 / 0")
+
+
+def test_compile_expression_invalid_syntax() -> None:
+    with pytest.raises(ExpressionError, match="Invalid expression"):
+        compile_expression("a +")
+
+
+@pytest.mark.parametrize("expression", ["a ** 2", "max(a, b)", "add(a)", "'a'", "a.b"])
+def test_compile_expression_unsupported(expression: str) -> None:
+    with pytest.raises(ExpressionError, match="Unsupported expression"):
+        compile_expression(expression)
+
+
+def test_compiled_expression_missing_value() -> None:
+    with pytest.raises(ExpressionError, match="Missing value for b"):
+        compile_expression("a + b")(a=1)
+
+
+def test_compiled_expression_evaluate_columns() -> None:
+    compiled = compile_expression("(a + b) * 2 - 1 / c")
+
+    result = compiled.evaluate_columns({"a": [1, 2], "b": array.array("d", [3, 4]), "c": [4, 0.5]})
+
+    assert result == array.array("d", [7.75, 10])
+
+
+def test_compiled_expression_evaluate_columns_scalar_left_operand() -> None:
+    result = compile_expression("1 - a / 2 + 6 / a").evaluate_columns({"a": [2, 3]})
+
+    assert result == array.array("d", [3, 1.5])
+
+
+def test_compiled_expression_evaluate_columns_divide_by_zero() -> None:
+    compiled = compile_expression("a / b")
+
+    with pytest.raises(ValueError, match="Cannot divide by zero"):
+        compiled.evaluate_columns({"a": [1, 1], "b": [1, 0]})
+    assert math.isnan(compiled.evaluate_columns({"a": [1, 1], "b": [1, 0]}, on_zero="nan")[1])
+
+
+def test_compiled_expression_evaluate_columns_missing_column() -> None:
+    with pytest.raises(ExpressionError, match="Missing column for b"):
+        compile_expression("a + b").evaluate_columns({"a": [1]})
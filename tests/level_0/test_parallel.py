@@ -0,0 +1,103 @@
+import array
+import math
+from collections.abc import Generator
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from src.level_0.parallel import ParallelReducer, divide_chunk, reduce_chunk
+
+
+@pytest.fixture(scope="module")
+def reducer() -> Generator[ParallelReducer, None, None]:
+    with ParallelReducer(workers=2, chunk_size=4) as reducer:
+        yield reducer
+
+
+@pytest.fixture
+def shared_values() -> Generator[SharedMemory, None, None]:
+    values = array.array("d", [1, 2, 3, 4])
+    block = SharedMemory(create=True, size=len(values) * values.itemsize)
+    block.buf[: len(values) * values.itemsize] = values.tobytes()
+    yield block
+    block.close()
+    block.unlink()
+
+
+def test_parallel_reducer_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+        ParallelReducer(chunk_size=0)
+
+
+def test_parallel_reducer_sum_all(reducer: ParallelReducer) -> None:
+    assert reducer.sum_all(range(1, 11)) == 55
+
+
+def test_parallel_reducer_sum_all_small_input(reducer: ParallelReducer) -> None:
+    assert reducer.sum_all([]) == 0
+    assert reducer.sum_all([1.5, 2.5]) == 4
+
+
+def test_parallel_reducer_product_all(reducer: ParallelReducer) -> None:
+    assert reducer.product_all(range(1, 11)) == math.factorial(10)
+
+
+def test_parallel_reducer_results_do_not_depend_on_workers() -> None:
+    values = array.array("d", (1 / n for n in range(1, 1000)))
+
+    with ParallelReducer(workers=1, chunk_size=10) as one, ParallelReducer(workers=3, chunk_size=10) as three:
+        assert one.sum_all(values) == three.sum_all(values)
+
+
+def test_parallel_reducer_divide(reducer: ParallelReducer) -> None:
+    result = reducer.divide(range(10), array.array("d", [2] * 10))
+
+    assert result == array.array("d", [n / 2 for n in range(10)])
+
+
+def test_parallel_reducer_divide_numpy_divisor(reducer: ParallelReducer) -> None:
+    result = reducer.divide(range(10), np.full(10, 2.0))
+
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [n / 2 for n in range(10)]
+
+
+def test_parallel_reducer_divide_by_zero(reducer: ParallelReducer) -> None:
+    with pytest.raises(ValueError, match="Cannot divide by zero"):
+        reducer.divide([1] * 10, [1] * 9 + [0])
+
+
+def test_parallel_reducer_divide_by_zero_nan(reducer: ParallelReducer) -> None:
+    result = reducer.divide([1] * 10, [1] * 9 + [0], on_zero="nan")
+
+    assert result[:9] == array.array("d", [1] * 9)
+    assert math.isnan(result[9])
+
+
+def test_parallel_reducer_divide_different_lengths(reducer: ParallelReducer) -> None:
+    with pytest.raises(ValueError, match="different lengths"):
+        reducer.divide([1, 2], [1])
+
+
+def test_parallel_reducer_divide_unknown_policy(reducer: ParallelReducer) -> None:
+    with pytest.raises(ValueError, match="Unknown zero division policy"):
+        reducer.divide([1], [1], on_zero="mask")
+
+
+def test_reduce_chunk(shared_values: SharedMemory) -> None:
+    assert reduce_chunk("sum", shared_values.name, 1, 3) == 5
+    assert reduce_chunk("product", shared_values.name, 1, 4) == 24
+
+
+def test_divide_chunk(shared_values: SharedMemory) -> None:
+    out = SharedMemory(create=True, size=shared_values.size)
+    try:
+        divided = divide_chunk((shared_values.name, shared_values.name, out.name), 2, 4, "raise")
+        result = array.array("d", out.buf[16:32].tobytes())
+    finally:
+        out.close()
+        out.unlink()
+
+    assert divided is True
+    assert result == array.array("d", [1, 1])
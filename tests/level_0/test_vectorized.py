@@ -0,0 +1,127 @@
+import array
+import math
+
+import numpy as np
+import pytest
+
+from src.level_0.vectorized import (
+    add_array,
+    as_doubles,
+    divide_array,
+    is_numpy,
+    multiply_array,
+    subtract_array,
+)
+
+
+def test_add_array() -> None:
+    assert add_array(array.array("d", [2, -1]), [3, 1]) == array.array("d", [5, 0])
+
+
+def test_add_array_scalar() -> None:
+    assert add_array([1, 2, 3], 1) == array.array("d", [2, 3, 4])
+
+
+def test_add_array_scalar_left() -> None:
+    assert add_array(1, [1, 2]) == array.array("d", [2, 3])
+
+
+def test_add_array_two_scalars() -> None:
+    with pytest.raises(TypeError, match="At least one operand must be an array"):
+        add_array(1, 2)
+
+
+def test_add_array_different_lengths() -> None:
+    with pytest.raises(ValueError, match="different lengths"):
+        add_array([1, 2], [1])
+
+
+def test_add_array_buffer() -> None:
+    buffer = array.array("d", [1.5, 2.5]).tobytes()
+
+    assert add_array(buffer, memoryview(array.array("d", [1, 1]))) == array.array("d", [2.5, 3.5])
+
+
+def test_subtract_array() -> None:
+    assert subtract_array([5, 0], [2, 1]) == array.array("d", [3, -1])
+
+
+def test_subtract_array_scalar_left() -> None:
+    assert subtract_array(10, [2, 1]) == array.array("d", [8, 9])
+
+
+def test_multiply_array() -> None:
+    assert multiply_array([2, 0], [3, 5]) == array.array("d", [6, 0])
+
+
+def test_divide_array_valid() -> None:
+    assert divide_array([6, -6], [2, 2]) == array.array("d", [3, -3])
+
+
+def test_divide_array_by_zero() -> None:
+    with pytest.raises(ValueError, match="divide by zero"):
+        divide_array([6, 6], [2, 0])
+
+
+def test_divide_array_by_zero_nan() -> None:
+    result = divide_array([6, 6, 6], [0, 2, 0], on_zero="nan")
+
+    assert math.isnan(result[0])
+    assert result[1] == 3
+    assert math.isnan(result[2])
+
+
+def test_divide_array_scalar_left() -> None:
+    assert divide_array(6, [2, 3]) == array.array("d", [3, 2])
+
+
+def test_divide_array_mask_requires_numpy() -> None:
+    with pytest.raises(TypeError, match="requires NumPy"):
+        divide_array([6], [0], on_zero="mask")
+
+
+def test_divide_array_unknown_policy() -> None:
+    with pytest.raises(ValueError, match="Unknown zero division policy"):
+        divide_array([6], [2], on_zero="ignore")  # type: ignore[arg-type]
+
+
+def test_divide_array_numpy_mask() -> None:
+    result = divide_array(np.array([6.0, 6.0]), np.array([0.0, 2.0]), on_zero="mask")
+
+    assert result.mask.tolist() == [True, False]
+    assert result[1] == 3
+
+
+def test_add_array_numpy() -> None:
+    result = add_array(np.array([2.0, -1.0]), np.array([3.0, 1.0]))
+
+    assert result.tolist() == [5, 0]
+
+
+def test_add_array_numpy_scalar_left() -> None:
+    assert add_array(1, np.array([1.0, 2.0])).tolist() == [2, 3]
+
+
+def test_divide_array_numpy_by_zero() -> None:
+    with pytest.raises(ValueError, match="divide by zero"):
+        divide_array(np.array([6.0, 6.0]), np.array([2.0, 0.0]))
+
+
+def test_divide_array_numpy_by_zero_nan() -> None:
+    result = divide_array(np.array([6.0, 6.0]), np.array([2.0, 0.0]), on_zero="nan")
+
+    assert result[0] == 3
+    assert math.isnan(result[1])
+
+
+def test_as_doubles_reinterprets_bytes() -> None:
+    values = array.array("d", [1.5, -2])
+
+    assert as_doubles(values) is values
+    assert as_doubles(values.tobytes()) == values
+    assert as_doubles([1, 2]) == array.array("d", [1, 2])
+
+
+def test_is_numpy() -> None:
+    assert is_numpy([1.0], np.array([1.0]))
+    assert not is_numpy([1.0], 2.0)
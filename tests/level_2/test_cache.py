@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock, patch
+
+from src.level_2.cache import ConnectionCache
+from src.level_2.interface import ServerInterface
+
+
+def test_connection_cache_is_connected_miss() -> None:
+    cache = ConnectionCache()
+
+    connected = cache.is_connected(ServerInterface())
+
+    assert not connected
+    assert cache.misses == 1
+
+
+def test_connection_cache_is_connected_hit() -> None:
+    cache = ConnectionCache()
+    interface = ServerInterface()
+    cache.mark_connected(interface)
+
+    connected = cache.is_connected(interface)
+
+    assert connected
+    assert cache.hits == 1
+
+
+@patch("src.level_2.cache.time.monotonic")
+def test_connection_cache_is_connected_expired(mock_monotonic: MagicMock) -> None:
+    cache = ConnectionCache(ttl=10)
+    interface = ServerInterface()
+    mock_monotonic.return_value = 100
+    cache.mark_connected(interface)
+    mock_monotonic.return_value = 110
+
+    connected = cache.is_connected(interface)
+
+    assert not connected
+
+
+def test_connection_cache_invalidate() -> None:
+    cache = ConnectionCache()
+    interface = ServerInterface()
+    other_interface = ServerInterface()
+    cache.mark_connected(interface)
+    cache.mark_connected(other_interface)
+
+    cache.invalidate(interface)
+
+    assert not cache.is_connected(interface)
+    assert cache.is_connected(other_interface)
+
+
+def test_connection_cache_clear() -> None:
+    cache = ConnectionCache()
+    interface = ServerInterface()
+    cache.mark_connected(interface)
+
+    cache.clear()
+
+    assert not cache.is_connected(interface)
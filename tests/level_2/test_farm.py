@@ -0,0 +1,67 @@
+from collections.abc import Generator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.level_1.session import Session as Level1Session
+from src.level_2 import farm
+from src.level_2.farm import ChunkResult, FarmResults, SessionFarm, connect_chunk, init_worker
+from src.level_2.session import Session
+
+
+@pytest.fixture
+def mock_session() -> Generator[MagicMock, None, None]:
+    mock_session = MagicMock(spec_set=Session)
+    init_worker(MagicMock(return_value=mock_session))
+    yield mock_session
+    farm._worker_session = None  # noqa: SLF001
+
+
+def test_connect_chunk(mock_session: MagicMock) -> None:
+    mock_session.connect.side_effect = [True, False, ConnectionError("Failed to connect to server")]
+
+    result = connect_chunk(3)
+
+    assert mock_session.connect.call_count == 3
+
+    assert result.succeeded == 1
+    assert result.failed == 2
+    assert result.errors == ["ConnectionError('Failed to connect to server')"]
+
+
+def test_connect_chunk_not_initialized() -> None:
+    with pytest.raises(RuntimeError, match="not initialized"):
+        connect_chunk(1)
+
+
+def test_farm_results_add() -> None:
+    results = FarmResults()
+
+    results.add(ChunkResult(succeeded=2, failed=1, errors=["error"] * 8, elapsed=1.0))
+    results.add(ChunkResult(succeeded=3, failed=0, errors=["error"] * 8, elapsed=2.0))
+
+    assert results.succeeded == 5
+    assert results.failed == 1
+    assert len(results.errors) == 10
+    assert results.chunks == 2
+    assert results.worker_time == 3.0
+
+
+def test_session_farm_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+        SessionFarm(chunk_size=0)
+
+
+def test_session_farm_connect_many() -> None:
+    with SessionFarm(workers=2, chunk_size=10) as session_farm:
+        results = session_farm.connect_many(25)
+
+    assert results.succeeded == 25
+    assert results.chunks == 3
+
+
+def test_session_farm_connect_many_level_1() -> None:
+    with SessionFarm(Level1Session, workers=1) as session_farm:
+        results = [session_farm.connect_many(5), session_farm.connect_many(5)]
+
+    assert [result.succeeded for result in results] == [5, 5]
@@ -1,5 +1,8 @@
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
+import pytest
+
+from src.level_2.cache import ConnectionCache
 from src.level_2.interface import ServerInterface
 from src.level_2.session import Session
 
@@ -141,3 +144,53 @@ def test_connect_success_simple_spec_one_liner() -> None:
     interface.connect_to_server.assert_called_once()
 
     assert connected
+
+
+def test_connect_cached() -> None:
+    interface = MagicMock(spec_set=ServerInterface)
+    interface.connect_to_server.return_value = True
+    session = Session(interface, ConnectionCache())
+
+    connected = [session.connect(), session.connect()]
+
+    interface.connect_to_server.assert_called_once()
+
+    assert connected == [True, True]
+
+
+def test_connect_cached_failure_not_cached() -> None:
+    interface = MagicMock(spec_set=ServerInterface)
+    interface.connect_to_server.side_effect = [False, True]
+    session = Session(interface, ConnectionCache())
+
+    connected = [session.connect(), session.connect()]
+
+    assert interface.connect_to_server.call_count == 2
+
+    assert connected == [False, True]
+
+
+def test_connect_cached_exception_invalidates() -> None:
+    interface = MagicMock(spec_set=ServerInterface)
+    interface.connect_to_server.side_effect = ConnectionError("Failed to connect to server")
+    mock_cache = MagicMock(spec_set=ConnectionCache)
+    mock_cache.is_connected.return_value = False
+    session = Session(interface, mock_cache)
+
+    with pytest.raises(ConnectionError):
+        session.connect()
+
+    mock_cache.invalidate.assert_called_once_with(interface)
+    mock_cache.mark_connected.assert_not_called()
+
+
+def test_invalidate() -> None:
+    interface = MagicMock(spec_set=ServerInterface)
+    interface.connect_to_server.return_value = True
+    session = Session(interface, ConnectionCache())
+    session.connect()
+
+    session.invalidate()
+    session.connect()
+
+    assert interface.connect_to_server.call_count == 2
@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.level_3.admission import AdmissionController, AdmissionQueueFullError, AdmissionTimeoutError
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"max_in_flight": 0}, "max_in_flight must be at least 1"),
+        ({"max_per_session": 0}, "max_per_session must be at least 1"),
+        ({"max_queue": -1}, "max_queue must not be negative"),
+    ],
+)
+def test_admission_controller_invalid(kwargs: dict[str, int], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        AdmissionController(**kwargs)
+
+
+def test_admission_controller_admit_counts_in_flight() -> None:
+    admission = AdmissionController()
+
+    with admission.admit("session"):
+        in_flight = admission.in_flight("session")
+        stats = admission.stats()
+
+    assert in_flight == 1
+    assert stats.in_flight == 1
+    assert admission.in_flight("session") == 0
+    assert admission.stats().in_flight == 0
+    assert admission.stats().admitted == 1
+
+
+def test_admission_controller_acquire_timeout() -> None:
+    admission = AdmissionController(max_in_flight=1)
+    admission.acquire()
+
+    with pytest.raises(AdmissionTimeoutError, match="Timed out waiting for admission"):
+        admission.acquire(timeout=0.01)
+
+    assert admission.stats().timeouts == 1
+    assert admission.stats().queued == 0
+
+
+class _Interrupt(BaseException):
+    pass
+
+
+def test_admission_controller_acquire_interrupted() -> None:
+    admission = AdmissionController(max_in_flight=1)
+    admission.acquire()
+
+    with patch("src.level_3.admission.threading.Event") as mock_event_class:
+        mock_event_class.return_value.wait.side_effect = _Interrupt
+        with pytest.raises(_Interrupt):
+            admission.acquire()
+
+    assert admission.stats().queued == 0
+    assert admission.stats().in_flight == 1
+
+
+def test_admission_controller_acquire_interrupted_after_admission() -> None:
+    admission = AdmissionController(max_in_flight=1)
+    admission.acquire()
+
+    def release_then_interrupt(_: float | None) -> bool:
+        admission.release()
+        raise _Interrupt
+
+    with patch("src.level_3.admission.threading.Event") as mock_event_class:
+        mock_event_class.return_value.wait.side_effect = release_then_interrupt
+        with pytest.raises(_Interrupt):
+            admission.acquire()
+
+    assert admission.stats().queued == 0
+    assert admission.stats().in_flight == 0
+
+
+def test_admission_controller_queue_full() -> None:
+    admission = AdmissionController(max_in_flight=1, max_queue=0)
+    admission.acquire()
+
+    with pytest.raises(AdmissionQueueFullError, match="Admission queue is full"):
+        admission.acquire()
+
+    assert admission.stats().rejected == 1
+
+
+def test_admission_controller_release_wakes_waiter() -> None:
+    admission = AdmissionController(max_in_flight=1)
+    admission.acquire("first")
+    waiter = threading.Thread(target=admission.acquire, args=("second",))
+    waiter.start()
+    while not admission.stats().queued:
+        time.sleep(0.001)
+
+    time.sleep(0.01)
+    admission.release("first")
+    waiter.join()
+
+    assert admission.in_flight("second") == 1
+    assert admission.stats().max_wait_time >= 0.01
+
+
+def test_admission_controller_per_session_limit_lets_other_sessions_pass() -> None:
+    admission = AdmissionController(max_in_flight=10, max_per_session=1)
+    admission.acquire("busy")
+    waiter = threading.Thread(target=admission.acquire, args=("busy",))
+    waiter.start()
+    while not admission.stats().queued:
+        time.sleep(0.001)
+
+    admission.acquire("other", timeout=0)
+    admission.release("busy")
+    waiter.join()
+
+    assert admission.in_flight("busy") == 1
+    assert admission.in_flight("other") == 1
+
+
+@pytest.mark.asyncio
+async def test_admission_controller_aadmit_limits_concurrency() -> None:
+    admission = AdmissionController(max_in_flight=3)
+    peak = 0
+
+    async def work() -> None:
+        nonlocal peak
+        async with admission.aadmit():
+            peak = max(peak, admission.stats().in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(work() for _ in range(10)))
+
+    assert peak == 3
+    assert admission.stats().admitted == 10
+    assert admission.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_admission_controller_aacquire_timeout() -> None:
+    admission = AdmissionController(max_in_flight=1, timeout=0.01)
+    await admission.aacquire()
+
+    with pytest.raises(AdmissionTimeoutError, match="Timed out waiting for admission"):
+        await admission.aacquire()
+
+    assert admission.stats().timeouts == 1
+
+
+@pytest.mark.asyncio
+async def test_admission_controller_aadmit_timeout() -> None:
+    admission = AdmissionController(max_in_flight=1)
+    await admission.aacquire()
+
+    with pytest.raises(AdmissionTimeoutError, match="Timed out waiting for admission"):
+        async with admission.aadmit(timeout=0.01):
+            pass
+
+    assert admission.stats().timeouts == 1
+    assert admission.stats().in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_admission_controller_aacquire_cancelled() -> None:
+    admission = AdmissionController(max_in_flight=1)
+    await admission.aacquire()
+    waiter = asyncio.create_task(admission.aacquire())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert admission.stats().queued == 0
+    assert admission.stats().in_flight == 1
@@ -0,0 +1,57 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.level_3.fanout import fan_out
+
+
+@pytest.mark.asyncio
+async def test_fan_out_aggregates_results() -> None:
+    mock_connect = AsyncMock(side_effect=[True, False, ConnectionError("Failed to connect to server")])
+
+    results = await fan_out(mock_connect, 3, concurrency=2)
+
+    assert mock_connect.await_count == 3
+
+    assert results.succeeded == 1
+    assert results.failed == 2
+    assert len(results.errors) == 1
+    assert len(results.latencies) == 3
+
+
+@pytest.mark.asyncio
+async def test_fan_out_bounds_concurrency() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def connect() -> bool:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return True
+
+    results = await fan_out(connect, 20, concurrency=4)
+
+    assert max_in_flight == 4
+    assert results.succeeded == 20
+
+
+@pytest.mark.asyncio
+async def test_fan_out_timeout() -> None:
+    async def connect() -> bool:
+        await asyncio.sleep(60)
+        return True
+
+    results = await fan_out(connect, 2, concurrency=2, attempt_timeout=0.01)
+
+    assert results.timed_out == 2
+    assert results.succeeded == 0
+
+
+@pytest.mark.asyncio
+async def test_fan_out_invalid_concurrency() -> None:
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        await fan_out(AsyncMock(), 1, concurrency=0)
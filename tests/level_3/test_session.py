@@ -2,6 +2,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
+from src.level_3.admission import AdmissionController
 from src.level_3.interface import ServerInterface
 from src.level_3.session import Session
 
@@ -64,3 +65,45 @@ async def test_aconnect_async_mock() -> None:
 
 
 # --8<-- [end:async_mock]
+
+
+@pytest.mark.asyncio
+async def test_aconnect_many() -> None:
+    interface = Mock(spec_set=ServerInterface)
+    interface.aconnect_to_server = AsyncMock(return_value=True)
+    session = Session(interface)
+
+    results = await session.aconnect_many(10, concurrency=3)
+
+    assert interface.aconnect_to_server.await_count == 10
+
+    assert results.succeeded == 10
+    assert session.active_connections == 10
+
+
+def test_connect_admission() -> None:
+    interface = Mock(spec_set=ServerInterface)
+    admission = AdmissionController(max_in_flight=1)
+    session = Session(interface, admission)
+    interface.connect_to_server.side_effect = lambda: admission.in_flight(session) == 1
+
+    connected = session.connect()
+
+    interface.connect_to_server.assert_called_once()
+
+    assert connected
+    assert admission.in_flight(session) == 0
+
+
+@pytest.mark.asyncio
+async def test_aconnect_admission() -> None:
+    interface = Mock(spec_set=ServerInterface)
+    interface.aconnect_to_server = AsyncMock(return_value=True)
+    admission = AdmissionController(max_in_flight=2)
+    session = Session(interface, admission)
+
+    results = await session.aconnect_many(10, concurrency=10)
+
+    assert results.succeeded == 10
+    assert admission.stats().admitted == 10
+    assert admission.stats().in_flight == 0
@@ -0,0 +1,152 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.level_4.database import (
+    AsyncConnection,
+    AsyncConnectionPool,
+    Connection,
+    ConnectionPool,
+    Database,
+    PoolTimeoutError,
+)
+
+
+@pytest.fixture
+def mock_connection_factory() -> MagicMock:
+    return MagicMock(side_effect=lambda: MagicMock(spec=Connection, last_used=0.0))
+
+
+@pytest.fixture
+def mock_async_connection_factory() -> MagicMock:
+    return MagicMock(side_effect=lambda: MagicMock(spec=AsyncConnection))
+
+
+def test_connection_exit_releases_to_pool() -> None:
+    mock_pool = MagicMock(spec_set=ConnectionPool)
+    conn = Connection()
+    conn.pool = mock_pool
+
+    with conn:
+        pass
+
+    mock_pool.release.assert_called_once_with(conn)
+
+
+def test_connection_exit_discards_on_error() -> None:
+    mock_pool = MagicMock(spec_set=ConnectionPool)
+    conn = Connection()
+    conn.pool = mock_pool
+
+    with pytest.raises(RuntimeError), conn:
+        raise RuntimeError
+
+    mock_pool.discard.assert_called_once_with(conn)
+    mock_pool.release.assert_not_called()
+
+
+@patch.object(Database, "pool", spec_set=ConnectionPool)
+def test_database_get_acquires_from_pool(mock_pool: MagicMock) -> None:
+    mock_conn = MagicMock(spec_set=Connection)
+    mock_pool.acquire.return_value = mock_conn
+
+    conn = Database.get()
+
+    mock_pool.acquire.assert_called_once()
+
+    assert conn is mock_conn
+
+
+@pytest.mark.asyncio
+async def test_async_connection_pool_acquire_reuses_released_connection(
+    mock_async_connection_factory: MagicMock,
+) -> None:
+    pool = AsyncConnectionPool(connection_factory=mock_async_connection_factory)
+
+    first = await pool.acquire()
+    await pool.release(first)
+    second = await pool.acquire()
+
+    mock_async_connection_factory.assert_called_once()
+
+    assert second is first
+    assert pool.stats().in_use == 1
+
+
+@pytest.mark.asyncio
+async def test_async_connection_pool_acquire_waits_for_release(mock_async_connection_factory: MagicMock) -> None:
+    pool = AsyncConnectionPool(max_size=1, connection_factory=mock_async_connection_factory)
+    first = await pool.acquire()
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+
+    waiting = pool.stats().waiters
+    await pool.release(first)
+    second = await waiter
+
+    mock_async_connection_factory.assert_called_once()
+
+    assert waiting == 1
+    assert second is first
+
+
+@pytest.mark.asyncio
+async def test_async_connection_pool_acquire_timeout(mock_async_connection_factory: MagicMock) -> None:
+    pool = AsyncConnectionPool(max_size=1, timeout=0.01, connection_factory=mock_async_connection_factory)
+    await pool.acquire()
+
+    with pytest.raises(PoolTimeoutError, match="Timed out waiting for a connection"):
+        await pool.acquire()
+
+    assert pool.stats().timeouts == 1
+
+
+@pytest.mark.asyncio
+async def test_async_connection_exit_releases_to_pool() -> None:
+    mock_pool = MagicMock(spec_set=AsyncConnectionPool)
+    conn = AsyncConnection()
+    conn.pool = mock_pool
+
+    async with conn:
+        pass
+
+    mock_pool.release.assert_awaited_once_with(conn)
+
+
+@pytest.mark.asyncio
+async def test_database_aget_uses_one_pool_per_loop() -> None:
+    first = await Database.aget()
+    await first.__aexit__(None, None, None)
+    second = await Database.aget()
+
+    assert second is first
+    assert Database.async_pools[asyncio.get_running_loop()].stats().in_use == 1
+
+
+@pytest.mark.asyncio
+async def test_async_connection_exit_discards_on_error() -> None:
+    mock_pool = MagicMock(spec_set=AsyncConnectionPool)
+    conn = AsyncConnection()
+    conn.pool = mock_pool
+
+    with pytest.raises(RuntimeError):
+        async with conn:
+            raise RuntimeError
+
+    mock_pool.discard.assert_awaited_once_with(conn)
+    mock_pool.release.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_connection_pool_release_after_close(mock_async_connection_factory: MagicMock) -> None:
+    pool = AsyncConnectionPool(connection_factory=mock_async_connection_factory)
+    conn = await pool.acquire()
+    await pool.close()
+
+    await pool.release(conn)
+
+    conn.close.assert_awaited_once()
+
+    assert pool.stats().size == 0
+    assert pool.stats().idle == 0
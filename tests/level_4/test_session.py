@@ -1,6 +1,8 @@
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
-from src.level_4.database import Connection, Database
+import pytest
+
+from src.level_4.database import AsyncConnection, Connection, Database
 from src.level_4.interface import ServerInterface
 from src.level_4.session import Session
 
@@ -48,3 +50,25 @@ def test_connect_success_mock_db(mock_db: MagicMock, mock_interface_class: Magic
 
 
 # --8<-- [end:mock_db]
+
+
+@pytest.mark.asyncio
+@patch("src.level_4.session.ServerInterface")
+@patch("src.level_4.session.Db", spec_set=Database)
+async def test_aconnect_success_mock_db(mock_db: MagicMock, mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.aconnect_to_server = AsyncMock(return_value=True)
+    mock_interface_class.return_value = mock_interface
+    mock_conn = MagicMock(spec_set=AsyncConnection)
+    mock_conn.__aenter__.return_value = mock_conn
+    mock_db.aget.return_value = mock_conn
+    session = Session()
+
+    connected = await session.aconnect()
+
+    mock_db.aget.assert_awaited_once()
+    mock_conn.begin.assert_awaited_once()
+    mock_conn.commit.assert_awaited_once()
+    mock_interface.aconnect_to_server.assert_awaited_once()
+
+    assert connected
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.level_5.database import Connection, ConnectionPool, Database
+
+
+@pytest.fixture
+def mock_connection_factory() -> MagicMock:
+    return MagicMock(side_effect=lambda: MagicMock(spec=Connection, last_used=0.0))
+
+
+def test_connection_exit_releases_to_pool() -> None:
+    mock_pool = MagicMock(spec_set=ConnectionPool)
+    conn = Connection()
+    conn.pool = mock_pool
+
+    with conn:
+        pass
+
+    mock_pool.release.assert_called_once_with(conn)
+
+
+def test_connection_exit_discards_on_error() -> None:
+    mock_pool = MagicMock(spec_set=ConnectionPool)
+    conn = Connection()
+    conn.pool = mock_pool
+
+    with pytest.raises(RuntimeError), conn:
+        raise RuntimeError
+
+    mock_pool.discard.assert_called_once_with(conn)
+    mock_pool.release.assert_not_called()
+
+
+@patch.object(Database, "pool", spec_set=ConnectionPool)
+def test_database_get_acquires_from_pool(mock_pool: MagicMock) -> None:
+    mock_conn = MagicMock(spec_set=Connection)
+    mock_pool.acquire.return_value = mock_conn
+
+    conn = Database.get()
+
+    mock_pool.acquire.assert_called_once()
+
+    assert conn is mock_conn
+
+
+def test_connection_write_many() -> None:
+    conn = Connection()
+
+    written = conn.write_many(("connect", float(n)) for n in range(3))
+
+    assert written == 3
@@ -0,0 +1,106 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.level_5.database import Connection
+from src.level_5.group_commit import GroupCommitError, GroupCommitter
+
+
+@pytest.fixture
+def mock_conn() -> MagicMock:
+    return MagicMock(spec_set=Connection)
+
+
+@pytest.fixture
+def mock_get_connection(mock_conn: MagicMock) -> MagicMock:
+    mock_get_connection = MagicMock()
+    mock_get_connection.return_value.__enter__.return_value = mock_conn
+    return mock_get_connection
+
+
+def test_group_commit_submit_single_write(mock_get_connection: MagicMock, mock_conn: MagicMock) -> None:
+    committer = GroupCommitter(max_wait=0, get_connection=mock_get_connection)
+    mock_write = MagicMock()
+
+    committer.submit(mock_write)
+
+    mock_write.assert_called_once_with(mock_conn)
+    mock_conn.begin.assert_called_once()
+    mock_conn.commit.assert_called_once()
+
+    assert committer.batches == 1
+
+
+def test_group_commit_submit_coalesces_concurrent_writes(mock_get_connection: MagicMock, mock_conn: MagicMock) -> None:
+    committer = GroupCommitter(max_batch_size=4, max_wait=5, get_connection=mock_get_connection)
+    mock_write = MagicMock()
+    threads = [threading.Thread(target=committer.submit, args=(mock_write,)) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mock_write.call_count == 8
+    assert mock_conn.commit.call_count == 2
+
+    assert committer.batches == 2
+    assert committer.writes == 8
+
+
+def test_group_commit_submit_failed_write(mock_get_connection: MagicMock, mock_conn: MagicMock) -> None:
+    committer = GroupCommitter(max_wait=0, get_connection=mock_get_connection)
+    mock_write = MagicMock(side_effect=RuntimeError("write failed"))
+
+    with pytest.raises(GroupCommitError, match="Group commit failed"):
+        committer.submit(mock_write)
+
+    mock_conn.rollback_to_savepoint.assert_called_once_with("request")
+    mock_conn.release_savepoint.assert_called_once_with("request")
+    mock_conn.commit.assert_called_once()
+
+
+def test_group_commit_submit_failed_commit(mock_get_connection: MagicMock, mock_conn: MagicMock) -> None:
+    committer = GroupCommitter(max_wait=0, get_connection=mock_get_connection)
+    mock_conn.commit.side_effect = RuntimeError("commit failed")
+
+    with pytest.raises(GroupCommitError, match="Group commit failed") as exc_info:
+        committer.submit(MagicMock())
+
+    assert str(exc_info.value.__cause__) == "commit failed"
+
+
+class _Interrupt(BaseException):
+    pass
+
+
+def test_group_commit_submit_interrupted_leader_wakes_followers(
+    mock_get_connection: MagicMock, mock_conn: MagicMock
+) -> None:
+    mock_get_connection.return_value.__exit__.return_value = False
+    committer = GroupCommitter(max_batch_size=2, max_wait=5, get_connection=mock_get_connection)
+    mock_write = MagicMock(side_effect=[_Interrupt(), None])
+    errors: list[BaseException] = []
+
+    def submit() -> None:
+        try:
+            committer.submit(mock_write)
+        except BaseException as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=submit) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    mock_conn.commit.assert_not_called()
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert sorted(type(e).__name__ for e in errors) == ["GroupCommitError", "_Interrupt"]
+
+
+def test_group_commit_invalid_batch_size() -> None:
+    with pytest.raises(ValueError, match="max_batch_size must be at least 1"):
+        GroupCommitter(max_batch_size=0)
@@ -0,0 +1,89 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+from src.level_5.interface import ConnectionCounter, CounterSnapshot
+
+
+def test_connection_counter_increment() -> None:
+    counter = ConnectionCounter()
+
+    counter.increment()
+    counter.increment()
+
+    assert counter.count == 2
+
+
+def test_connection_counter_increment_from_many_threads() -> None:
+    counter = ConnectionCounter()
+
+    def increment_many() -> None:
+        for _ in range(10_000):
+            counter.increment()
+
+    threads = [threading.Thread(target=increment_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.count == 80_000
+
+
+def test_connection_counter_folds_finished_threads() -> None:
+    counter = ConnectionCounter()
+
+    for _ in range(5):
+        thread = threading.Thread(target=counter.increment)
+        thread.start()
+        thread.join()
+    counter.increment()
+
+    assert counter.count == 6
+    assert len(counter._shards) == 1  # noqa: SLF001
+
+
+def test_connection_counter_set_count() -> None:
+    counter = ConnectionCounter()
+    counter.increment()
+    counter.increment()
+
+    counter.count = 10
+    counter.increment()
+
+    assert counter.count == 11
+
+
+def test_connection_counter_reset() -> None:
+    counter = ConnectionCounter()
+    thread = threading.Thread(target=counter.increment)
+    thread.start()
+    thread.join()
+    counter.increment()
+
+    counter.reset()
+    counter.increment()
+
+    assert counter.count == 1
+
+
+@patch("src.level_5.interface.time.monotonic")
+def test_connection_counter_snapshot(mock_monotonic: MagicMock) -> None:
+    mock_monotonic.return_value = 12.0
+    counter = ConnectionCounter()
+    counter.increment()
+
+    snapshot = counter.snapshot()
+
+    assert snapshot == CounterSnapshot(count=1, timestamp=12.0)
+
+
+@patch("src.level_5.interface.time.monotonic")
+def test_connection_counter_rate(mock_monotonic: MagicMock) -> None:
+    mock_monotonic.return_value = 12.0
+    counter = ConnectionCounter()
+    for _ in range(10):
+        counter.increment()
+
+    rate = counter.rate(CounterSnapshot(count=0, timestamp=10.0))
+
+    assert rate == 5.0
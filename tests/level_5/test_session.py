@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 
 from src.level_5.database import Connection, Database
+from src.level_5.group_commit import GroupCommitter
 from src.level_5.interface import ConnectionCounter, ServerInterface
 from src.level_5.session import Session
 
@@ -107,3 +108,33 @@ def test_connect_success_mock_db(
 
 
 # --8<-- [end:fixture_explicit_use]
+
+
+def test_connect_group_commit(
+    mock_interface_class: MagicMock, mock_connection_counter: Mock, mock_db_connection: tuple[MagicMock, MagicMock]
+) -> None:
+    mock_db, _ = mock_db_connection
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.connect_to_server.return_value = True
+    mock_interface_class.return_value = mock_interface
+    mock_group_committer = MagicMock(spec_set=GroupCommitter)
+    session = Session(mock_connection_counter, mock_group_committer)
+
+    connected = session.connect()
+
+    mock_group_committer.submit.assert_called_once_with(session.write)
+    mock_db.get.assert_not_called()
+    mock_connection_counter.increment.assert_called_once()
+
+    assert connected
+
+
+def test_write(mock_connection_counter: Mock) -> None:
+    mock_conn = MagicMock(spec_set=Connection)
+    session = Session(mock_connection_counter)
+
+    session.write(mock_conn)
+
+    mock_conn.write_many.assert_called_once()
+
+    assert mock_conn.write_many.call_args.args[0][0][0] == "connect"
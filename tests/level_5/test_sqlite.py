@@ -0,0 +1,153 @@
+import sqlite3
+import threading
+from collections.abc import Callable, Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.level_5.database import Connection, ConnectionPool, Database
+from src.level_5.group_commit import GroupCommitError, GroupCommitter
+from src.level_5.interface import ConnectionCounter, ServerInterface
+from src.level_5.session import Session
+from src.level_5.sqlite import SQLiteConfig, SQLiteConnection, install_sqlite_pool, sqlite_pool
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> SQLiteConfig:
+    return SQLiteConfig(path=str(tmp_path / "test.sqlite3"))
+
+
+@pytest.fixture
+def restore_database_pool() -> Generator[None, None, None]:
+    yield
+    Database.pool.close()
+    Database.pool = ConnectionPool(Connection)
+
+
+@pytest.fixture
+def conn(config: SQLiteConfig) -> Generator[SQLiteConnection, None, None]:
+    conn = SQLiteConnection(config)
+    yield conn
+    conn.close()
+
+
+def count_rows(config: SQLiteConfig) -> int:
+    with sqlite3.connect(config.path) as db:
+        return db.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"synchronous": "SOMETIMES"}, "Unknown synchronous level"),
+        ({"journal_mode": "FAST"}, "Unknown journal mode"),
+        ({"columns": ()}, "At least one column"),
+    ],
+)
+def test_sqlite_config_invalid(kwargs: dict[str, object], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        SQLiteConfig(path="test.sqlite3", **kwargs)
+
+
+def test_sqlite_connection_pragmas(conn: SQLiteConnection) -> None:
+    assert conn.db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.db.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_sqlite_connection_write_many(conn: SQLiteConnection, config: SQLiteConfig) -> None:
+    conn.begin()
+    written = conn.write_many(("connect", float(n)) for n in range(100))
+    conn.commit()
+
+    assert written == 100
+    assert count_rows(config) == 100
+
+
+def test_sqlite_connection_exit_rolls_back_open_transaction(conn: SQLiteConnection, config: SQLiteConfig) -> None:
+    with conn:
+        conn.begin()
+        conn.write_many([("connect", 0.0)])
+
+    assert not conn.db.in_transaction
+    assert count_rows(config) == 0
+
+
+def test_sqlite_connection_exit_after_close(config: SQLiteConfig) -> None:
+    pool = sqlite_pool(config)
+    conn = pool.acquire()
+    conn.begin()
+
+    with conn:
+        conn.close()
+
+    assert pool.stats().size == 0
+
+
+def test_sqlite_connection_is_healthy(conn: SQLiteConnection) -> None:
+    assert conn.is_healthy()
+
+    conn.close()
+
+    assert not conn.is_healthy()
+
+
+def test_sqlite_pool(config: SQLiteConfig) -> None:
+    pool = sqlite_pool(config, max_size=1)
+
+    with pool.acquire() as conn:
+        conn.begin()
+        conn.write_many([("connect", 0.0), ("connect", 1.0)])
+        conn.commit()
+    reused = pool.acquire()
+    pool.release(reused)
+    pool.close()
+
+    assert reused is conn
+    assert isinstance(conn, SQLiteConnection)
+    assert count_rows(config) == 2
+
+
+def test_install_sqlite_pool(config: SQLiteConfig, restore_database_pool: None) -> None:
+    previous = Database.pool
+    checked_out = Database.get()
+
+    pool = install_sqlite_pool(config)
+    with checked_out, patch("src.level_5.session.ServerInterface", spec_set=ServerInterface):
+        Session(ConnectionCounter()).connect()
+
+    assert Database.pool is pool
+    assert previous.stats().idle == 0
+    assert count_rows(config) == 1
+
+
+def test_group_commit_failed_write_rolled_back(config: SQLiteConfig) -> None:
+    pool = sqlite_pool(config, max_size=1)
+    committer = GroupCommitter(max_batch_size=2, max_wait=5, get_connection=pool.acquire)
+
+    def failing_write(conn: Connection) -> None:
+        conn.write_many([("connect", 0.0), ("connect", 1.0)])
+        msg = "write failed"
+        raise RuntimeError(msg)
+
+    def write(conn: Connection) -> None:
+        conn.write_many([("connect", 2.0)])
+
+    errors: list[BaseException] = []
+
+    def submit(write: Callable[[Connection], None]) -> None:
+        try:
+            committer.submit(write)
+        except GroupCommitError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=submit, args=(w,)) for w in (failing_write, write)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    pool.close()
+
+    assert committer.batches == 1
+    assert len(errors) == 1
+    assert count_rows(config) == 1
@@ -0,0 +1,51 @@
+import pytest
+
+from src.level_6.heartbeat import Heartbeat, HeartbeatConfig
+
+
+def test_heartbeat_invalid_intervals() -> None:
+    with pytest.raises(ValueError, match="min_interval <= max_interval"):
+        Heartbeat(HeartbeatConfig(min_interval=2, max_interval=1))
+
+
+def test_heartbeat_invalid_backoff() -> None:
+    with pytest.raises(ValueError, match="backoff must be at least 1"):
+        Heartbeat(HeartbeatConfig(backoff=0.5))
+
+
+def test_heartbeat_default_never_faster_than_poll_loop() -> None:
+    assert Heartbeat(HeartbeatConfig()).interval == 1
+
+
+def test_heartbeat_should_probe_backs_off_when_active() -> None:
+    heartbeat = Heartbeat(HeartbeatConfig(min_interval=1, max_interval=3, backoff=2))
+
+    probes = []
+    for _ in range(3):
+        heartbeat.record_activity()
+        probes.append(heartbeat.should_probe())
+
+    assert probes == [False, False, False]
+    assert heartbeat.interval == 3
+
+
+def test_heartbeat_should_probe_when_idle() -> None:
+    heartbeat = Heartbeat(HeartbeatConfig(min_interval=1, max_interval=8, backoff=2))
+    heartbeat.record_activity()
+    heartbeat.should_probe()
+
+    probe = heartbeat.should_probe()
+
+    assert probe
+    assert heartbeat.interval == 1
+
+
+def test_heartbeat_reset() -> None:
+    heartbeat = Heartbeat(HeartbeatConfig(min_interval=1, max_interval=8, backoff=2))
+    heartbeat.record_activity()
+    heartbeat.should_probe()
+
+    heartbeat.reset()
+
+    assert heartbeat.interval == 1
+    assert heartbeat.last_activity == 0
@@ -1,8 +1,10 @@
+import asyncio
 from collections.abc import Generator
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from src.level_6.heartbeat import HeartbeatConfig
 from src.level_6.interface import ServerInterface
 from src.level_6.session import Session
 
@@ -70,3 +72,112 @@ def test_start_not_connected(mock_sleep: MagicMock, mock_interface_class: MagicM
 
 
 # --8<-- [end:without_side_effect]
+
+
+def test_start_heartbeat_stops_on_failed_probe(mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.is_server_connected.side_effect = [True, False]
+    mock_interface_class.return_value = mock_interface
+    session = Session(HeartbeatConfig(min_interval=0.001, max_interval=0.001))
+    session.connected = True
+    session.connect = MagicMock()
+
+    session.start()
+
+    mock_interface.add_disconnect_callback.assert_called_once_with(session.disconnected.set)
+    mock_interface.remove_disconnect_callback.assert_called_once_with(session.disconnected.set)
+    assert mock_interface.is_server_connected.call_count == 2
+
+    assert not session.connected
+
+
+def test_start_heartbeat_stops_on_disconnect_callback(mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.add_disconnect_callback.side_effect = lambda callback: callback()
+    mock_interface_class.return_value = mock_interface
+    session = Session(HeartbeatConfig(min_interval=60, max_interval=60))
+    session.connected = True
+    session.connect = MagicMock()
+
+    session.start()
+
+    mock_interface.is_server_connected.assert_not_called()
+
+    assert not session.connected
+
+
+def test_start_heartbeat_skips_probe_after_activity(mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.is_server_connected.return_value = False
+    mock_interface_class.return_value = mock_interface
+    session = Session(HeartbeatConfig(min_interval=0.001, max_interval=0.001))
+    session.connected = True
+    session.connect = MagicMock()
+    session.record_activity()
+
+    session.start()
+
+    mock_interface.is_server_connected.assert_called_once()
+
+
+def test_start_poll_clears_connected(mock_sleep: MagicMock, mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.connect_to_server.return_value = True
+    mock_interface.is_server_connected.side_effect = [True, False]
+    mock_interface_class.return_value = mock_interface
+    session = Session()
+
+    session.start()
+
+    mock_sleep.assert_called_once_with(1)
+
+    assert not session.connected
+
+
+def test_start_heartbeat_resets_interval(mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.add_disconnect_callback.side_effect = lambda callback: callback()
+    mock_interface_class.return_value = mock_interface
+    session = Session(HeartbeatConfig(min_interval=1, max_interval=8))
+    session.connected = True
+    session.connect = MagicMock()
+    session.heartbeat.interval = 8
+
+    session.start()
+
+    assert session.heartbeat.interval == 1
+
+
+@pytest.mark.asyncio
+async def test_astart_stops_on_disconnect_callback(mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.add_disconnect_callback.side_effect = lambda callback: callback()
+    mock_interface_class.return_value = mock_interface
+    session = Session()
+    session.connected = True
+    session.connect = MagicMock()
+
+    await session.astart()
+
+    mock_interface.is_server_connected.assert_not_called()
+    mock_interface.remove_disconnect_callback.assert_called_once()
+
+    assert not session.connected
+
+
+@pytest.mark.asyncio
+async def test_astart_cancel(mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.is_server_connected.return_value = True
+    mock_interface_class.return_value = mock_interface
+    session = Session(HeartbeatConfig(min_interval=0.001, max_interval=0.001))
+    session.connected = True
+    session.connect = MagicMock()
+    task = asyncio.create_task(session.astart())
+    await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    mock_interface.remove_disconnect_callback.assert_called_once()
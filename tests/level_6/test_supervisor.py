@@ -0,0 +1,142 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.level_6.interface import ServerInterface
+from src.level_6.session import Session
+from src.level_6.supervisor import SessionSupervisor
+
+
+def make_mock_session() -> MagicMock:
+    session = MagicMock(spec=Session)
+    session.interface = MagicMock(spec_set=ServerInterface)
+    session.heartbeat = None
+    session.connected = True
+    return session
+
+
+@pytest.fixture
+def mock_session() -> MagicMock:
+    return make_mock_session()
+
+
+def test_session_supervisor_add_registers_disconnect_callback(mock_session: MagicMock) -> None:
+    supervisor = SessionSupervisor()
+
+    supervisor.add(mock_session)
+    supervisor.add(mock_session)
+
+    mock_session.interface.add_disconnect_callback.assert_called_once()
+
+    assert len(supervisor) == 1
+
+
+def test_session_supervisor_remove(mock_session: MagicMock) -> None:
+    supervisor = SessionSupervisor(interval=0)
+    supervisor.add(mock_session)
+
+    removed = supervisor.remove(mock_session)
+    next_check = supervisor.run_pending()
+
+    mock_session.interface.remove_disconnect_callback.assert_called_once()
+    mock_session.interface.is_server_connected.assert_not_called()
+
+    assert removed is True
+    assert supervisor.remove(mock_session) is False
+    assert next_check is None
+
+
+def test_session_supervisor_run_pending_reschedules_connected(mock_session: MagicMock) -> None:
+    supervisor = SessionSupervisor(interval=0)
+    supervisor.add(mock_session)
+    supervisor.interval = 60
+    mock_session.interface.is_server_connected.return_value = True
+
+    next_check = supervisor.run_pending()
+
+    mock_session.interface.is_server_connected.assert_called_once()
+
+    assert next_check is not None
+    assert len(supervisor) == 1
+
+
+def test_session_supervisor_run_pending_reports_disconnect(mock_session: MagicMock) -> None:
+    on_disconnect = MagicMock()
+    supervisor = SessionSupervisor(interval=0, on_disconnect=on_disconnect)
+    supervisor.add(mock_session)
+    mock_session.interface.is_server_connected.side_effect = ConnectionError
+
+    next_check = supervisor.run_pending()
+
+    on_disconnect.assert_called_once_with(mock_session)
+    mock_session.interface.remove_disconnect_callback.assert_called_once()
+
+    assert next_check is None
+    assert mock_session.connected is False
+    assert len(supervisor) == 0
+
+
+def test_session_supervisor_run_pending_survives_failing_probe(mock_session: MagicMock) -> None:
+    on_disconnect = MagicMock()
+    supervisor = SessionSupervisor(interval=0, on_disconnect=on_disconnect)
+    mock_session.interface.is_server_connected.side_effect = RuntimeError("probe failed")
+    other_session = make_mock_session()
+    other_session.interface.is_server_connected.return_value = True
+    supervisor.add(mock_session)
+    supervisor.add(other_session)
+    supervisor.interval = 60
+
+    next_check = supervisor.run_pending()
+
+    on_disconnect.assert_called_once_with(mock_session)
+    other_session.interface.is_server_connected.assert_called_once()
+
+    assert next_check is not None
+    assert mock_session.connected is False
+    assert len(supervisor) == 1
+
+
+def test_session_supervisor_run_pending_survives_failing_on_disconnect(mock_session: MagicMock) -> None:
+    supervisor = SessionSupervisor(interval=0, on_disconnect=MagicMock(side_effect=RuntimeError("callback failed")))
+    mock_session.interface.is_server_connected.return_value = False
+    other_session = make_mock_session()
+    other_session.interface.is_server_connected.return_value = False
+    supervisor.add(mock_session)
+    supervisor.add(other_session)
+
+    next_check = supervisor.run_pending()
+
+    assert next_check is None
+    assert mock_session.connected is False
+    assert other_session.connected is False
+    assert len(supervisor) == 0
+
+
+def test_session_supervisor_disconnect_callback(mock_session: MagicMock) -> None:
+    on_disconnect = MagicMock()
+    supervisor = SessionSupervisor(on_disconnect=on_disconnect)
+    supervisor.add(mock_session)
+    callback = mock_session.interface.add_disconnect_callback.call_args.args[0]
+
+    callback()
+    callback()
+
+    on_disconnect.assert_called_once_with(mock_session)
+
+    assert len(supervisor) == 0
+
+
+def test_session_supervisor_start_checks_sessions_added_at_runtime(mock_session: MagicMock) -> None:
+    disconnected = threading.Event()
+    supervisor = SessionSupervisor(interval=0.01, on_disconnect=lambda _: disconnected.set())
+    mock_session.interface.is_server_connected.return_value = False
+    supervisor.start()
+
+    supervisor.add(mock_session)
+    reported = disconnected.wait(timeout=5)
+    supervisor.stop()
+
+    mock_session.interface.is_server_connected.assert_called_once()
+
+    assert reported is True
@@ -0,0 +1,95 @@
+import threading
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from src.level_7.batching import BatchConfig, MessageBatcher, message_size
+
+
+@pytest.fixture
+def mock_send_batch() -> MagicMock:
+    return MagicMock()
+
+
+def test_message_size() -> None:
+    assert message_size("Hello") == 5
+    assert message_size("héllo") == 6
+
+
+def test_message_batcher_invalid_config(mock_send_batch: MagicMock) -> None:
+    with pytest.raises(ValueError, match="must be at least 1"):
+        MessageBatcher(mock_send_batch, BatchConfig(max_count=0))
+
+
+def test_message_batcher_add_flushes_on_max_count(mock_send_batch: MagicMock) -> None:
+    batcher = MessageBatcher(mock_send_batch, BatchConfig(max_count=2, max_linger=60))
+
+    batcher.add("a")
+    batcher.add("b")
+    batcher.add("c")
+
+    mock_send_batch.assert_called_once_with(["a", "b"])
+
+    assert batcher.pending == 1
+
+
+def test_message_batcher_add_flushes_on_max_bytes(mock_send_batch: MagicMock) -> None:
+    batcher = MessageBatcher(mock_send_batch, BatchConfig(max_bytes=5, max_linger=60))
+
+    batcher.add("abc")
+    batcher.add("def")
+    batcher.add("ghijkl")
+
+    mock_send_batch.assert_has_calls([call(["abc"]), call(["def"]), call(["ghijkl"])])
+
+    assert batcher.pending == 0
+
+
+def test_message_batcher_extend_without_linger_flushes(mock_send_batch: MagicMock) -> None:
+    batcher = MessageBatcher(mock_send_batch, BatchConfig())
+
+    batcher.extend(["a", "b"])
+
+    mock_send_batch.assert_called_once_with(["a", "b"])
+
+    assert batcher.batches_sent == 1
+    assert batcher.messages_sent == 2
+
+
+def test_message_batcher_add_flushes_after_linger() -> None:
+    flushed = threading.Event()
+    mock_send_batch = MagicMock(side_effect=lambda _: flushed.set())
+    batcher = MessageBatcher(mock_send_batch, BatchConfig(max_linger=0.01))
+
+    batcher.add("a")
+    flushed.wait(timeout=5)
+
+    mock_send_batch.assert_called_once_with(["a"])
+
+    assert batcher.pending == 0
+
+
+def test_message_batcher_linger_flush_failure_raised_on_next_flush() -> None:
+    attempted = threading.Event()
+
+    def send_batch(batch: list[str]) -> None:
+        if not attempted.is_set():
+            attempted.set()
+            msg = "Interface down"
+            raise ConnectionError(msg)
+
+    mock_send_batch = MagicMock(side_effect=send_batch)
+    batcher = MessageBatcher(mock_send_batch, BatchConfig(max_linger=0.01))
+    batcher.add("a")
+    attempted.wait(timeout=5)
+
+    with pytest.raises(ConnectionError, match="Interface down"):
+        batcher.flush()
+    pending = batcher.pending
+    batcher.close()
+
+    mock_send_batch.assert_has_calls([call(["a"]), call(["a"])])
+
+    assert pending == 1
+    assert batcher.pending == 0
+    assert batcher.messages_sent == 1
@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.level_7.dedup import DedupCache, fingerprint
+
+
+def test_fingerprint() -> None:
+    assert fingerprint("hello") == fingerprint("hello")
+    assert fingerprint("hello") != fingerprint("hello!")
+    assert len(fingerprint("x" * 10_000)) == 16
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [({"max_size": 0}, "max_size must be at least 1"), ({"window": 0}, "window must be positive")],
+)
+def test_dedup_cache_invalid(kwargs: dict[str, float], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        DedupCache(**kwargs)
+
+
+def test_dedup_cache_seen() -> None:
+    cache = DedupCache()
+
+    seen = [cache.seen(message) for message in ["a", "b", "a", "a"]]
+
+    assert seen == [False, False, True, True]
+    assert cache.hits == 2
+    assert cache.misses == 2
+    assert len(cache) == 2
+
+
+def test_dedup_cache_evicts_oldest_when_full() -> None:
+    cache = DedupCache(max_size=2)
+
+    seen = [cache.seen(message) for message in ["a", "b", "c", "a"]]
+
+    assert seen == [False, False, False, False]
+    assert cache.evictions == 2
+    assert len(cache) == 2
+
+
+@patch("src.level_7.dedup.time.monotonic")
+def test_dedup_cache_expires_after_window(mock_monotonic: MagicMock) -> None:
+    cache = DedupCache(window=10)
+    mock_monotonic.return_value = 100
+    cache.seen("a")
+    mock_monotonic.return_value = 105
+    cache.seen("b")
+
+    mock_monotonic.return_value = 109
+    duplicate = cache.seen("a")
+    mock_monotonic.return_value = 111
+    expired = cache.seen("a")
+
+    assert mock_monotonic.call_count == 4
+
+    assert duplicate is True
+    assert expired is False
+    assert cache.expirations == 1
+    assert len(cache) == 2
+
+
+def test_dedup_cache_filter() -> None:
+    cache = DedupCache()
+
+    messages = list(cache.filter(["a", "b", "a", "c", "b"]))
+
+    assert messages == ["a", "b", "c"]
+
+
+def test_dedup_cache_forget() -> None:
+    cache = DedupCache()
+    cache.seen("a")
+    cache.seen("b")
+
+    cache.forget(["a", "unknown"])
+
+    assert not cache.seen("a")
+    assert cache.seen("b")
+
+
+def test_dedup_cache_clear() -> None:
+    cache = DedupCache()
+    cache.seen("a")
+
+    cache.clear()
+
+    assert not cache.seen("a")
@@ -0,0 +1,67 @@
+import array
+import zlib
+
+import pytest
+
+from src.level_7.framing import FLAG_COMPRESSED, HEADER, FrameWriter, read_frames
+
+
+def test_frame_writer_write() -> None:
+    writer = FrameWriter(capacity=64)
+
+    writer.write(b"Hello")
+    writer.write(memoryview(b"World"))
+
+    assert bytes(writer.getbuffer()) == HEADER.pack(5, 0) + b"Hello" + HEADER.pack(5, 0) + b"World"
+
+
+def test_frame_writer_write_typed_buffer() -> None:
+    writer = FrameWriter(capacity=64)
+    payload = array.array("d", [1.5])
+
+    writer.write(payload)
+
+    assert [bytes(frame) for frame in read_frames(writer.getbuffer())] == [payload.tobytes()]
+
+
+def test_frame_writer_write_grows_buffer() -> None:
+    writer = FrameWriter(capacity=8)
+
+    writer.write(b"x" * 20)
+
+    assert writer.capacity >= 20 + HEADER.size
+    assert [bytes(frame) for frame in read_frames(writer.getbuffer())] == [b"x" * 20]
+
+
+def test_frame_writer_fits() -> None:
+    writer = FrameWriter(capacity=10)
+
+    assert writer.fits(b"x" * 5)
+    assert not writer.fits(b"x" * 6)
+
+
+def test_frame_writer_clear_reuses_buffer() -> None:
+    writer = FrameWriter(capacity=64)
+    writer.write(b"Hello")
+
+    writer.clear()
+    writer.write(b"World")
+
+    assert writer.capacity == 64
+    assert [bytes(frame) for frame in read_frames(writer.getbuffer())] == [b"World"]
+
+
+def test_frame_writer_getbuffer_compressed() -> None:
+    writer = FrameWriter(capacity=1024, compress=zlib.compress, compress_threshold=100)
+    for _ in range(20):
+        writer.write(b"Hello, World")
+
+    data = writer.getbuffer()
+
+    assert HEADER.unpack_from(data)[1] == FLAG_COMPRESSED
+    assert [bytes(frame) for frame in read_frames(data, zlib.decompress)] == [b"Hello, World"] * 20
+
+
+def test_read_frames_compressed_without_decompressor() -> None:
+    with pytest.raises(ValueError, match="without a decompressor"):
+        list(read_frames(HEADER.pack(0, FLAG_COMPRESSED)))
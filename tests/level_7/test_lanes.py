@@ -0,0 +1,131 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.level_7.lanes import LaneDispatcher
+
+
+def conversation(message: str) -> str:
+    return message.split(":")[0]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [({"lanes": 0}, "lanes must be at least 1"), ({"max_depth": 0}, "max_depth must be at least 1")],
+)
+def test_lane_dispatcher_invalid(kwargs: dict[str, int], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        LaneDispatcher(MagicMock(), conversation, **kwargs)
+
+
+def test_lane_dispatcher_keeps_order_within_key() -> None:
+    sent: dict[str, list[str]] = {}
+    lock = threading.Lock()
+
+    def send(message: str) -> None:
+        time.sleep(0.0001)
+        with lock:
+            sent.setdefault(conversation(message), []).append(message)
+
+    messages = [f"{key}:{index}" for index in range(50) for key in "abcdef"]
+
+    with LaneDispatcher(send, conversation, lanes=4) as dispatcher:
+        dispatcher.submit_many(messages)
+
+    assert sent == {key: [f"{key}:{index}" for index in range(50)] for key in "abcdef"}
+    assert sum(lane.sent for lane in dispatcher.stats()) == 300
+
+
+def test_lane_dispatcher_sends_lanes_in_parallel() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    # One message per lane: neither send can return until the other one has started. Integers hash to themselves,
+    # so the keys 0 and 1 land on different lanes.
+    with LaneDispatcher(lambda _: barrier.wait(), int, lanes=2) as dispatcher:
+        dispatcher.submit_many(["0", "1"])
+
+    assert [lane.sent for lane in dispatcher.stats()] == [1, 1]
+
+
+def test_lane_dispatcher_flush_and_stats() -> None:
+    release = threading.Event()
+    dispatcher = LaneDispatcher(lambda _: release.wait(), conversation, lanes=1)
+    dispatcher.submit_many(["a:1", "a:2", "a:3"])
+
+    depth = dispatcher.stats()[0].depth
+    release.set()
+    dispatcher.flush()
+    stats = dispatcher.stats()[0]
+    dispatcher.close()
+
+    assert depth == 3
+    assert stats.depth == 0
+    assert stats.max_depth == 3
+    assert stats.sent == 3
+
+
+def test_lane_dispatcher_max_depth_blocks_submit() -> None:
+    release = threading.Event()
+    dispatcher = LaneDispatcher(lambda _: release.wait(), conversation, lanes=1, max_depth=1)
+    dispatcher.submit("a:1")
+    producer = threading.Thread(target=dispatcher.submit, args=("a:2",))
+    producer.start()
+
+    producer.join(timeout=0.05)
+    blocked = producer.is_alive()
+    release.set()
+    producer.join()
+    dispatcher.close()
+
+    assert blocked
+    assert dispatcher.stats()[0].sent == 2
+    assert dispatcher.stats()[0].max_depth == 1
+
+
+def test_lane_dispatcher_close_wakes_blocked_submit() -> None:
+    release = threading.Event()
+    dispatcher = LaneDispatcher(lambda _: release.wait(), conversation, lanes=1, max_depth=1)
+    dispatcher.submit("a:1")
+    errors: list[Exception] = []
+
+    def submit() -> None:
+        try:
+            dispatcher.submit("a:2")
+        except RuntimeError as e:
+            errors.append(e)
+
+    producer = threading.Thread(target=submit)
+    producer.start()
+    closer = threading.Thread(target=dispatcher.close)
+    closer.start()
+
+    producer.join(timeout=5)
+    release.set()
+    closer.join()
+
+    assert not producer.is_alive()
+    assert [str(e) for e in errors] == ["Cannot submit to a closed dispatcher"]
+    assert dispatcher.stats()[0].sent == 1
+
+
+def test_lane_dispatcher_records_failures() -> None:
+    mock_send = MagicMock(side_effect=[None, ConnectionError("Failed to send"), None])
+
+    with LaneDispatcher(mock_send, conversation, lanes=1) as dispatcher:
+        dispatcher.submit_many(["a:1", "a:2", "a:3"])
+
+    assert mock_send.call_count == 3
+
+    assert dispatcher.stats()[0].sent == 2
+    assert dispatcher.stats()[0].failed == 1
+    assert dispatcher.errors[0][0] == "a:2"
+
+
+def test_lane_dispatcher_submit_after_close() -> None:
+    dispatcher = LaneDispatcher(MagicMock(), conversation)
+    dispatcher.close()
+
+    with pytest.raises(RuntimeError, match="closed dispatcher"):
+        dispatcher.submit("a:1")
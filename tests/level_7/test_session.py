@@ -1,7 +1,11 @@
+import zlib
 from unittest.mock import MagicMock, call
 
 import pytest
 
+from src.level_7.batching import BatchConfig
+from src.level_7.dedup import DedupCache
+from src.level_7.framing import FLAG_COMPRESSED, HEADER, FrameWriter, read_frames
 from src.level_7.interface import ServerInterface
 from src.level_7.session import Session
 
@@ -46,3 +50,151 @@ def test_send_messages_multiple_messages(mock_interface: MagicMock) -> None:
 
 
 # --8<-- [end:multiple_calls_with_arguments]
+
+
+def test_send_messages_batched(mock_interface: MagicMock) -> None:
+    session = Session(mock_interface, BatchConfig(max_count=2))
+
+    session.send_messages(["Hello, World", "Hello, Universe", "Hello, Multiverse"])
+
+    mock_interface.send_message.assert_not_called()
+    mock_interface.send_messages_batch.assert_has_calls(
+        [
+            call(["Hello, World", "Hello, Universe"]),
+            call(["Hello, Multiverse"]),
+        ]
+    )
+
+
+def test_send_messages_batched_with_linger_waits_for_flush(mock_interface: MagicMock) -> None:
+    session = Session(mock_interface, BatchConfig(max_linger=60))
+
+    session.send_messages(["Hello, World"])
+    mock_interface.send_messages_batch.assert_not_called()
+    session.flush()
+
+    mock_interface.send_messages_batch.assert_called_once_with(["Hello, World"])
+
+
+def test_send_batch_without_batch_support() -> None:
+    mock_interface = MagicMock(spec_set=["send_message"])
+    session = Session(mock_interface)
+
+    session.send_batch(["Hello, World", "Hello, Universe"])
+
+    mock_interface.send_message.assert_has_calls(
+        [
+            call("Hello, World"),
+            call("Hello, Universe"),
+        ]
+    )
+
+
+def test_send_messages_generator(mock_interface: MagicMock) -> None:
+    session = Session(mock_interface)
+
+    session.send_messages(f"Hello, {name}" for name in ["World", "Universe"])
+
+    mock_interface.send_message.assert_has_calls([call("Hello, World"), call("Hello, Universe")])
+
+
+def test_stream_messages(mock_interface: MagicMock) -> None:
+    mock_interface.send_message.side_effect = [None, ConnectionError("Failed to send message")]
+    session = Session(mock_interface)
+
+    results = list(session.stream_messages(["Hello, World", "Hello, Universe"]))
+
+    assert mock_interface.send_message.call_count == 2
+
+    assert [result.ok for result in results] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_astream_messages(mock_interface: MagicMock) -> None:
+    session = Session(mock_interface)
+
+    results = [result async for result in session.astream_messages(["Hello, World", "Hello, Universe"], window=2)]
+
+    assert mock_interface.send_message.call_count == 2
+
+    assert all(result.ok for result in results)
+
+
+def test_send_payloads(mock_interface: MagicMock) -> None:
+    sent: list[bytes] = []
+    mock_interface.send_bytes.side_effect = lambda data: sent.append(bytes(data))
+    session = Session(mock_interface, frame_writer=FrameWriter(capacity=2 * HEADER.size + 10))
+
+    session.send_payloads([b"Hello", b"World", b"Again"])
+
+    assert mock_interface.send_bytes.call_count == 2
+
+    assert [[bytes(frame) for frame in read_frames(data)] for data in sent] == [[b"Hello", b"World"], [b"Again"]]
+
+
+def test_send_payloads_compressed(mock_interface: MagicMock) -> None:
+    sent: list[bytes] = []
+    mock_interface.send_bytes.side_effect = lambda data: sent.append(bytes(data))
+    frame_writer = FrameWriter(capacity=1024, compress=zlib.compress, compress_threshold=100)
+    session = Session(mock_interface, frame_writer=frame_writer)
+
+    session.send_payloads([b"Hello, World"] * 20)
+
+    mock_interface.send_bytes.assert_called_once()
+
+    assert session.frame_writer is frame_writer
+    assert HEADER.unpack_from(sent[0])[1] == FLAG_COMPRESSED
+    assert [bytes(frame) for frame in read_frames(sent[0], zlib.decompress)] == [b"Hello, World"] * 20
+
+
+def test_lane_dispatcher_sends_through_interface(mock_interface: MagicMock) -> None:
+    session = Session(mock_interface)
+
+    with session.lane_dispatcher(lambda message: message[0], lanes=2) as dispatcher:
+        dispatcher.submit_many(["a1", "b1", "a2"])
+
+    assert mock_interface.send_message.call_count == 3
+    assert [c.args[0] for c in mock_interface.send_message.call_args_list if c.args[0][0] == "a"] == ["a1", "a2"]
+
+
+def test_send_messages_drops_duplicates(mock_interface: MagicMock) -> None:
+    session = Session(mock_interface, dedup_cache=DedupCache())
+
+    session.send_messages(["a", "b", "a"])
+    session.send_messages(["b", "c"])
+
+    assert mock_interface.send_message.call_args_list == [call("a"), call("b"), call("c")]
+
+
+def test_send_messages_retries_failed_send(mock_interface: MagicMock) -> None:
+    session = Session(mock_interface, dedup_cache=DedupCache())
+    mock_interface.send_message.side_effect = [None, ConnectionError("Failed to send"), None, None]
+
+    with pytest.raises(ConnectionError, match="Failed to send"):
+        session.send_messages(["a", "b", "c"])
+    session.send_messages(["a", "b", "c"])
+
+    assert mock_interface.send_message.call_args_list == [call("a"), call("b"), call("b"), call("c")]
+
+
+def test_send_messages_batched_retries_failed_batch(mock_interface: MagicMock) -> None:
+    session = Session(mock_interface, BatchConfig(max_count=2), DedupCache())
+    mock_interface.send_messages_batch.side_effect = [ConnectionError("Failed to send"), None]
+
+    with pytest.raises(ConnectionError, match="Failed to send"):
+        session.send_messages(["a", "b"])
+    session.send_messages(["a", "b"])
+
+    assert mock_interface.send_messages_batch.call_args_list == [call(["a", "b"]), call(["a", "b"])]
+
+
+def test_send_batch_without_batch_support_forgets_unsent_messages() -> None:
+    mock_interface = MagicMock(spec_set=["send_message"])
+    mock_interface.send_message.side_effect = [None, ConnectionError("Failed to send"), None, None]
+    dedup_cache = DedupCache()
+    session = Session(mock_interface, dedup_cache=dedup_cache)
+
+    with pytest.raises(ConnectionError, match="Failed to send"):
+        session.send_batch(list(dedup_cache.filter(["a", "b", "c"])))
+
+    assert list(dedup_cache.filter(["a", "b", "c"])) == ["b", "c"]
@@ -0,0 +1,118 @@
+import threading
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from src.level_7.streaming import SendResult, astream_send, send_one, stream_send
+
+SEND_ERROR = ConnectionError("Failed to send message")
+
+
+@pytest.fixture
+def mock_send() -> MagicMock:
+    return MagicMock()
+
+
+def test_send_one_success(mock_send: MagicMock) -> None:
+    result = send_one(mock_send, 3, "Hello, World")
+
+    mock_send.assert_called_once_with("Hello, World")
+
+    assert result == SendResult(3, "Hello, World")
+    assert result.ok
+
+
+def test_send_one_failure(mock_send: MagicMock) -> None:
+    mock_send.side_effect = SEND_ERROR
+
+    result = send_one(mock_send, 0, "Hello, World")
+
+    assert result.error is SEND_ERROR
+    assert not result.ok
+
+
+def test_stream_send_is_lazy(mock_send: MagicMock) -> None:
+    pulled: list[int] = []
+
+    def messages() -> Iterator[str]:
+        for i in range(1000):
+            pulled.append(i)
+            yield f"message {i}"
+
+    stream = stream_send(mock_send, messages())
+    first = next(stream)
+
+    mock_send.assert_called_once_with("message 0")
+
+    assert first.index == 0
+    assert pulled == [0]
+
+
+def test_stream_send_reports_failures(mock_send: MagicMock) -> None:
+    mock_send.side_effect = [None, SEND_ERROR, None]
+
+    results = list(stream_send(mock_send, ["a", "b", "c"]))
+
+    mock_send.assert_has_calls([call("a"), call("b"), call("c")])
+
+    assert [result.ok for result in results] == [True, False, True]
+
+
+def test_stream_send_bounded_window() -> None:
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def send(_: str) -> None:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        with lock:
+            in_flight -= 1
+
+    results = list(stream_send(send, (f"message {i}" for i in range(100)), window=4))
+
+    assert [result.index for result in results] == list(range(100))
+    assert max_in_flight <= 4
+
+
+def test_stream_send_invalid_window(mock_send: MagicMock) -> None:
+    with pytest.raises(ValueError, match="window must be at least 1"):
+        next(stream_send(mock_send, ["a"], window=0))
+
+
+@pytest.mark.asyncio
+async def test_astream_send_async_iterable(mock_send: MagicMock) -> None:
+    async def messages() -> AsyncIterator[str]:
+        for i in range(10):
+            yield f"message {i}"
+
+    results = [result async for result in astream_send(mock_send, messages(), window=3)]
+
+    assert mock_send.call_count == 10
+
+    assert [result.index for result in results] == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_astream_send_iterable(mock_send: MagicMock) -> None:
+    mock_send.side_effect = [SEND_ERROR, None]
+
+    results = [result async for result in astream_send(mock_send, ["a", "b"])]
+
+    assert [result.ok for result in results] == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_astream_send_window_runs_concurrently() -> None:
+    # More sends than the default executor has threads must all be in flight at once to pass the barrier
+    barrier = threading.Barrier(40, timeout=5)
+
+    def send(_: str) -> None:
+        barrier.wait()
+
+    results = [result async for result in astream_send(send, [f"message {i}" for i in range(40)], window=40)]
+
+    assert all(result.ok for result in results)
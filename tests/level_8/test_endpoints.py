@@ -0,0 +1,137 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.level_8.endpoints import MAX_ATTEMPT_THREADS, connect_first
+from src.level_8.interface import ServerInterface
+
+
+def make_interface(connected: bool = True, delay: float = 0.0) -> MagicMock:
+    def connect_to_server() -> bool:
+        time.sleep(delay)
+        return connected
+
+    interface = MagicMock(spec_set=ServerInterface)
+    interface.connect_to_server.side_effect = connect_to_server
+    return interface
+
+
+def test_connect_first_invalid_stagger() -> None:
+    with pytest.raises(ValueError, match="stagger must not be negative"):
+        connect_first([make_interface()], stagger=-1)
+
+
+def test_connect_first_invalid_timeout() -> None:
+    with pytest.raises(ValueError, match="timeout must not be negative"):
+        connect_first([make_interface()], timeout=-1)
+
+
+def test_connect_first_no_interfaces() -> None:
+    assert connect_first([]) is None
+
+
+def test_connect_first_returns_first_success() -> None:
+    first = make_interface()
+    second = make_interface()
+
+    winner = connect_first([first, second])
+
+    first.connect_to_server.assert_called_once()
+    second.connect_to_server.assert_not_called()
+
+    assert winner is first
+
+
+def test_connect_first_slow_endpoint_is_overtaken() -> None:
+    slow = make_interface(delay=0.5)
+    fast = make_interface()
+    start = time.monotonic()
+
+    winner = connect_first([slow, fast], stagger=0.01)
+    elapsed = time.monotonic() - start
+
+    fast.connect_to_server.assert_called_once()
+
+    assert winner is fast
+    assert elapsed < 0.5
+
+
+def test_connect_first_disconnects_loser() -> None:
+    disconnected = threading.Event()
+    slow = make_interface(delay=0.05)
+    slow.disconnect.side_effect = lambda: disconnected.set()
+    fast = make_interface()
+
+    winner = connect_first([slow, fast], stagger=0)
+    slow_closed = disconnected.wait(timeout=5)
+
+    fast.disconnect.assert_not_called()
+
+    assert winner is fast
+    assert slow_closed is True
+
+
+def test_connect_first_bounds_attempt_threads() -> None:
+    for _ in range(2 * MAX_ATTEMPT_THREADS):
+        winner = connect_first([make_interface(delay=0.1), make_interface()], stagger=0)
+
+        assert winner is not None
+
+    threads = [thread for thread in threading.enumerate() if thread.name.startswith("connect_first")]
+
+    assert len(threads) <= MAX_ATTEMPT_THREADS
+
+
+def test_connect_first_failure_starts_next_attempt() -> None:
+    failing = make_interface(connected=False)
+    working = make_interface()
+    start = time.monotonic()
+
+    winner = connect_first([failing, working], stagger=5)
+    elapsed = time.monotonic() - start
+
+    assert winner is working
+    assert elapsed < 5
+
+
+def test_connect_first_all_fail() -> None:
+    first = make_interface(connected=False)
+    second = MagicMock(spec_set=ServerInterface)
+    second.connect_to_server.side_effect = ConnectionError
+
+    winner = connect_first([first, second], stagger=0)
+
+    first.connect_to_server.assert_called_once()
+    second.connect_to_server.assert_called_once()
+
+    assert winner is None
+
+
+def test_connect_first_reraises_unexpected_error() -> None:
+    interface = MagicMock(spec_set=ServerInterface)
+    interface.connect_to_server.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        connect_first([interface])
+
+
+def test_connect_first_times_out_when_pool_is_saturated() -> None:
+    released = threading.Event()
+    hung = [make_interface() for _ in range(2)]
+    for interface in hung:
+        interface.connect_to_server.side_effect = released.wait
+    queued = make_interface()
+    start = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=2) as executor, patch("src.level_8.endpoints._executor", executor):
+        winner = connect_first([*hung, queued], stagger=0, timeout=0.1)
+        elapsed = time.monotonic() - start
+        released.set()
+
+    queued.connect_to_server.assert_not_called()
+
+    assert winner is None
+    assert elapsed < 5
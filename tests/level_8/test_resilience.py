@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock, patch
+
+from src.level_8.resilience import CircuitBreaker, CircuitState, RetryPolicy
+
+
+@patch("src.level_8.resilience.random.uniform")
+def test_retry_policy_backoff(mock_uniform: MagicMock) -> None:
+    mock_uniform.return_value = 0.5
+    policy = RetryPolicy(base_delay=1, max_delay=3)
+
+    delay = policy.backoff(4)
+
+    mock_uniform.assert_called_once_with(0, 3)
+
+    assert delay == 0.5
+
+
+def test_circuit_breaker_opens_after_threshold() -> None:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_circuit_breaker_half_opens_after_reset_timeout() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    allowed = [breaker.allow_request(), breaker.allow_request()]
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert allowed == [True, False]
+
+
+def test_circuit_breaker_closes_on_success() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    breaker.allow_request()
+
+    breaker.record_success()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_circuit_breaker_reopens_on_half_open_failure() -> None:
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+    breaker.record_failure()
+    breaker._state = CircuitState.HALF_OPEN  # noqa: SLF001
+
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 
 from src.level_8.interface import ServerInterface
+from src.level_8.resilience import CircuitBreaker, CircuitState, RetryPolicy
 from src.level_8.session import Session, SessionError
 
 
@@ -17,6 +18,12 @@ def mock_interface_class() -> Generator[MagicMock, None, None]:
 # --8<-- [end:mock_interface_class]
 
 
+@pytest.fixture
+def mock_sleep() -> Generator[MagicMock, None, None]:
+    with patch("src.level_8.session.time.sleep") as mock:
+        yield mock
+
+
 # Use side_effect have a mock raise an exception.
 # --8<-- [start:caught_exception]
 def test_connect_interface_exception(mock_interface_class: MagicMock) -> None:
@@ -52,3 +59,145 @@ def test_connect_session_exception(mock_interface_class: MagicMock) -> None:
 
 
 # --8<-- [end:raised_exception]
+
+
+def test_connect_retries_until_success(mock_sleep: MagicMock, mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.connect_to_server.side_effect = [ConnectionError("Failed to connect to server"), False, True]
+    mock_interface_class.return_value = mock_interface
+    session = Session()
+    session.retry_policy = RetryPolicy(max_attempts=5, base_delay=0.01)
+
+    session.connect()
+
+    assert mock_interface.connect_to_server.call_count == 3
+    assert mock_sleep.call_count == 2
+
+    assert session.connected
+
+
+def test_connect_retries_exhausted(mock_sleep: MagicMock, mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.connect_to_server.return_value = False
+    mock_interface_class.return_value = mock_interface
+    session = Session()
+    session.retry_policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+
+    with pytest.raises(SessionError, match="Failed to connect to server"):
+        session.connect()
+
+    assert mock_interface.connect_to_server.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+def test_connect_retries_stop_at_deadline(mock_sleep: MagicMock, mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.connect_to_server.return_value = False
+    mock_interface_class.return_value = mock_interface
+    session = Session()
+    session.ignore_connection_errors = True
+    session.retry_policy = RetryPolicy(max_attempts=5, base_delay=10, max_delay=10, deadline=0)
+
+    session.connect()
+
+    mock_interface.connect_to_server.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_connect_circuit_breaker_open(mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface_class.return_value = mock_interface
+    mock_breaker = MagicMock(spec_set=CircuitBreaker)
+    mock_breaker.allow_request.return_value = False
+    session = Session()
+    session.circuit_breaker = mock_breaker
+
+    with pytest.raises(SessionError, match="Failed to connect to server"):
+        session.connect()
+
+    mock_interface.connect_to_server.assert_not_called()
+
+
+def test_connect_circuit_breaker_records_failure(mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.connect_to_server.side_effect = ConnectionError("Failed to connect to server")
+    mock_interface_class.return_value = mock_interface
+    mock_breaker = MagicMock(spec_set=CircuitBreaker)
+    mock_breaker.allow_request.return_value = True
+    session = Session()
+    session.ignore_connection_errors = True
+    session.circuit_breaker = mock_breaker
+
+    session.connect()
+
+    mock_breaker.record_failure.assert_called_once()
+    mock_breaker.record_success.assert_not_called()
+
+
+def test_connect_circuit_breaker_half_open_probe_raises(mock_interface_class: MagicMock) -> None:
+    mock_interface = Mock(spec_set=ServerInterface)
+    mock_interface.connect_to_server.side_effect = TimeoutError("Probe timed out")
+    mock_interface_class.return_value = mock_interface
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    session = Session()
+    session.circuit_breaker = breaker
+
+    with pytest.raises(TimeoutError, match="Probe timed out"):
+        session.connect()
+    mock_interface.connect_to_server.side_effect = None
+    mock_interface.connect_to_server.return_value = True
+    session.connect()
+
+    assert mock_interface.connect_to_server.call_count == 2
+    assert session.connected
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_connect_endpoints_uses_winner(mock_interface_class: MagicMock) -> None:
+    failing = MagicMock(spec_set=ServerInterface)
+    failing.connect_to_server.return_value = False
+    working = MagicMock(spec_set=ServerInterface)
+    working.connect_to_server.return_value = True
+    mock_interface_class.return_value.connect_to_server.return_value = False
+    session = Session()
+    session.endpoints = [failing, working]
+    session.connect_stagger = 0
+
+    session.connect()
+
+    mock_interface_class.return_value.connect_to_server.assert_called_once()
+    failing.connect_to_server.assert_called_once()
+
+    assert session.connected
+    assert session.interface is working
+
+
+def test_connect_endpoints_interface_wins(mock_interface_class: MagicMock) -> None:
+    mock_interface_class.return_value.connect_to_server.return_value = True
+    endpoint = MagicMock(spec_set=ServerInterface)
+    session = Session()
+    session.endpoints = [endpoint]
+
+    session.connect()
+
+    endpoint.connect_to_server.assert_not_called()
+
+    assert session.interface is mock_interface_class.return_value
+
+
+def test_connect_endpoints_all_fail(mock_interface_class: MagicMock) -> None:
+    failing = MagicMock(spec_set=ServerInterface)
+    failing.connect_to_server.side_effect = ConnectionError
+    mock_interface_class.return_value.connect_to_server.return_value = False
+    session = Session()
+    session.endpoints = [failing, failing]
+    session.connect_stagger = 0
+
+    with pytest.raises(SessionError, match="Failed to connect to server"):
+        session.connect()
+
+    mock_interface_class.return_value.connect_to_server.assert_called_once()
+
+    assert failing.connect_to_server.call_count == 2
+    assert not session.connected
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import src.level_4
+
+
+def test_lazy_attributes_loads_submodule_on_access() -> None:
+    code = (
+        "import sys\n"
+        "import src.level_4\n"
+        "assert 'src.level_4.session' not in sys.modules\n"
+        "from src.level_4 import Database\n"
+        "assert 'src.level_4.database' in sys.modules\n"
+        "assert 'src.level_4.session' not in sys.modules\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)  # noqa: S603
+
+
+def test_lazy_attributes_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        _ = src.level_4.Unknown  # type: ignore[attr-defined]
+
+
+def test_lazy_attributes_dir() -> None:
+    assert {"Session", "Database", "ServerInterface"} <= set(dir(src.level_4))
+
+
+def test_lazy_attributes_subpackage() -> None:
+    assert src.level_0.add(2, 3) == 5
@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.pool import ConnectionPool, PoolTimeoutError
+
+
+@pytest.fixture
+def mock_connection_factory() -> MagicMock:
+    return MagicMock(side_effect=lambda: MagicMock(spec=["pool", "last_used", "is_healthy", "close"], last_used=0.0))
+
+
+def test_connection_pool_acquire_reuses_released_connection(mock_connection_factory: MagicMock) -> None:
+    pool = ConnectionPool(mock_connection_factory)
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+
+    mock_connection_factory.assert_called_once()
+
+    assert second is first
+    assert second.pool is pool
+
+
+def test_connection_pool_acquire_timeout(mock_connection_factory: MagicMock) -> None:
+    pool = ConnectionPool(mock_connection_factory, max_size=1, timeout=0.01)
+    pool.acquire()
+
+    with pytest.raises(PoolTimeoutError, match="Timed out waiting for a connection"):
+        pool.acquire()
+
+    mock_connection_factory.assert_called_once()
+
+    assert pool.stats().timeouts == 1
+    assert pool.stats().in_use == 1
+
+
+def test_connection_pool_acquire_discards_unhealthy_connection(mock_connection_factory: MagicMock) -> None:
+    pool = ConnectionPool(mock_connection_factory, health_check_interval=0)
+    unhealthy = pool.acquire()
+    unhealthy.is_healthy.return_value = False
+    pool.release(unhealthy)
+
+    conn = pool.acquire()
+
+    unhealthy.is_healthy.assert_called_once()
+    unhealthy.close.assert_called_once()
+    assert mock_connection_factory.call_count == 2
+
+    assert conn is not unhealthy
+    assert pool.stats().size == 1
+
+
+def test_connection_pool_evict_idle(mock_connection_factory: MagicMock) -> None:
+    pool = ConnectionPool(mock_connection_factory, max_idle_time=0)
+    conn = pool.acquire()
+    pool.release(conn)
+
+    evicted = pool.evict_idle()
+
+    conn.close.assert_called_once()
+
+    assert evicted == 1
+    assert pool.stats().size == 0
+
+
+def test_connection_pool_stats(mock_connection_factory: MagicMock) -> None:
+    pool = ConnectionPool(mock_connection_factory)
+    pool.acquire()
+    pool.release(pool.acquire())
+
+    stats = pool.stats()
+
+    assert stats.size == 2
+    assert stats.idle == 1
+    assert stats.in_use == 1
+    assert stats.waiters == 0
+    assert stats.checkouts == 2
+
+
+def test_connection_pool_release_after_close(mock_connection_factory: MagicMock) -> None:
+    pool = ConnectionPool(mock_connection_factory)
+    conn = pool.acquire()
+    pool.close()
+
+    pool.release(conn)
+
+    conn.close.assert_called_once()
+
+    assert pool.stats().size == 0
+    assert pool.stats().idle == 0
+
+
+def test_connection_pool_acquire_discards_connection_failing_health_check(mock_connection_factory: MagicMock) -> None:
+    pool = ConnectionPool(mock_connection_factory, max_size=1, health_check_interval=0)
+    failing = pool.acquire()
+    failing.is_healthy.side_effect = ConnectionError("probe failed")
+    pool.release(failing)
+
+    conn = pool.acquire(timeout=0.01)
+
+    failing.close.assert_called_once()
+
+    assert conn is not failing
+    assert pool.stats().size == 1
+    assert pool.stats().in_use == 1
+
+
+def test_connection_pool_acquire_interrupted_health_check_frees_slot(mock_connection_factory: MagicMock) -> None:
+    pool = ConnectionPool(mock_connection_factory, max_size=1, health_check_interval=0)
+    conn = pool.acquire()
+    conn.is_healthy.side_effect = KeyboardInterrupt
+    pool.release(conn)
+
+    with pytest.raises(KeyboardInterrupt):
+        pool.acquire()
+
+    assert pool.stats().size == 0
+    assert pool.stats().in_use == 0
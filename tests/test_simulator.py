@@ -0,0 +1,179 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.level_4.session import Session as Level4Session
+from src.level_5.database import Database as Level5Database
+from src.level_6.session import Session as Level6Session
+from src.simulator import (
+    ServerSimulator,
+    SimulatedConnection,
+    SimulatedInterface,
+    SimulatorConfig,
+    exponential,
+    fixed,
+    lognormal,
+    simulate,
+    uniform,
+)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"failure_rate": 1.5}, "failure_rate must be between 0 and 1"),
+        ({"error_rate": -0.1}, "error_rate must be between 0 and 1"),
+        ({"failure_rate": 0.6, "error_rate": 0.6}, "must not exceed 1"),
+        ({"capacity": 0}, "capacity must be at least 1"),
+    ],
+)
+def test_simulator_config_invalid(kwargs: dict[str, object], match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        SimulatorConfig(**kwargs)
+
+
+def test_latency_distributions() -> None:
+    simulator = ServerSimulator(SimulatorConfig(seed=1))
+    rng = simulator._random  # noqa: SLF001
+
+    samples = [fixed(0.5)(rng), uniform(1, 2)(rng), exponential(0.1)(rng), lognormal(0.1, 0.5)(rng)]
+
+    assert samples[0] == 0.5
+    assert 1 <= samples[1] <= 2
+    assert all(sample > 0 for sample in samples[2:])
+
+
+def test_server_simulator_call_success() -> None:
+    simulator = ServerSimulator()
+
+    ok = simulator.call()
+
+    assert ok
+    assert simulator.stats().calls == 1
+    assert simulator.stats().in_flight == 0
+
+
+def test_server_simulator_call_latency() -> None:
+    simulator = ServerSimulator(SimulatorConfig(latency=fixed(0.02)))
+    start = time.monotonic()
+
+    simulator.call()
+
+    assert time.monotonic() - start >= 0.02
+
+
+def test_server_simulator_call_failure_rate() -> None:
+    simulator = ServerSimulator(SimulatorConfig(failure_rate=0.5, seed=0))
+
+    results = [simulator.call() for _ in range(1000)]
+
+    assert 400 < results.count(False) < 600
+    assert simulator.stats().failures == results.count(False)
+
+
+def test_server_simulator_call_error_rate() -> None:
+    simulator = ServerSimulator(SimulatorConfig(error_rate=1))
+
+    with pytest.raises(ConnectionError, match="Simulated connection error"):
+        simulator.call()
+
+    assert simulator.stats().errors == 1
+    assert simulator.stats().failures == 0
+
+
+def test_server_simulator_call_capacity() -> None:
+    simulator = ServerSimulator(SimulatorConfig(latency=fixed(0.2), capacity=1))
+    thread = threading.Thread(target=simulator.call)
+    thread.start()
+    while not simulator.stats().in_flight:
+        time.sleep(0.001)
+
+    with pytest.raises(ConnectionError, match="Server at capacity"):
+        simulator.call()
+    thread.join()
+
+    assert simulator.stats().rejected == 1
+    assert simulator.stats().max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_server_simulator_acall_runs_concurrently() -> None:
+    simulator = ServerSimulator(SimulatorConfig(latency=fixed(0.05)))
+    start = time.monotonic()
+
+    results = await asyncio.gather(*(simulator.acall() for _ in range(20)))
+
+    assert all(results)
+    assert time.monotonic() - start < 0.5
+    assert simulator.stats().max_in_flight == 20
+
+
+def test_simulated_interface_is_server_connected() -> None:
+    interface = SimulatedInterface(ServerSimulator(SimulatorConfig(disconnect_rate=1)))
+    interface.connect_to_server()
+
+    connected = interface.is_server_connected()
+
+    assert interface.connected is False
+    assert connected is False
+
+
+def test_simulated_interface_drop_calls_disconnect_callbacks() -> None:
+    interface = SimulatedInterface(ServerSimulator())
+    callback = MagicMock()
+    removed = MagicMock()
+    interface.add_disconnect_callback(callback)
+    interface.add_disconnect_callback(removed)
+    interface.remove_disconnect_callback(removed)
+
+    interface.drop()
+
+    callback.assert_called_once()
+    removed.assert_not_called()
+
+
+def test_simulated_interface_send_failure() -> None:
+    interface = SimulatedInterface(ServerSimulator(SimulatorConfig(failure_rate=1)))
+
+    with pytest.raises(ConnectionError, match="Simulated failure sending 5"):
+        interface.send_message("hello")
+
+
+def test_simulated_connection_failure() -> None:
+    conn = SimulatedConnection(ServerSimulator(SimulatorConfig(failure_rate=1)))
+
+    with pytest.raises(ConnectionError, match="Simulated database failure in begin"):
+        conn.begin()
+
+
+def test_simulated_connection_exit_discards_on_error() -> None:
+    conn = SimulatedConnection(ServerSimulator(SimulatorConfig(failure_rate=1)))
+    conn.pool = MagicMock()
+
+    with pytest.raises(ConnectionError), conn:
+        conn.begin()
+
+    conn.pool.discard.assert_called_once_with(conn)
+    conn.pool.release.assert_not_called()
+
+
+def test_simulate_replaces_and_restores_backends() -> None:
+    server = ServerSimulator()
+    database = ServerSimulator()
+    original_pool = Level5Database.pool
+
+    with simulate(server, database):
+        connected = Level4Session().connect()
+        session = Level6Session()
+        pool = Level5Database.pool
+
+    assert connected
+    assert isinstance(session.interface, SimulatedInterface)
+    assert not isinstance(Level6Session().interface, SimulatedInterface)
+    assert pool is not original_pool
+    assert Level5Database.pool is original_pool
+    assert server.stats().calls == 1
+    assert database.stats().calls == 2
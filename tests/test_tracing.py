@@ -0,0 +1,72 @@
+from collections.abc import Generator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.tracing import MetricsTracer, Span, SpanMetrics, Tracer, get_tracer, set_tracer, span
+
+
+@pytest.fixture
+def mock_tracer() -> Generator[MagicMock, None, None]:
+    mock_tracer = MagicMock(spec_set=Tracer)
+    set_tracer(mock_tracer)
+    yield mock_tracer
+    set_tracer(None)
+
+
+def test_span_disabled() -> None:
+    assert get_tracer() is None
+    assert not isinstance(span("send_message"), Span)
+
+
+def test_span_records_duration(mock_tracer: MagicMock) -> None:
+    with span("send_message"):
+        pass
+
+    mock_tracer.record.assert_called_once()
+    name, duration, error = mock_tracer.record.call_args.args
+
+    assert name == "send_message"
+    assert duration >= 0
+    assert error is None
+
+
+def test_span_records_error(mock_tracer: MagicMock) -> None:
+    error = ConnectionError("Failed to connect to server")
+
+    with pytest.raises(ConnectionError), span("connect_to_server"):
+        raise error
+
+    assert mock_tracer.record.call_args.args[2] is error
+
+
+def test_metrics_tracer_record() -> None:
+    tracer = MetricsTracer()
+
+    tracer.record("commit", 0.000003, None)
+    tracer.record("commit", 0.000100, RuntimeError("commit failed"))
+
+    metrics = tracer.snapshot()["commit"]
+
+    assert metrics.count == 2
+    assert metrics.errors == 1
+    assert metrics.buckets[2] == 1
+    assert metrics.buckets[7] == 1
+
+
+def test_metrics_tracer_reset() -> None:
+    tracer = MetricsTracer()
+    tracer.record("commit", 0.000003, None)
+
+    tracer.reset()
+
+    assert tracer.snapshot() == {}
+
+
+def test_span_metrics_percentile() -> None:
+    metrics = SpanMetrics(count=4)
+    metrics.buckets[2] = 3
+    metrics.buckets[7] = 1
+
+    assert metrics.percentile(0.5) == 4e-6
+    assert metrics.percentile(0.99) == 128e-6